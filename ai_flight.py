@@ -0,0 +1,194 @@
+# ai_flight.py
+# Batched flight model for one group of AI gliders: the steering and physics of AIGlider.simulate, run for
+# the whole group at once on NumPy arrays instead of glider by glider.
+# Position, heading, speed and height are read from the sprites at the start of every step (collisions and
+# knockback change them between steps) and written back at the end for rendering. Everything else the flight
+# model needs lives in the engine's arrays while the group stays the same, and is handed back to the sprites
+# when the group changes.
+# Level-of-detail marks (ai_lod.py) are read every step too: gliders between LOD ticks only coast along their
+# heading, and a tick that stands for several frames turns, accelerates and counts down timers for all of them.
+
+import math
+import numpy as np
+import config
+
+_flight_rng = np.random.default_rng()
+
+def _heading_difference(dx, dy, heading):
+    # Degrees to turn from heading to face (dx, dy), in [-180, 180)
+    return (np.degrees(np.arctan2(dy, dx)) - heading + 540.0) % 360.0 - 180.0
+
+class AIFlightEngine:
+    def __init__(self):
+        self.gliders = []
+        self._load([])
+
+    def __len__(self):
+        return len(self.gliders)
+
+    def _gather(self, attribute):
+        return np.fromiter((getattr(glider, attribute) for glider in self.gliders), dtype=np.float64, count=len(self.gliders))
+
+    def _load(self, gliders):
+        self.gliders = list(gliders)
+        gather = self._gather
+        # Per-glider constants
+        self.base_min_speed = gather("base_min_speed")
+        self.base_max_speed = gather("base_max_speed")
+        self.base_target_speed = gather("base_target_speed")
+        self.base_turn_rate = gather("base_turn_rate_scalar")
+        self.speed_factor = gather("speed_factor")
+        self.altitude_offset = gather("altitude_preference_offset")
+        self.muzzle_offset = gather("fuselage_length") / 1.8
+        self.shoot_cooldown_duration = gather("shoot_cooldown_duration")
+        # Wingman slot in the player's frame, before the player's heading is applied
+        offset_angle = gather("wingman_offset_angle")
+        follow_x = gather("wingman_follow_dist_x")
+        follow_y = gather("wingman_follow_dist_y")
+        self.formation_x = follow_x * np.cos(offset_angle) - follow_y * np.sin(offset_angle)
+        self.formation_y = follow_x * np.sin(offset_angle) + follow_y * np.cos(offset_angle)
+        # State only the flight model changes
+        self.target_speed = gather("target_speed")
+        self.target_altitude = gather("target_altitude")
+        self.speed_update_timer = gather("speed_update_timer")
+        self.shoot_cooldown_timer = gather("shoot_cooldown_timer")
+        self.target_marker_index = np.fromiter((glider.current_target_marker_index for glider in self.gliders), dtype=np.intp, count=len(self.gliders))
+        self.laps_completed = np.fromiter((glider.laps_completed for glider in self.gliders), dtype=np.intp, count=len(self.gliders))
+
+    def _store(self):
+        for i, glider in enumerate(self.gliders):
+            glider.target_speed = float(self.target_speed[i])
+            glider.target_altitude = float(self.target_altitude[i])
+            glider.speed_update_timer = int(self.speed_update_timer[i])
+            glider.shoot_cooldown_timer = int(self.shoot_cooldown_timer[i])
+            glider.current_target_marker_index = int(self.target_marker_index[i])
+            glider.laps_completed = int(self.laps_completed[i])
+
+    def sync(self, gliders):
+        # Adopt the group's current members, then pick up where the sprites are now
+        gliders = list(gliders)
+        if gliders != self.gliders:
+            self._store()
+            self._load(gliders)
+        gather = self._gather
+        self.world_x = gather("world_x")
+        self.world_y = gather("world_y")
+        self.heading = gather("heading")
+        self.speed = gather("speed")
+        self.height = gather("height")
+        self.tier = gather("lod_tier")
+        self.elapsed = gather("lod_elapsed") # Frames each glider's tick stands for, 0 while coasting
+        self.due = self.elapsed > 0
+
+    def _write_back(self):
+        for glider, x, y, heading, speed, height in zip(self.gliders, self.world_x.tolist(), self.world_y.tolist(),
+                                                        self.heading.tolist(), self.speed.tolist(), self.height.tolist()):
+            glider.world_x = x
+            glider.world_y = y
+            glider.world_pos.update(x, y)
+            glider.heading = heading
+            glider.speed = speed
+            glider.height = height
+
+    def _catch_up(self, rate):
+        # Share of a gap closed by a tick standing for elapsed frames at rate per frame; nothing while coasting
+        return np.minimum(1.0, rate * self.elapsed)
+
+    def _fly(self, heading_difference, turn_scale=1.0, snap_turn=None):
+        # The part of AIGlider.simulate every mode shares: turn, ease toward the target speed, move.
+        # snap_turn marks gliders that turn all the way onto heading_difference this tick.
+        turn_fraction = self._catch_up(self.base_turn_rate * turn_scale)
+        if snap_turn is not None:
+            turn_fraction = np.where(snap_turn, 1.0, turn_fraction)
+        self.heading = (self.heading + heading_difference * turn_fraction) % 360.0
+        acceleration = config.ACCELERATION * 0.5 * self.elapsed
+        speed = self.speed + np.where(self.speed < self.target_speed, acceleration, np.where(self.speed > self.target_speed, -acceleration, 0.0))
+        self.speed = np.where(self.due, np.clip(speed, self.base_min_speed * 0.7, self.base_max_speed * 1.1), self.speed)
+        np.maximum(self.height, 0.0, out=self.height)
+        heading_rad = np.radians(self.heading)
+        self.world_x = self.world_x + self.speed * np.cos(heading_rad)
+        self.world_y = self.world_y + self.speed * np.sin(heading_rad)
+        self._write_back()
+
+    def _tick_cooldowns(self):
+        np.maximum(self.shoot_cooldown_timer - self.elapsed, 0, out=self.shoot_cooldown_timer)
+
+    def step_race(self, gliders, race_markers_list):
+        # AIGlider.update_race_behavior plus lap counting, for every racer
+        self.sync(gliders)
+        if not self.gliders or not race_markers_list:
+            return
+        self._tick_cooldowns()
+        marker_x = np.array([marker.world_pos.x for marker in race_markers_list])
+        marker_y = np.array([marker.world_pos.y for marker in race_markers_list])
+        marker_radius = np.array([marker.world_radius for marker in race_markers_list])
+        index = self.target_marker_index
+        dx = marker_x[index] - self.world_x
+        dy = marker_y[index] - self.world_y
+        dist_to_marker = np.hypot(dx, dy)
+        heading_difference = _heading_difference(dx, dy, self.heading)
+
+        # Far racers fly AIGlider.follow_course instead of the race behaviour
+        path_following = self.due & (self.tier >= config.AI_LOD_PATH_FOLLOW_TIER)
+        racing = self.due & ~path_following
+        approaching = racing & (dist_to_marker < config.AI_MARKER_APPROACH_SLOWDOWN_DISTANCE)
+        boosting = racing & ~approaching & (dist_to_marker > config.AI_STRAIGHT_BOOST_MIN_DISTANCE) & (np.abs(heading_difference) < config.AI_STRAIGHT_BOOST_THRESHOLD_ANGLE)
+        cruising = racing & ~(approaching | boosting)
+        speed_range = self.base_max_speed - self.base_min_speed
+        approach_speed = self.base_min_speed + speed_range * (dist_to_marker / config.AI_MARKER_APPROACH_SLOWDOWN_DISTANCE) * config.AI_MARKER_APPROACH_MIN_SPEED_FACTOR
+        self.target_speed = np.where(approaching, np.maximum(self.base_min_speed * 0.8, approach_speed), self.target_speed)
+        self.target_speed = np.where(boosting, self.base_max_speed, self.target_speed)
+        self.target_speed = np.where(path_following, np.where(dist_to_marker > config.AI_STRAIGHT_BOOST_MIN_DISTANCE, self.base_max_speed, self.base_target_speed), self.target_speed)
+        self.speed_update_timer = np.where(cruising, self.speed_update_timer + self.elapsed, np.where(approaching | boosting, 0.0, self.speed_update_timer))
+        rerolling = cruising & (self.speed_update_timer >= config.AI_TARGET_SPEED_UPDATE_INTERVAL)
+        if rerolling.any():
+            variation = _flight_rng.uniform(-1.0, 1.0, len(self.gliders)) * speed_range * config.AI_SPEED_VARIATION_FACTOR
+            rerolled_speed = np.clip(self.base_target_speed + variation, self.base_min_speed, self.base_max_speed)
+            self.target_speed = np.where(rerolling, rerolled_speed, self.target_speed)
+            self.speed_update_timer[rerolling] = 0.0
+        self.height += (self.target_altitude - self.height) * np.where(path_following, 1.0, self._catch_up(config.AI_ALTITUDE_CORRECTION_RATE))
+
+        reached = self.due & (dist_to_marker < marker_radius[index])
+        index = index + reached
+        lapped = index >= len(race_markers_list)
+        self.laps_completed += lapped
+        self.target_marker_index = np.where(lapped, 0, index)
+        self._fly(heading_difference, snap_turn=path_following)
+
+    def step_wingmen(self, gliders, player):
+        # AIGlider.update_wingman_behavior: hold a formation slot off the player's wing
+        self.sync(gliders)
+        if not self.gliders:
+            return
+        self._tick_cooldowns()
+        player_heading_rad = math.radians(player.heading)
+        cos_heading, sin_heading = math.cos(player_heading_rad), math.sin(player_heading_rad)
+        dx = player.world_x + (self.formation_x * cos_heading - self.formation_y * sin_heading) - self.world_x
+        dy = player.world_y + (self.formation_x * sin_heading + self.formation_y * cos_heading) - self.world_y
+        self.target_speed = np.where(self.due, np.clip(player.speed * self.speed_factor * 0.9, self.base_min_speed, self.base_max_speed), self.target_speed)
+        self.target_altitude = np.where(self.due, player.height + self.altitude_offset, self.target_altitude)
+        self.height += (self.target_altitude - self.height) * self._catch_up(config.WINGMAN_ALTITUDE_CORRECTION_RATE)
+        self._fly(_heading_difference(dx, dy, self.heading), config.WINGMAN_CASUALNESS_FACTOR)
+
+    def step_dogfight(self, gliders, player, bullet_pool):
+        # AIGlider.update_dogfight_enemy_behavior: close on the player and fire when it is in the nose cone
+        self.sync(gliders)
+        if not self.gliders:
+            return
+        self._tick_cooldowns()
+        dx = player.world_x - self.world_x
+        dy = player.world_y - self.world_y
+        dist_to_player = np.hypot(dx, dy)
+        jitter = _flight_rng.uniform(-1.0, 1.0, len(self.gliders))
+        self.target_speed = np.where(self.due, np.clip(player.speed * self.speed_factor + jitter, self.base_min_speed, self.base_max_speed), self.target_speed)
+        self.target_altitude = np.where(self.due, player.height + self.altitude_offset, self.target_altitude)
+        self.height += (self.target_altitude - self.height) * self._catch_up(config.AI_ALTITUDE_CORRECTION_RATE * 1.5)
+        heading_difference = _heading_difference(dx, dy, self.heading)
+
+        firing = self.due & (dist_to_player < config.DOGFIGHT_AI_SHOOTING_RANGE) & (np.abs(heading_difference) < config.DOGFIGHT_AI_SHOOTING_CONE_ANGLE) & (self.shoot_cooldown_timer <= 0)
+        for i in np.flatnonzero(firing).tolist():
+            heading_rad = math.radians(self.heading[i])
+            bullet_pool.fire(self.world_x[i] + self.muzzle_offset[i] * math.cos(heading_rad),
+                             self.world_y[i] + self.muzzle_offset[i] * math.sin(heading_rad), float(self.heading[i]), self.gliders[i])
+        self.shoot_cooldown_timer = np.where(firing, self.shoot_cooldown_duration, self.shoot_cooldown_timer)
+        self._fly(heading_difference)
@@ -0,0 +1,68 @@
+# ai_lod.py
+# Level of detail for AI gliders: the farther a glider is from the camera view, the fewer frames it gets a full
+# AI tick. Between ticks it coasts along its heading at its current speed. Each tick then catches up on the
+# frames it covers (turning, speed changes and timers scale with them), so far gliders keep their pace and
+# still find their way.
+# The scheduler only marks gliders; AIGlider.simulate and the batched flight engine read the marks:
+#   lod_tier     index into AI_LOD_TIER_INTERVALS, 0 for gliders on or near the screen
+#   lod_elapsed  0 to coast this frame, otherwise the number of frames this full tick covers
+#   lod_outside  distance past the full-rate box (AIGlider.update_contrail drops trails that can't reach the view)
+
+import numpy as np
+import config
+
+class AILODScheduler:
+    def __init__(self, intervals=config.AI_LOD_TIER_INTERVALS, distances=config.AI_LOD_TIER_DISTANCES, full_rate_margin=config.AI_LOD_FULL_RATE_MARGIN):
+        self.intervals = intervals
+        self.distances = np.array(distances, dtype=np.float64)
+        self.full_rate_margin = full_rate_margin
+        self.reset()
+
+    def reset(self):
+        self.frame = 0
+        self.tier_counts = [0] * len(self.intervals) # Gliders in each tier as of the last schedule()
+        self.full_ticks = 0 # Gliders given a full tick last frame
+        self.far_gliders = set() # Gliders past the full-rate box as of the last schedule()
+
+    def schedule(self, gliders, cam_x, cam_y):
+        # Call once per frame for the AI group in play, before it is simulated
+        gliders = list(gliders)
+        self.frame += 1
+        if not gliders:
+            self.tier_counts = [0] * len(self.intervals)
+            self.full_ticks = 0
+            self.far_gliders = set()
+            return
+        count = len(gliders)
+        x = np.fromiter((glider.world_x for glider in gliders), dtype=np.float64, count=count)
+        y = np.fromiter((glider.world_y for glider in gliders), dtype=np.float64, count=count)
+        left = cam_x - self.full_rate_margin
+        top = cam_y - self.full_rate_margin
+        right = cam_x + config.SCREEN_WIDTH + self.full_rate_margin
+        bottom = cam_y + config.SCREEN_HEIGHT + self.full_rate_margin
+        # How far past the full-rate box along the worse axis; zero or less inside it
+        outside = np.maximum(np.maximum(left - x, x - right), np.maximum(top - y, y - bottom))
+        tiers = np.where(outside <= 0.0, 0, 1 + np.searchsorted(self.distances, outside))
+        self.tier_counts = np.bincount(tiers, minlength=len(self.intervals)).tolist()
+
+        full_ticks = 0
+        far_gliders = set()
+        frame = self.frame
+        intervals = self.intervals
+        for glider, tier, distance in zip(gliders, tiers.tolist(), outside.tolist()):
+            interval = intervals[tier]
+            glider.lod_tier = tier
+            glider.lod_outside = distance
+            if tier:
+                far_gliders.add(glider)
+            glider.lod_frames_pending += 1
+            # A glider that has just moved to a finer tier may be overdue, so it ticks at once
+            if glider.lod_frames_pending >= interval or (frame + glider.lod_slot) % interval == 0:
+                glider.lod_elapsed = glider.lod_frames_pending
+                glider.lod_frames_pending = 0
+                full_ticks += 1
+            else:
+                glider.lod_elapsed = 0
+        self.full_ticks = full_ticks
+        self.far_gliders = far_gliders
+
@@ -1,6 +1,7 @@
 # config.py
 # Stores all game constants and configuration settings.
 
+import os
 import pygame
 
 # --- Screen & Display ---
@@ -32,6 +33,7 @@ NOOB_TURN_FACTOR = 2.0
 EASY_TURN_FACTOR = 1.5
 NORMAL_TURN_FACTOR = 1.0
 GLIDER_COLLISION_RADIUS = 20
+GLIDER_ROTATION_STEP_DEGREES = 2 # Heading bucket size for the shared rotated glider images (must divide 360)
 
 # --- AI Specific ---
 NUM_AI_OPPONENTS = 3 # Max number of racers
@@ -46,6 +48,12 @@ AI_TARGET_SPEED_UPDATE_INTERVAL = 120
 AI_SPEED_VARIATION_FACTOR = 0.2
 AI_STRAIGHT_BOOST_THRESHOLD_ANGLE = 15
 AI_STRAIGHT_BOOST_MIN_DISTANCE = 400
+AI_FLIGHT_ENGINE_ENABLED = True # Fly AI gliders group by group on NumPy arrays (ai_flight.py) instead of one by one
+AI_LOD_ENABLED = True # Tick AI gliders far from the view at reduced rates, coasting in between (ai_lod.py)
+AI_LOD_TIER_INTERVALS = (1, 2, 4, 8) # Frames between full AI ticks per level-of-detail tier, nearest first
+AI_LOD_FULL_RATE_MARGIN = 200 # Gliders within this far of the view tick every frame (must exceed CULL_MARGIN: far tiers skip sprite rotation)
+AI_LOD_TIER_DISTANCES = (800, 2000) # Beyond the full-rate margin: tier 1 up to the first, tier 2 up to the second, tier 3 past that
+AI_LOD_PATH_FOLLOW_TIER = 2 # Racers at this tier or farther fly straight down the course instead of running the race AI
 
 AI_GLIDER_COLORS_LIST = [
     ((250, 180, 180), (255, 200, 200)),
@@ -67,7 +75,7 @@ WINGMAN_ALTITUDE_CORRECTION_RATE = 0.1
 # --- Combat Mechanics ---
 PLAYER_MAX_HEALTH = 100
 AI_MAX_HEALTH = 30 # AI are generally weaker
-BULLET_SPEED = 15
+BULLET_SPEED = 30 # Pixels per frame
 BULLET_RANGE = 600 # Max distance a bullet travels
 BULLET_DAMAGE = 10
 PLAYER_SHOOT_COOLDOWN = 15 # Frames between player shots
@@ -75,6 +83,9 @@ AI_SHOOT_COOLDOWN_BASE = 45 # Base frames between AI shots
 DOGFIGHT_AI_SHOOTING_RANGE = 500
 DOGFIGHT_AI_SHOOTING_CONE_ANGLE = 10 # Degrees: AI shoots if player is within this angle
 BULLET_COLOR = (255, 100, 0) # Bright orange/red
+BULLET_HIT_RADIUS = 24 # Added to a glider's collision radius when testing bullet hits
+BULLET_ROTATION_STEP_DEGREES = 5 # Heading bucket size for the pre-rotated bullet images (must divide 360)
+BULLET_POOL_INITIAL_CAPACITY = 256 # Bullet pool arrays double when full
 HEALTH_BAR_WIDTH = 50
 HEALTH_BAR_HEIGHT = 5
 HEALTH_BAR_COLOR_GOOD = (0, 200, 0)
@@ -90,10 +101,28 @@ DOGFIGHT_MAX_ENEMIES_ON_SCREEN = 5 # To prevent overwhelming the player/performa
 DOGFIGHT_AI_EVASIVENESS_FACTOR = 0.3 # How much AI tries to dodge (0-1)
 DOGFIGHT_AI_AGGRESSION_FACTOR = 0.7 # How often AI tries to engage vs. reposition (0-1)
 
+# Swarm variant: squadrons of weaker enemies by the hundred, with a radar for the ones off screen
+DOGFIGHT_SWARM_INITIAL_ENEMIES = 120
+DOGFIGHT_SWARM_ENEMIES_PER_ROUND_INCREASE = 40
+DOGFIGHT_SWARM_MAX_ENEMIES = 360 # Most that held 60 FPS (95th percentile frame under 16.7 ms) in every headless run; 400 came within 0.1 ms
+DOGFIGHT_SWARM_SQUADRON_SIZE = 8 # Enemies that spawn together in one formation and livery
+DOGFIGHT_SWARM_SQUADRON_SPACING = 70 # World pixels between neighbours in a squadron's V
+DOGFIGHT_SWARM_SPAWN_DISTANCE_MIN = SCREEN_WIDTH * 0.8 # Squadron leaders spawn this far from the player...
+DOGFIGHT_SWARM_SPAWN_DISTANCE_MAX = SCREEN_WIDTH * 3 # ...up to this far, so they arrive in waves
+DOGFIGHT_SWARM_ENEMY_HEALTH = 10 # One hit each
+DOGFIGHT_SWARM_CONTRAIL_LENGTH = 12 # Trail points per swarm enemy (CONTRAIL_LENGTH for everyone else); short enough to fit in AI_LOD_FULL_RATE_MARGIN
+DOGFIGHT_SWARM_SHOOT_COOLDOWN_FACTOR = 4 # Swarm enemies fire this many times less often than classic ones
+RADAR_RADIUS = 80 # Pixels
+RADAR_RANGE = 4000 # World pixels from the player to the radar's rim; threats further out sit on the rim
+RADAR_BLIP_RADIUS = 2
+RADAR_ALPHA = 200
+FRAME_COST_WARMUP_FRAMES = 30 # Frames after a swarm round starts that are left out of its frame cost report
+
 
 # --- Contrail ---
 CONTRAIL_LENGTH = 60
 CONTRAIL_POINT_DELAY = 2
+CONTRAIL_ALPHA_LEVELS = 16 # Pre-rendered dot alphas the contrail fade is quantized to
 
 # --- Thermals ---
 BASE_THERMAL_SPAWN_RATE = 100
@@ -114,6 +143,9 @@ THERMAL_SPAWN_AREA_WIDTH = SCREEN_WIDTH + 300
 THERMAL_SPAWN_AREA_HEIGHT = SCREEN_HEIGHT + 300
 THERMAL_BASE_ALPHA = 100
 THERMAL_ACCENT_ALPHA = 120
+THERMAL_PULSE_FRAMES = 24 # Pre-drawn frames per cycle of the thermal size pulse
+THERMAL_ATLAS_RADIUS_STEP = 5 # Thermals are drawn from shared frames at radii rounded to this step
+THERMAL_FRAME_COLORKEY = (0, 0, 0) # Transparent colour of the shared thermal frames
 
 # --- Map ---
 TILE_SIZE = 40
@@ -127,8 +159,19 @@ DESERT_THRESH = 0.20
 GRASSLAND_THRESH = 0.40
 TEMPERATE_FOREST_THRESH = 0.65
 RUNWAY_MIN_DISTANCE_APART = 1500 # Min distance between start and destination runways
-RUNWAY_MAX_PLACEMENT_ATTEMPTS = 100 # Attempts to find suitable runway spots
 RUNWAY_SUITABLE_LAND_TYPES = [] # To be populated after LAND_TYPE constants
+MAP_CHUNK_TILES = 16 # Tiles per side of a pre-rendered terrain chunk
+MAP_CHUNK_CACHE_MAX_BYTES = 64 * 1024 * 1024 # Memory cap for pre-rendered chunks (least recently used are evicted first)
+TILE_TYPE_STORE_MAX_CHUNKS = 4096 # Land type chunks kept in memory (~256 bytes each), least recently used are evicted first
+TERRAIN_PREFETCH_ENABLED = True # Generate and render upcoming chunks on a background thread
+TERRAIN_PREFETCH_LOOKAHEAD_FRAMES = 90 # How far ahead along the glider's track to predict the viewport
+TERRAIN_PREFETCH_SAMPLES = 3 # Predicted viewports between now and the lookahead
+TERRAIN_PREFETCH_MARGIN_TILES = 4 # Extra tiles around each predicted viewport to absorb turns
+MAP_RENDER_MODE_CHUNKS = "chunks" # Blit every visible cached chunk each frame
+MAP_RENDER_MODE_SCROLL = "scroll" # Scroll last frame's terrain and draw only the exposed edge strips
+MAP_RENDER_MODE_PALETTE = "palette" # One 8-bit pixel per tile, scaled up by TILE_SIZE with an outline grid overlay
+MAP_RENDER_MODE = MAP_RENDER_MODE_SCROLL
+MAP_SCROLL_FULL_REDRAW_DELTA = 256 # Camera jumps larger than this many pixels redraw the whole terrain
 
 # --- Race Mode Specific ---
 RACE_MARKER_RADIUS_WORLD = 75
@@ -180,6 +223,15 @@ TARGET_HEIGHT_PER_LEVEL = 1000
 START_HEIGHT_NEW_LEVEL = 250
 EXPLOSION_DURATION_TICKS = 40 # Duration explosion stays visible (e.g., 10 frames * 4 ticks/frame for Explosion sprite)
 
+# --- Spatial Grid ---
+SPATIAL_GRID_CELL_SIZE = 512 # World pixels per grid cell
+CULL_MARGIN = 64 # World sprites this far outside the view are still tested for drawing (at least the largest sprite half-size)
+PROXIMITY_GRID_CELL_SIZE = 128 # Cells of the grids behind glider collisions, bullet hits and thermal lift
+
+# --- Update Pipeline ---
+UPDATE_TIMING_SMOOTHING = 0.05 # Weight of the newest tick in each phase's averaged update time
+SHOW_UPDATE_TIMINGS = False # Debug line at the bottom of the play screen: averaged ms and entity count per update phase, world sprites drawn and culled, text cache hit rate
+
 
 # --- Height Indicator ---
 INDICATOR_WIDTH = 20
@@ -192,6 +244,8 @@ HUD_FONT_NAME = "Consolas"
 HUD_FONT_SIZE_LARGE = 24
 HUD_FONT_SIZE_NORMAL = 22
 HUD_FONT_SIZE_SMALL = 20
+TEXT_CACHE_PROBATION_SIZE = 128 # Rendered strings drawn once so far; churning numbers only cycle through these
+TEXT_CACHE_PROTECTED_SIZE = 256 # Rendered strings drawn more than once, like labels and menu text
 
 # --- Game States ---
 STATE_START_SCREEN = 0
@@ -226,7 +280,7 @@ current_game_mode = MODE_FREE_FLY
 # --- Pastel Colors ---
 PASTEL_BLACK = (50,50,60); PASTEL_WHITE = (245,245,250); PASTEL_DARK_GRAY = (180,180,190); PASTEL_GRAY = (200,200,210); PASTEL_LIGHT_GRAY = (230,230,240)
 PASTEL_RED = (255,150,150); PASTEL_GREEN_TARGET = (173,255,173); PASTEL_GOLD = (255,230,150); PASTEL_CLOUD = (235,240,245); PASTEL_HUD_PANEL = (190,200,210,180)
-PASTEL_MINIMAP_BACKGROUND = (170,180,190,MINIMAP_ALPHA); PASTEL_MINIMAP_BORDER = (140,150,160); PASTEL_MARKER_COLOR = (255,170,170); PASTEL_ACTIVE_MARKER_COLOR = PASTEL_GREEN_TARGET
+PASTEL_RADAR_BACKGROUND = (120,135,150,RADAR_ALPHA); PASTEL_RADAR_RING = (170,185,200); PASTEL_RADAR_THREAT = (255,120,120); PASTEL_MINIMAP_BACKGROUND = (170,180,190,MINIMAP_ALPHA); PASTEL_MINIMAP_BORDER = (140,150,160); PASTEL_MARKER_COLOR = (255,170,170); PASTEL_ACTIVE_MARKER_COLOR = PASTEL_GREEN_TARGET
 PASTEL_WATER_DEEP = (190,220,240); PASTEL_WATER_SHALLOW = (210,235,250); PASTEL_PLAINS = (200,240,200); PASTEL_GRASSLAND = (190,250,190)
 PASTEL_FOREST_TEMPERATE = (180,220,180); PASTEL_FOREST_DENSE = (160,200,160); PASTEL_MOUNTAIN_BASE = (210,210,200); PASTEL_MOUNTAIN_PEAK = (235,235,240)
 PASTEL_SAND_BEACH = (250,240,210); PASTEL_SAND_DESERT = (245,230,200); PASTEL_RIVER = (200,225,250)
@@ -253,4 +307,20 @@ ELEVATION_CONTINENT_SCALE = 60.0; ELEVATION_MOUNTAIN_SCALE = 15.0; ELEVATION_HIL
 MOISTURE_PRIMARY_SCALE = 40.0; MOISTURE_SECONDARY_SCALE = 10.0
 P_CONT = (73856093,19349663); P_MNT = (83492791,52084219); P_HILL = (39119077,66826529)
 P_MOIST_P = (23109781,92953093); P_MOIST_S = (47834583,11634271)
+MAP_NOISE_BACKEND_COMPAT = "mersenne_compat" # Reseeded random.Random per sample, reproduces the original maps exactly
+MAP_NOISE_BACKEND_HASH = "splitmix64" # Stateless integer hash, much faster and thread-safe
+MAP_NOISE_BACKEND = MAP_NOISE_BACKEND_HASH # Backend used when a new map is generated
 NUM_MAJOR_RIVERS = 3
+RIVER_SPAN_PRECOMPUTE_HALFWIDTH_TILES = (RACE_COURSE_AREA_HALFWIDTH + SCREEN_WIDTH) // TILE_SIZE # River spans built up front around the course
+RIVER_SPAN_TABLE_MAX_LINES = 65536 # Lazily added river span lines kept before the table is reset
+FIXED_MAP_SEED = None # (map_offset_x, map_offset_y, river_seed, noise_backend) to fly the same map every level, e.g. on demo stations
+REPLAYABLE_LEVEL_MAPS = False # Derive each level's map from LEVEL_MAP_STATION_SEED, the mode and the level number, so a level is the same map every time it is played (and its terrain is kept on disk)
+LEVEL_MAP_STATION_SEED = 0 # Change it to get a different set of replayable maps
+TERRAIN_DISK_CACHE_ENABLED = True # Persist generated land types for replayable map seeds (FIXED_MAP_SEED, REPLAYABLE_LEVEL_MAPS or one passed to start_new_level)
+TERRAIN_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pastel_glider", "terrain_cache")
+TERRAIN_DISK_CACHE_RADIUS_CHUNKS = 24 # Chunks stored around each map's origin (~15k px each way, ~600 KB per map)
+TERRAIN_DISK_CACHE_MAX_MAPS = 16 # Least recently used map files beyond this are deleted
+TERRAIN_PREBAKE_ENABLED = True # Bake the course area across CPU cores when a Race or Delivery level starts
+TERRAIN_PREBAKE_MAX_WORKERS = None # None uses all cores but one
+TERRAIN_PREBAKE_BATCH_CHUNKS = 4 # Chunks per worker task
+TERRAIN_PREBAKE_WAIT_TIMEOUT = 5.0 # Seconds to wait for a chunk the pre-bake owns before generating it directly
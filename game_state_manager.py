@@ -1,20 +1,33 @@
 import pygame
 import math
 import random
+import time
 import config
-from sprites import PlayerGlider, AIGlider, Thermal, RaceMarker, ForegroundCloud, Bullet, Runway, DeliveryCheckpoint, Explosion # Ensure Explosion is here
-from map_generation import regenerate_river_parameters, get_land_type_at_world_pos
-from ui import Minimap
+from sprites import PlayerGlider, AIGlider, Thermal, RaceMarker, ForegroundCloud, BulletPool, Runway, DeliveryCheckpoint, Explosion # Ensure Explosion is here
+from map_generation import regenerate_river_parameters, set_noise_backend, get_land_type_at_world_pos, TileTypeStore, warm_terrain_chunks, find_suitable_world_pos
+from terrain_disk_cache import open_terrain_disk_cache
+from terrain_prebake import course_area_prebake
+from spatial_grid import CulledGroup, IndexedGroup
+from ai_flight import AIFlightEngine
+from ai_lod import AILODScheduler
+from update_pipeline import UpdatePipeline, FrameCostMeter, PHASE_SIMULATE, PHASE_POSITION, PHASE_CONTRAIL
+from ui import Minimap, ThreatRadar
 
 # --- Game Variables (managed by this module) ---
 player = PlayerGlider()
-ai_gliders = pygame.sprite.Group()
+ai_gliders = IndexedGroup(cell_size=config.PROXIMITY_GRID_CELL_SIZE) # Indexed groups answer the proximity checks below
 wingmen_group = pygame.sprite.Group()
-dogfight_enemies_group = pygame.sprite.Group()
-all_world_sprites = pygame.sprite.Group()
-thermals_group = pygame.sprite.Group()
+dogfight_enemies_group = IndexedGroup(cell_size=config.PROXIMITY_GRID_CELL_SIZE)
+all_world_sprites = CulledGroup() # Only what's near the camera gets drawn
+explosions_group = pygame.sprite.Group() # Also in all_world_sprites; kept apart so their animation steps once per tick
+thermals_group = IndexedGroup(cell_size=config.PROXIMITY_GRID_CELL_SIZE)
 foreground_clouds_group = pygame.sprite.Group()
-bullets_group = pygame.sprite.Group()
+bullet_pool = BulletPool()
+tick_pipeline = UpdatePipeline()
+race_flight = AIFlightEngine() # Batched flight model for each AI group
+wingmen_flight = AIFlightEngine()
+dogfight_flight = AIFlightEngine()
+ai_lod = AILODScheduler() # Level of detail for whichever AI group is in play
 delivery_runways_group = pygame.sprite.Group()
 delivery_checkpoints_group = pygame.sprite.Group()
 
@@ -38,7 +51,8 @@ total_race_laps = config.DEFAULT_RACE_LAPS
 
 current_map_offset_x = 0
 current_map_offset_y = 0
-tile_type_cache = {}
+current_map_seed = None # (map_offset_x, map_offset_y, river_seed, noise_backend) of the map being flown
+tile_type_store = TileTypeStore()
 
 high_scores = {
     "longest_flight_time_free_fly": 0.0,
@@ -65,8 +79,14 @@ current_session_flight_start_ticks = 0
 dogfight_current_round = 1
 dogfight_enemies_to_spawn_this_round = 0
 dogfight_enemies_defeated_this_round = 0
+dogfight_swarm_enabled = False # Swarm variant, toggled on the mode select screen
+swarm_frame_meter = FrameCostMeter() # Frame time and per-enemy cost of the current swarm round
+dogfight_hit_test_ms = 0.0 # Last tick's bullet-hit tests against the dogfight enemies, for the swarm meter
+
+MAX_THERMAL_RADIUS = max(config.NORMAL_MAX_THERMAL_RADIUS, config.NOOB_MAX_THERMAL_RADIUS)
 
 minimap = Minimap(config.MINIMAP_WIDTH, config.MINIMAP_HEIGHT, config.MINIMAP_MARGIN)
+threat_radar = ThreatRadar(config.RADAR_RADIUS, config.RADAR_RANGE, config.MINIMAP_MARGIN)
 
 # --- Core Game Logic Functions ---
 def generate_race_course(num_markers=8):
@@ -81,20 +101,9 @@ def generate_race_course(num_markers=8):
         race_course_markers.append(marker)
         all_world_sprites.add(marker)
 
-def find_suitable_runway_location(existing_locations, map_offset_x, map_offset_y, cache, required_min_distance_apart):
-    for _ in range(config.RUNWAY_MAX_PLACEMENT_ATTEMPTS):
-        rx = random.uniform(-config.RACE_COURSE_AREA_HALFWIDTH * 0.8, config.RACE_COURSE_AREA_HALFWIDTH * 0.8)
-        ry = random.uniform(-config.RACE_COURSE_AREA_HALFWIDTH * 0.8, config.RACE_COURSE_AREA_HALFWIDTH * 0.8)
-        land_type = get_land_type_at_world_pos(rx, ry, map_offset_x, map_offset_y, cache)
-        too_close = False
-        if land_type in config.RUNWAY_SUITABLE_LAND_TYPES:
-            for loc in existing_locations:
-                if math.hypot(rx - loc[0], ry - loc[1]) < required_min_distance_apart:
-                    too_close = True
-                    break
-            if not too_close:
-                return rx, ry
-    return None
+def find_suitable_runway_location(existing_locations, map_offset_x, map_offset_y, tile_type_store_param, required_min_distance_apart):
+    return find_suitable_world_pos(existing_locations, required_min_distance_apart, config.RACE_COURSE_AREA_HALFWIDTH * 0.8,
+                                   map_offset_x, map_offset_y, tile_type_store_param)
 
 def _set_next_delivery_target():
     global delivery_active_target_object, delivery_checkpoints_list, delivery_current_checkpoint_index, delivery_destination_runway
@@ -108,7 +117,7 @@ def _set_next_delivery_target():
 
 def setup_delivery_mission():
     global delivery_start_runway, delivery_destination_runway, delivery_runways_group, all_world_sprites
-    global player, game_state, current_map_offset_x, current_map_offset_y, tile_type_cache
+    global player, game_state, current_map_offset_x, current_map_offset_y, tile_type_store
     global level_timer_start_ticks, wingman_was_actually_unlocked_this_turn, current_level
     global delivery_checkpoints_list, delivery_checkpoints_group, delivery_active_target_object, delivery_current_checkpoint_index
 
@@ -133,17 +142,17 @@ def setup_delivery_mission():
     dynamic_min_runway_distance = config.RUNWAY_MIN_DISTANCE_APART * (1 + (num_previous_successes * config.DELIVERY_MIN_DISTANCE_INCREASE_FACTOR))
     dynamic_min_runway_distance = max(dynamic_min_runway_distance, config.RUNWAY_MIN_DISTANCE_APART * 0.5)
 
-    start_loc = find_suitable_runway_location([], current_map_offset_x, current_map_offset_y, tile_type_cache, 0)
+    start_loc = find_suitable_runway_location([], current_map_offset_x, current_map_offset_y, tile_type_store, 0)
     if not start_loc:
         print("Error: Could not place start runway.")
         reset_to_main_menu(); return
     delivery_start_runway = Runway(start_loc[0], start_loc[1], is_start_runway=True)
     all_world_sprites.add(delivery_start_runway); delivery_runways_group.add(delivery_start_runway)
 
-    dest_loc = find_suitable_runway_location([start_loc], current_map_offset_x, current_map_offset_y, tile_type_cache, dynamic_min_runway_distance)
+    dest_loc = find_suitable_runway_location([start_loc], current_map_offset_x, current_map_offset_y, tile_type_store, dynamic_min_runway_distance)
     if not dest_loc:
         print(f"Error: Could not place destination runway (dist: {dynamic_min_runway_distance}). Trying base.")
-        dest_loc = find_suitable_runway_location([start_loc], current_map_offset_x, current_map_offset_y, tile_type_cache, config.RUNWAY_MIN_DISTANCE_APART)
+        dest_loc = find_suitable_runway_location([start_loc], current_map_offset_x, current_map_offset_y, tile_type_store, config.RUNWAY_MIN_DISTANCE_APART)
         if not dest_loc:
             print("Error: Fallback runway placement failed."); reset_to_main_menu(); return
     delivery_destination_runway = Runway(dest_loc[0], dest_loc[1], is_destination_runway=True)
@@ -255,23 +264,79 @@ def start_dogfight_round(round_number):
     dogfight_enemies_defeated_this_round = 0
     for enemy in dogfight_enemies_group: enemy.kill()
     dogfight_enemies_group.empty()
-    dogfight_enemies_to_spawn_this_round = min(config.DOGFIGHT_INITIAL_ENEMIES + (dogfight_current_round - 1) * config.DOGFIGHT_ENEMIES_PER_ROUND_INCREASE,
-                                               config.DOGFIGHT_MAX_ENEMIES_ON_SCREEN)
     player.health = player.max_health
-    for i in range(dogfight_enemies_to_spawn_this_round):
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(config.SCREEN_WIDTH * 0.6, config.SCREEN_WIDTH * 0.9)
-        start_x = player.world_x + distance * math.cos(angle)
-        start_y = player.world_y + distance * math.sin(angle)
-        body_color, wing_color = config.AI_GLIDER_COLORS_LIST[i % len(config.AI_GLIDER_COLORS_LIST)]
-        profile = {"speed_factor": random.uniform(0.8, 1.1), "turn_factor": random.uniform(0.9, 1.2), "altitude_offset": random.uniform(-50, 50)}
-        enemy = AIGlider(start_x, start_y, body_color, wing_color, profile, ai_mode="dogfight_enemy", player_ref=player)
-        dogfight_enemies_group.add(enemy); all_world_sprites.add(enemy)
+    Explosion.get_frames() # Rendered before the shooting starts
+    if dogfight_swarm_enabled:
+        dogfight_enemies_to_spawn_this_round = min(config.DOGFIGHT_SWARM_INITIAL_ENEMIES + (dogfight_current_round - 1) * config.DOGFIGHT_SWARM_ENEMIES_PER_ROUND_INCREASE,
+                                                   config.DOGFIGHT_SWARM_MAX_ENEMIES)
+        spawn_swarm_squadrons(dogfight_enemies_to_spawn_this_round)
+        swarm_frame_meter.reset()
+    else:
+        dogfight_enemies_to_spawn_this_round = min(config.DOGFIGHT_INITIAL_ENEMIES + (dogfight_current_round - 1) * config.DOGFIGHT_ENEMIES_PER_ROUND_INCREASE,
+                                                   config.DOGFIGHT_MAX_ENEMIES_ON_SCREEN)
+        for i in range(dogfight_enemies_to_spawn_this_round):
+            angle = random.uniform(0, 2 * math.pi)
+            distance = random.uniform(config.SCREEN_WIDTH * 0.6, config.SCREEN_WIDTH * 0.9)
+            start_x = player.world_x + distance * math.cos(angle)
+            start_y = player.world_y + distance * math.sin(angle)
+            body_color, wing_color = config.AI_GLIDER_COLORS_LIST[i % len(config.AI_GLIDER_COLORS_LIST)]
+            profile = {"speed_factor": random.uniform(0.8, 1.1), "turn_factor": random.uniform(0.9, 1.2), "altitude_offset": random.uniform(-50, 50)}
+            enemy = AIGlider(start_x, start_y, body_color, wing_color, profile, ai_mode="dogfight_enemy", player_ref=player)
+            dogfight_enemies_group.add(enemy); all_world_sprites.add(enemy)
     game_state = config.STATE_DOGFIGHT_PLAYING
 
-def start_new_level(level_param, continue_map_from_race=False):
+def spawn_swarm_squadrons(enemy_count):
+    # Squadrons fly in a V behind a leader, one livery each. They spread from just off screen to far out, so
+    # they close in wave after wave, and all start pointed at the player.
+    squadron_count = math.ceil(enemy_count / config.DOGFIGHT_SWARM_SQUADRON_SIZE)
+    for squadron_index in range(squadron_count):
+        angle = random.uniform(0, 2 * math.pi)
+        distance = random.uniform(config.DOGFIGHT_SWARM_SPAWN_DISTANCE_MIN, config.DOGFIGHT_SWARM_SPAWN_DISTANCE_MAX)
+        leader_x = player.world_x + distance * math.cos(angle)
+        leader_y = player.world_y + distance * math.sin(angle)
+        back_x, back_y = math.cos(angle), math.sin(angle) # Away from the player
+        side_x, side_y = -back_y, back_x
+        body_color, wing_color = config.AI_GLIDER_COLORS_LIST[squadron_index % len(config.AI_GLIDER_COLORS_LIST)]
+        squadron_size = min(config.DOGFIGHT_SWARM_SQUADRON_SIZE, enemy_count - squadron_index * config.DOGFIGHT_SWARM_SQUADRON_SIZE)
+        for slot in range(squadron_size):
+            rank = (slot + 1) // 2 # Leader, then pairs further back on alternating sides
+            side = 1 if slot % 2 else -1
+            start_x = leader_x + rank * config.DOGFIGHT_SWARM_SQUADRON_SPACING * (back_x + side * side_x)
+            start_y = leader_y + rank * config.DOGFIGHT_SWARM_SQUADRON_SPACING * (back_y + side * side_y)
+            profile = {"speed_factor": random.uniform(0.8, 1.1), "turn_factor": random.uniform(0.9, 1.2), "altitude_offset": random.uniform(-50, 50)}
+            enemy = AIGlider(start_x, start_y, body_color, wing_color, profile, ai_mode="dogfight_enemy", player_ref=player)
+            enemy.heading = (math.degrees(angle) + 180) % 360
+            enemy.max_health = enemy.health = config.DOGFIGHT_SWARM_ENEMY_HEALTH
+            enemy.set_trail_length(config.DOGFIGHT_SWARM_CONTRAIL_LENGTH)
+            enemy.shoot_cooldown_duration *= config.DOGFIGHT_SWARM_SHOOT_COOLDOWN_FACTOR
+            enemy.shoot_cooldown_timer = random.randint(0, enemy.shoot_cooldown_duration) # So a squadron doesn't fire in unison
+            dogfight_enemies_group.add(enemy); all_world_sprites.add(enemy)
+
+def new_map_seed(rng=random):
+    return (rng.randint(-200000, 200000), rng.randint(-200000, 200000), rng.randint(0, 2**31 - 1), config.MAP_NOISE_BACKEND)
+
+def level_map_seed(level_param):
+    # The same seed for the same station, mode and level every time, so REPLAYABLE_LEVEL_MAPS levels come round again
+    return new_map_seed(random.Random(f"{config.LEVEL_MAP_STATION_SEED}:{config.current_game_mode}:{level_param}"))
+
+def apply_map_seed(map_seed, use_disk_cache=True):
+    # use_disk_cache: only for seeds that can come round again; a fresh random map's terrain would be written
+    # to disk, never read back, and push replayable maps out of the cache
+    global current_map_seed, current_map_offset_x, current_map_offset_y
+    current_map_seed = map_seed
+    current_map_offset_x, current_map_offset_y, river_seed, noise_backend = map_seed
+    offset_tile_x = math.floor(current_map_offset_x / config.TILE_SIZE)
+    offset_tile_y = math.floor(current_map_offset_y / config.TILE_SIZE)
+    course_area_prebake.cancel()
+    tile_type_store.clear()
+    set_noise_backend(noise_backend)
+    regenerate_river_parameters(river_seed, (offset_tile_x, offset_tile_y))
+    disk_cache = open_terrain_disk_cache(map_seed, offset_tile_x // config.MAP_CHUNK_TILES, offset_tile_y // config.MAP_CHUNK_TILES) if use_disk_cache else None
+    tile_type_store.attach_disk_cache(disk_cache)
+
+def start_new_level(level_param, continue_map_from_race=False, map_seed=None):
     global current_level, level_timer_start_ticks, current_thermal_spawn_rate, thermal_spawn_timer, game_state
-    global current_map_offset_x, current_map_offset_y, total_race_laps, ai_gliders, tile_type_cache
+    global current_map_offset_x, current_map_offset_y, total_race_laps, ai_gliders, tile_type_store
     global player_race_lap_times, current_session_flight_start_ticks, race_course_markers, dogfight_current_round
     global delivery_runways_group, delivery_start_runway, delivery_destination_runway, wingman_was_actually_unlocked_this_turn
     global delivery_checkpoints_list, delivery_checkpoints_group, delivery_active_target_object, delivery_current_checkpoint_index
@@ -280,17 +345,25 @@ def start_new_level(level_param, continue_map_from_race=False):
     wingman_was_actually_unlocked_this_turn = False
 
     if not continue_map_from_race:
-        current_map_offset_x = random.randint(-200000, 200000)
-        current_map_offset_y = random.randint(-200000, 200000)
-        tile_type_cache.clear()
-        regenerate_river_parameters(current_level + pygame.time.get_ticks())
+        # An explicit seed (or FIXED_MAP_SEED, or a REPLAYABLE_LEVEL_MAPS level) replays a known map, whose
+        # terrain may already be on disk; a random one is never flown again, so it stays in memory only
+        if map_seed is None and config.FIXED_MAP_SEED is not None:
+            map_seed = config.FIXED_MAP_SEED
+        elif map_seed is None and config.REPLAYABLE_LEVEL_MAPS:
+            map_seed = level_map_seed(level_param)
+        if map_seed is None:
+            apply_map_seed(new_map_seed(), use_disk_cache=False)
+        else:
+            apply_map_seed(map_seed)
+        if config.TERRAIN_PREBAKE_ENABLED and config.current_game_mode in (config.MODE_RACE, config.MODE_DELIVERY):
+            course_area_prebake.start(current_map_seed, tile_type_store) # Spawn area first; play starts once it is in
         generate_new_wind() # CALL TO generate_new_wind
 
     thermals_group.empty()
     for sprite in list(all_world_sprites):
-        if isinstance(sprite, (Thermal, AIGlider, RaceMarker, Bullet, Runway, DeliveryCheckpoint)):
+        if isinstance(sprite, (AIGlider, RaceMarker, Runway, DeliveryCheckpoint)):
             sprite.kill()
-    bullets_group.empty()
+    bullet_pool.clear()
     race_course_markers.clear()
     ai_gliders.empty()
     wingmen_group.empty()
@@ -347,6 +420,10 @@ def start_new_level(level_param, continue_map_from_race=False):
         elif config.game_difficulty == config.DIFFICULTY_EASY: current_thermal_spawn_rate = max(30, int(current_thermal_spawn_rate * 0.75))
         thermal_spawn_timer = 0
 
+    # The prefetcher takes over once flying; the spawn view is rendered up front
+    warm_terrain_chunks(player.world_x - config.SCREEN_WIDTH // 2, player.world_y - config.SCREEN_HEIGHT // 2,
+                        current_map_offset_x, current_map_offset_y, tile_type_store)
+
 def reset_to_main_menu():
     global game_state, current_level, final_score, selected_difficulty_option, selected_mode_option, selected_laps_option
     global player_race_lap_times, race_course_markers, unlocked_wingmen_count
@@ -358,16 +435,17 @@ def reset_to_main_menu():
     player.reset()
     thermals_group.empty()
     all_world_sprites.empty()
+    explosions_group.empty()
     race_course_markers.clear()
     ai_gliders.empty()
     wingmen_group.empty()
     dogfight_enemies_group.empty()
-    bullets_group.empty()
+    bullet_pool.clear()
     delivery_runways_group.empty()
     delivery_checkpoints_group.empty()
     delivery_checkpoints_list.clear()
     foreground_clouds_group.empty()
-    tile_type_cache.clear()
+    tile_type_store.clear()
     player_race_lap_times.clear()
 
     unlocked_wingmen_count = 0
@@ -401,7 +479,7 @@ def update_game_logic(keys):
     global dogfight_enemies_defeated_this_round, dogfight_current_round, dogfight_enemies_to_spawn_this_round # Added dogfight_enemies_to_spawn_this_round
     global successful_deliveries_count, current_level 
     global delivery_active_target_object, delivery_current_checkpoint_index
-    global player 
+    global player, dogfight_hit_test_ms
 
     # --- Explosion Timer / Game State Transition ---
     if player.is_exploding:
@@ -441,7 +519,7 @@ def update_game_logic(keys):
         "current_game_mode": config.current_game_mode,
         "time_taken_for_level": time_taken_for_level
     }
-    returned_gs_from_player, ttf_update = player.update(keys, game_data_for_player, bullets_group, all_world_sprites)
+    returned_gs_from_player, ttf_update = player.update(keys, game_data_for_player, bullet_pool)
     if not player.is_exploding and returned_gs_from_player != game_state : 
         game_state = returned_gs_from_player 
     time_taken_for_level = ttf_update
@@ -450,25 +528,66 @@ def update_game_logic(keys):
     cam_x = player.world_x - config.SCREEN_WIDTH // 2
     cam_y = player.world_y - config.SCREEN_HEIGHT // 2
 
-    all_world_sprites.update(cam_x, cam_y) 
-    bullets_group.update(cam_x, cam_y)
+    # --- Update pipeline: each world entity is simulated, placed and trailed exactly once per tick ---
+    # (the player has already stepped itself above, since the camera follows it)
+    mode_is_live = not player.is_exploding
+    tick_pipeline.begin_tick()
+    ai_lod.far_gliders = set() # Only marks from this tick may excuse gliders from the draw's grid refresh
+    if game_state == config.STATE_RACE_PLAYING and mode_is_live:
+        if config.AI_LOD_ENABLED: ai_lod.schedule(ai_gliders, cam_x, cam_y)
+        if config.AI_FLIGHT_ENGINE_ENABLED:
+            tick_pipeline.run_batch(PHASE_SIMULATE, ai_gliders, lambda racers: race_flight.step_race(racers, race_course_markers))
+        else:
+            tick_pipeline.run(PHASE_SIMULATE, ai_gliders, lambda ai: ai.simulate(race_course_markers, total_race_laps, game_state))
+    elif (game_state == config.STATE_PLAYING_FREE_FLY or game_state == config.STATE_DELIVERY_PLAYING) and mode_is_live:
+        if config.AI_LOD_ENABLED: ai_lod.schedule(wingmen_group, cam_x, cam_y)
+        if config.AI_FLIGHT_ENGINE_ENABLED:
+            tick_pipeline.run_batch(PHASE_SIMULATE, wingmen_group, lambda wingmen: wingmen_flight.step_wingmen(wingmen, player))
+        else:
+            tick_pipeline.run(PHASE_SIMULATE, wingmen_group, lambda wingman: wingman.simulate(player, 0, game_state)) # Player is the target_or_player_ref
+    elif game_state == config.STATE_DOGFIGHT_PLAYING and mode_is_live:
+        if config.AI_LOD_ENABLED: ai_lod.schedule(dogfight_enemies_group, cam_x, cam_y)
+        if config.AI_FLIGHT_ENGINE_ENABLED:
+            tick_pipeline.run_batch(PHASE_SIMULATE, dogfight_enemies_group, lambda enemies: dogfight_flight.step_dogfight(enemies, player, bullet_pool))
+        else:
+            tick_pipeline.run(PHASE_SIMULATE, dogfight_enemies_group, lambda enemy: enemy.simulate(player, 0, game_state, bullet_pool))
+    tick_pipeline.run(PHASE_SIMULATE, explosions_group, lambda explosion: explosion.update(cam_x, cam_y))
+    tick_pipeline.run(PHASE_SIMULATE, thermals_group, lambda thermal: thermal.update(cam_x, cam_y))
+    tick_pipeline.run(PHASE_SIMULATE, (bullet_pool,), lambda pool: pool.update(cam_x, cam_y))
+    tick_pipeline.run(PHASE_SIMULATE, foreground_clouds_group, ForegroundCloud.update)
+
+    active_marker = None
+    if game_state == config.STATE_RACE_PLAYING and mode_is_live and race_course_markers:
+        active_marker = race_course_markers[player.current_target_marker_index]
+    checkpoints_are_live = game_state == config.STATE_DELIVERY_PLAYING and mode_is_live
+    def place_world_sprite(sprite):
+        if isinstance(sprite, AIGlider):
+            sprite.update_placement(cam_x, cam_y)
+        elif isinstance(sprite, RaceMarker):
+            sprite.update(cam_x, cam_y, (sprite is active_marker) if active_marker is not None else None)
+        elif isinstance(sprite, DeliveryCheckpoint):
+            sprite.update(cam_x, cam_y, (sprite is delivery_active_target_object) if checkpoints_are_live else None)
+        elif isinstance(sprite, Explosion):
+            sprite.rect.center = (sprite.world_pos.x - cam_x, sprite.world_pos.y - cam_y) # Animated in the simulate phase
+        else:
+            sprite.update(cam_x, cam_y)
+    tick_pipeline.run(PHASE_POSITION, all_world_sprites, place_world_sprite)
+    tick_pipeline.run(PHASE_CONTRAIL, all_world_sprites.moving_sprites, AIGlider.update_contrail)
+    tick_pipeline.end_tick()
 
     # --- Mode-specific logic ---
     if game_state == config.STATE_RACE_PLAYING and not player.is_exploding:
-        for ai in ai_gliders: ai.update(cam_x, cam_y, race_course_markers, total_race_laps, game_state)
-        collided_ais = pygame.sprite.spritecollide(player, ai_gliders, False, pygame.sprite.collide_circle)
-        for ai_hit in collided_ais: player.apply_collision_effect(); ai_hit.apply_collision_effect()
-        ai_list = list(ai_gliders); [(ai1.apply_collision_effect(),ai2.apply_collision_effect()) for i in range(len(ai_list)) for j in range(i+1,len(ai_list)) if(ai1:=ai_list[i],ai2:=ai_list[j],((ai1.world_x-ai2.world_x)**2+(ai1.world_y-ai2.world_y)**2)<(ai1.collision_radius+ai2.collision_radius)**2)]
-        for i, marker in enumerate(race_course_markers): marker.update(cam_x, cam_y, i == player.current_target_marker_index)
+        ai_gliders.refresh_positions()
+        # collide_circle goes by each sprite's rect, which for a glider is at most its width plus height across
+        glider_circles_reach = sum(player.base_image.get_size())
+        for ai_hit in ai_gliders.grid.query_radius(player.world_x, player.world_y, glider_circles_reach):
+            if pygame.sprite.collide_circle(player, ai_hit): player.apply_collision_effect(); ai_hit.apply_collision_effect()
+        for ai1, ai2 in ai_gliders.grid.query_pairs(config.GLIDER_COLLISION_RADIUS * 2):
+            ai1.apply_collision_effect(); ai2.apply_collision_effect()
 
 
     elif (game_state == config.STATE_PLAYING_FREE_FLY or game_state == config.STATE_DELIVERY_PLAYING) and not player.is_exploding:
-        for wingman in wingmen_group: wingman.update(cam_x, cam_y, player, 0, game_state) # Pass player as target_or_player_ref
         if game_state == config.STATE_DELIVERY_PLAYING:
-            for cp_sprite in delivery_checkpoints_group:
-                is_active = (delivery_active_target_object == cp_sprite)
-                cp_sprite.update(cam_x, cam_y, is_active)
-            
             wingman_was_actually_unlocked_this_turn = False
             
             if delivery_active_target_object:
@@ -496,34 +615,26 @@ def update_game_logic(keys):
 
 
     elif game_state == config.STATE_DOGFIGHT_PLAYING and not player.is_exploding:
-        # === THIS IS THE CRITICAL PART FOR DOGFIGHT AI MOVEMENT ===
-        for enemy in dogfight_enemies_group:
-            # Ensure AIGlider's update can handle these specific arguments for dogfight mode
-            enemy.update(cam_x, cam_y, player, 0, game_state, bullets_group, all_world_sprites)
-        # === END CRITICAL PART ===
-        
-        for bullet in bullets_group:
-            if bullet.owner == player:
-                enemies_hit = pygame.sprite.spritecollide(bullet, dogfight_enemies_group, False, pygame.sprite.collide_circle)
-                for enemy_hit in enemies_hit:
-                    bullet.kill()
-                    if enemy_hit.take_damage(config.BULLET_DAMAGE):
-                        explosion = Explosion(enemy_hit.world_pos)
-                        all_world_sprites.add(explosion)
-                        dogfight_enemies_defeated_this_round += 1 
-            else: 
-                if not player.is_exploding and pygame.sprite.collide_circle(bullet, player): 
-                    bullet.kill()
-                    if player.take_damage(config.BULLET_DAMAGE):
-                        if not player.is_exploding: 
-                            explosion = Explosion((player.world_x, player.world_y))
-                            all_world_sprites.add(explosion)
-                            player.is_exploding = True
-                            player.explosion_timer = config.EXPLOSION_DURATION_TICKS
-                            player.pending_game_over_state = config.STATE_DOGFIGHT_GAME_OVER_CONTINUE
-                            player.pending_final_score_context = dogfight_current_round 
-                            player.speed = 0; player.height = max(0, player.height) 
-                        break 
+        hit_test_start = time.perf_counter()
+        dogfight_enemies_group.refresh_positions()
+        bullet_reach = config.BULLET_SPEED + config.BULLET_HIT_RADIUS + config.GLIDER_COLLISION_RADIUS # A bullet's last step can hit this far out
+        enemies_near_bullets = dogfight_enemies_group.grid.query_near_points(bullet_pool.positions(owner_glider=player), bullet_reach)
+        for enemy_hit in bullet_pool.collide_gliders(enemies_near_bullets, owner_glider=player):
+            if enemy_hit.alive() and enemy_hit.take_damage(config.BULLET_DAMAGE):
+                explosion = Explosion(enemy_hit.world_pos)
+                all_world_sprites.add(explosion); explosions_group.add(explosion)
+                dogfight_enemies_defeated_this_round += 1 
+        for _ in bullet_pool.collide_gliders([player], exclude_owner=player):
+            if player.take_damage(config.BULLET_DAMAGE):
+                explosion = Explosion((player.world_x, player.world_y))
+                all_world_sprites.add(explosion); explosions_group.add(explosion)
+                player.is_exploding = True
+                player.explosion_timer = config.EXPLOSION_DURATION_TICKS
+                player.pending_game_over_state = config.STATE_DOGFIGHT_GAME_OVER_CONTINUE
+                player.pending_final_score_context = dogfight_current_round 
+                player.speed = 0; player.height = max(0, player.height) 
+                break 
+        dogfight_hit_test_ms = (time.perf_counter() - hit_test_start) * 1000.0
         
         if not player.is_exploding: 
             # Check current number of active enemies for round completion.
@@ -542,17 +653,17 @@ def update_game_logic(keys):
         thermal_spawn_timer = 0 
         spawn_world_x = cam_x + random.randint(-config.THERMAL_SPAWN_AREA_WIDTH // 2, config.THERMAL_SPAWN_AREA_WIDTH // 2)
         spawn_world_y = cam_y + random.randint(-config.THERMAL_SPAWN_AREA_HEIGHT // 2, config.THERMAL_SPAWN_AREA_HEIGHT // 2)
-        if random.random() < config.LAND_TYPE_THERMAL_PROBABILITY.get(get_land_type_at_world_pos(spawn_world_x, spawn_world_y, current_map_offset_x, current_map_offset_y, tile_type_cache), 0.0):
+        if random.random() < config.LAND_TYPE_THERMAL_PROBABILITY.get(get_land_type_at_world_pos(spawn_world_x, spawn_world_y, current_map_offset_x, current_map_offset_y, tile_type_store), 0.0):
             new_thermal = Thermal((spawn_world_x, spawn_world_y), config.game_difficulty)
-            all_world_sprites.add(new_thermal); thermals_group.add(new_thermal)
+            thermals_group.add(new_thermal)
 
-    foreground_clouds_group.update()
     if len(foreground_clouds_group) < config.NUM_FOREGROUND_CLOUDS:
         foreground_clouds_group.add(ForegroundCloud())
 
     if not player.is_exploding:
-        for thermal in thermals_group:
-            if math.hypot(player.world_x - thermal.world_pos.x, player.world_y - thermal.world_pos.y) < thermal.radius + (player.collision_radius * 0.5):
+        player_lift_reach = player.collision_radius * 0.5
+        for thermal in thermals_group.grid.query_radius(player.world_x, player.world_y, player_lift_reach + MAX_THERMAL_RADIUS):
+            if math.hypot(player.world_x - thermal.world_pos.x, player.world_y - thermal.world_pos.y) < thermal.radius + player_lift_reach:
                 player.apply_lift_from_thermal(thermal.lift_power, config.game_difficulty)
 
     if game_state == config.STATE_PLAYING_FREE_FLY and not player.is_exploding and \
@@ -569,7 +680,7 @@ def update_game_logic(keys):
        game_state not in [config.STATE_GAME_OVER, config.STATE_DOGFIGHT_GAME_OVER_CONTINUE, config.STATE_DELIVERY_COMPLETE]:
         
         explosion = Explosion((player.world_x, player.world_y))
-        all_world_sprites.add(explosion)
+        all_world_sprites.add(explosion); explosions_group.add(explosion)
         player.is_exploding = True
         player.explosion_timer = config.EXPLOSION_DURATION_TICKS
         player.pending_game_over_state = config.STATE_GAME_OVER
@@ -4,16 +4,18 @@
 import pygame
 import math
 import random
+import time
 
 import config
-from sprites import PlayerGlider, AIGlider, Thermal, RaceMarker, ForegroundCloud, Bullet, Runway, DeliveryCheckpoint # Added DeliveryCheckpoint
-from map_generation import draw_endless_map
-from ui import (draw_text, Minimap, draw_height_indicator_hud, draw_dial, draw_weather_vane,
+from sprites import PlayerGlider, AIGlider, Thermal, RaceMarker, ForegroundCloud, Runway, DeliveryCheckpoint, draw_contrails # Added DeliveryCheckpoint
+from map_generation import draw_endless_map, terrain_prefetcher
+from terrain_prebake import course_area_prebake
+from ui import (draw_text, Minimap, draw_height_indicator_hud,
                 draw_start_screen_content, draw_difficulty_select_screen, draw_mode_select_screen,
                 draw_laps_select_screen, draw_target_reached_options_screen, draw_post_goal_menu_screen,
                 draw_pause_menu_screen, draw_race_post_options_screen, draw_game_over_screen_content,
                 draw_dogfight_round_complete_screen, draw_dogfight_game_over_continue_screen,
-                draw_delivery_complete_screen) 
+                draw_delivery_complete_screen, draw_terrain_prebake_progress, format_entity_cost, hud_compositor, text_surface_cache) 
 import game_state_manager as gsm 
 from sprites import DeliveryCheckpoint, Runway # Ensure these are imported if type checking (already imported above, but good to double check context)
 
@@ -33,6 +35,8 @@ camera_y_current = 0.0
 running = True
 while running:
     dt = clock.tick(60) / 1000.0 # Delta time, not heavily used yet but good practice
+    frame_work_start = time.perf_counter() # Frame time without the wait for the next tick
+    glider_draw_ms = 0.0 # Contrails, world sprites and health bars: the drawing that grows with the glider count
     current_ticks = pygame.time.get_ticks()
     keys = pygame.key.get_pressed()
 
@@ -72,6 +76,8 @@ while running:
                     gsm.selected_mode_option = (gsm.selected_mode_option - 1 + num_modes) % num_modes
                 elif event.key == pygame.K_DOWN:
                     gsm.selected_mode_option = (gsm.selected_mode_option + 1) % num_modes
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT) and gsm.selected_mode_option == config.MODE_DOGFIGHT:
+                    gsm.dogfight_swarm_enabled = not gsm.dogfight_swarm_enabled
                 elif event.key == pygame.K_RETURN:
                     config.current_game_mode = gsm.selected_mode_option
                     gsm.game_state = config.STATE_DIFFICULTY_SELECT 
@@ -167,8 +173,11 @@ while running:
         config.STATE_PLAYING_FREE_FLY, config.STATE_TARGET_REACHED_CONTINUE_PLAYING,
         config.STATE_RACE_PLAYING, config.STATE_DOGFIGHT_PLAYING, config.STATE_DELIVERY_PLAYING
     ]
+    course_area_prebake.poll()
     if gsm.game_state in active_play_states:
         camera_x_current, camera_y_current = gsm.update_game_logic(keys)
+        terrain_prefetcher.update(gsm.player.world_x, gsm.player.world_y, gsm.player.heading, gsm.player.speed,
+                                  gsm.current_map_offset_x, gsm.current_map_offset_y, gsm.tile_type_store, screen)
     elif gsm.game_state == config.STATE_PAUSED: 
         camera_x_current = gsm.player.world_x - config.SCREEN_WIDTH // 2
         camera_y_current = gsm.player.world_y - config.SCREEN_HEIGHT // 2
@@ -178,55 +187,70 @@ while running:
     screen.fill(config.PASTEL_BLACK) 
 
     if gsm.game_state in active_play_states or gsm.game_state == config.STATE_PAUSED:
-        draw_endless_map(screen, camera_x_current, camera_y_current, gsm.current_map_offset_x, gsm.current_map_offset_y, gsm.tile_type_cache)
+        draw_endless_map(screen, camera_x_current, camera_y_current, gsm.current_map_offset_x, gsm.current_map_offset_y, gsm.tile_type_store)
         
-        gsm.player.draw_contrail(screen, camera_x_current, camera_y_current)
-        for ags in gsm.ai_gliders: ags.draw_contrail(screen, camera_x_current, camera_y_current)
-        for wg in gsm.wingmen_group: wg.draw_contrail(screen, camera_x_current, camera_y_current)
-        for enemy in gsm.dogfight_enemies_group: enemy.draw_contrail(screen, camera_x_current, camera_y_current)
+        draw_start = time.perf_counter()
+        draw_contrails(screen, [gsm.player, *gsm.ai_gliders, *gsm.wingmen_group, *gsm.dogfight_enemies_group], camera_x_current, camera_y_current)
+        glider_draw_ms += (time.perf_counter() - draw_start) * 1000.0
         
-        gsm.all_world_sprites.draw(screen) 
+        # Thermals go under everything else flying; only those within their largest radius of the view can show
+        thermal_margin = gsm.MAX_THERMAL_RADIUS
+        for thermal in gsm.thermals_group.grid.query_rect(camera_x_current - thermal_margin, camera_y_current - thermal_margin,
+                                                         camera_x_current + config.SCREEN_WIDTH + thermal_margin, camera_y_current + config.SCREEN_HEIGHT + thermal_margin):
+            thermal.draw(screen)
+        draw_start = time.perf_counter()
+        gsm.all_world_sprites.draw(screen, camera_x_current, camera_y_current, far_sprites=gsm.ai_lod.far_gliders)
+        glider_draw_ms += (time.perf_counter() - draw_start) * 1000.0
+        gsm.bullet_pool.draw(screen, camera_x_current, camera_y_current)
         
         current_display_state = gsm.game_state if gsm.game_state != config.STATE_PAUSED else gsm.game_state_before_pause
         if current_display_state == config.STATE_DOGFIGHT_PLAYING:
+            draw_start = time.perf_counter()
             gsm.player.draw_health_bar(screen, camera_x_current, camera_y_current)
-            for enemy in gsm.dogfight_enemies_group:
-                enemy.draw_health_bar(screen, camera_x_current, camera_y_current)
+            health_bar_margin = config.GLIDER_COLLISION_RADIUS * 2
+            for enemy in gsm.dogfight_enemies_group.grid.query_rect(camera_x_current - health_bar_margin, camera_y_current - health_bar_margin,
+                                                                     camera_x_current + config.SCREEN_WIDTH + health_bar_margin, camera_y_current + config.SCREEN_HEIGHT + health_bar_margin):
+                # Swarm enemies go down in one hit, so their bars would only ever show full
+                if enemy.health < enemy.max_health or not gsm.dogfight_swarm_enabled:
+                    enemy.draw_health_bar(screen, camera_x_current, camera_y_current)
+            glider_draw_ms += (time.perf_counter() - draw_start) * 1000.0
         
         screen.blit(gsm.player.image, gsm.player.rect)
         gsm.foreground_clouds_group.draw(screen)
 
         # --- HUD Drawing ---
-        hud_sfc = pygame.Surface((config.SCREEN_WIDTH, config.HUD_HEIGHT), pygame.SRCALPHA)
-        hud_sfc.fill(config.PASTEL_HUD_PANEL)
-        screen.blit(hud_sfc, (0,0))
+        hud_compositor.begin_frame()
         hm, ls, cyh = 10, 28, 8
 
         if config.current_game_mode == config.MODE_FREE_FLY:
-            draw_text(screen, f"Level: {gsm.current_level}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"Target: {config.TARGET_HEIGHT_PER_LEVEL * gsm.current_level}m", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"Wingmen: {gsm.unlocked_wingmen_count}", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("level", f"Level: {gsm.current_level}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("target", f"Target: {config.TARGET_HEIGHT_PER_LEVEL * gsm.current_level}m", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("wingmen", f"Wingmen: {gsm.unlocked_wingmen_count}", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD)
         elif config.current_game_mode == config.MODE_RACE:
-            draw_text(screen, f"Lap: {min(gsm.player.laps_completed + 1, gsm.total_race_laps)}/{gsm.total_race_laps}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("lap", f"Lap: {min(gsm.player.laps_completed + 1, gsm.total_race_laps)}/{gsm.total_race_laps}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
             current_lap_time_display = 0.0
             if gsm.game_state == config.STATE_RACE_PLAYING :
                  current_lap_time_display = (pygame.time.get_ticks() - gsm.player.current_lap_start_ticks) / 1000.0
             elif gsm.player_race_lap_times and gsm.player.laps_completed < gsm.total_race_laps: 
                  current_lap_time_display = gsm.player_race_lap_times[-1] if gsm.player_race_lap_times else 0.0
-            draw_text(screen, f"Lap Time: {current_lap_time_display:.1f}s", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("lap_time", f"Lap Time: {current_lap_time_display:.1f}s", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD)
             if gsm.race_course_markers and gsm.player.current_target_marker_index < len(gsm.race_course_markers) and gsm.game_state == config.STATE_RACE_PLAYING:
                 tm = gsm.race_course_markers[gsm.player.current_target_marker_index]
-                draw_text(screen, f"Marker {tm.number}: {int(math.hypot(gsm.player.world_x - tm.world_pos.x, gsm.player.world_y - tm.world_pos.y) / 10.0)} u", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+                hud_compositor.text("marker_distance", f"Marker {tm.number}: {int(math.hypot(gsm.player.world_x - tm.world_pos.x, gsm.player.world_y - tm.world_pos.y) / 10.0)} u", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD)
                 marker_dx = tm.world_pos.x - gsm.player.world_x; marker_dy = tm.world_pos.y - gsm.player.world_y
                 angle_to_marker_world_rad = math.atan2(marker_dy, marker_dx); angle_to_marker_world_deg = math.degrees(angle_to_marker_world_rad)
                 relative_angle_to_marker = (angle_to_marker_world_deg - gsm.player.heading + 360) % 360
                 marker_dial_x = config.SCREEN_WIDTH - config.MINIMAP_WIDTH - config.MINIMAP_MARGIN - 180
-                draw_dial(screen, marker_dial_x, hm + config.HUD_HEIGHT // 2 - 10, 22, relative_angle_to_marker, config.PASTEL_ACTIVE_MARKER_COLOR, label="M")
+                hud_compositor.dial("target_dial", marker_dial_x, hm + config.HUD_HEIGHT // 2 - 10, 22, relative_angle_to_marker, config.PASTEL_ACTIVE_MARKER_COLOR, label="M")
         elif config.current_game_mode == config.MODE_DOGFIGHT:
-            draw_text(screen, f"Round: {gsm.dogfight_current_round}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("round", f"Round: {gsm.dogfight_current_round}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
             enemies_left = gsm.dogfight_enemies_to_spawn_this_round - gsm.dogfight_enemies_defeated_this_round
-            draw_text(screen, f"Enemies: {enemies_left}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"Health: {gsm.player.health}", config.HUD_FONT_SIZE_NORMAL, hm + 320, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("enemies", f"Enemies: {enemies_left}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("health", f"Health: {gsm.player.health}", config.HUD_FONT_SIZE_NORMAL, hm + 320, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            if gsm.dogfight_swarm_enabled and gsm.swarm_frame_meter.frames:
+                hud_compositor.text("swarm_cost", f"Frame: {gsm.swarm_frame_meter.average_ms:.1f} ms, per enemy: update {format_entity_cost(gsm.swarm_frame_meter.per_entity_ms())}, draw {format_entity_cost(gsm.swarm_frame_meter.per_entity_draw_ms())}", config.HUD_FONT_SIZE_SMALL, hm + 470, cyh + 4, config.PASTEL_TEXT_COLOR_HUD)
+                if config.AI_LOD_ENABLED: # Enemies per level-of-detail tier, every frame first
+                    hud_compositor.text("swarm_lod", "LOD " + "/".join(str(count) for count in gsm.ai_lod.tier_counts), config.HUD_FONT_SIZE_SMALL, hm + 470, cyh + 4 + config.HUD_FONT_SIZE_SMALL, config.PASTEL_TEXT_COLOR_HUD)
         elif config.current_game_mode == config.MODE_DELIVERY:
             target_label_str = "Dest"
             target_dial_char = "D"
@@ -251,35 +275,48 @@ while running:
                     target_dial_char = f"C{active_target.number}" if active_target.number < 10 else "C"
                     target_dial_color = config.DELIVERY_CHECKPOINT_COLOR_ACTIVE
                 
-                draw_dial(screen, dial_x_pos, hm + config.HUD_HEIGHT // 2 - 10, 22, relative_angle_to_target, target_dial_color, label=target_dial_char)
+                hud_compositor.dial("target_dial", dial_x_pos, hm + config.HUD_HEIGHT // 2 - 10, 22, relative_angle_to_target, target_dial_color, label=target_dial_char)
 
-            draw_text(screen, f"Delivery: {gsm.current_level}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"{target_label_str}: {dist_to_target_display_str}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"Wingmen: {gsm.unlocked_wingmen_count}", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_text(screen, f"Completed: {gsm.successful_deliveries_count}", config.HUD_FONT_SIZE_NORMAL, hm + 520, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+            hud_compositor.text("delivery", f"Delivery: {gsm.current_level}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("delivery_target", f"{target_label_str}: {dist_to_target_display_str}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("wingmen", f"Wingmen: {gsm.unlocked_wingmen_count}", config.HUD_FONT_SIZE_NORMAL, hm + 380, cyh, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.text("completed", f"Completed: {gsm.successful_deliveries_count}", config.HUD_FONT_SIZE_NORMAL, hm + 520, cyh, config.PASTEL_TEXT_COLOR_HUD)
 
 
         cyh += ls
         timer_s = (current_ticks - gsm.level_timer_start_ticks) / 1000.0 if gsm.game_state in active_play_states else gsm.time_taken_for_level
         goal_text = " (Goal!)" if gsm.game_state == config.STATE_TARGET_REACHED_CONTINUE_PLAYING else ""
-        draw_text(screen, f"Time: {timer_s:.1f}s{goal_text}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+        hud_compositor.text("time", f"Time: {timer_s:.1f}s{goal_text}", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
         cyh += ls
-        draw_text(screen, f"Height: {int(gsm.player.height)}m", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-        draw_text(screen, f"Speed: {gsm.player.speed:.1f}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+        hud_compositor.text("height", f"Height: {int(gsm.player.height)}m", config.HUD_FONT_SIZE_NORMAL, hm, cyh, config.PASTEL_TEXT_COLOR_HUD)
+        hud_compositor.text("speed", f"Speed: {gsm.player.speed:.1f}", config.HUD_FONT_SIZE_NORMAL, hm + 150, cyh, config.PASTEL_TEXT_COLOR_HUD)
         if gsm.player.speed < config.STALL_SPEED:
-            draw_text(screen, "STALL!", config.HUD_FONT_SIZE_LARGE, config.SCREEN_WIDTH // 2, hm + ls // 2 - 5, config.PASTEL_RED, font_name=config.HUD_FONT_NAME, center=True, shadow=True, shadow_color=config.PASTEL_BLACK)
+            hud_compositor.text("stall", "STALL!", config.HUD_FONT_SIZE_LARGE, config.SCREEN_WIDTH // 2, hm + ls // 2 - 5, config.PASTEL_RED, center=True, shadow=True, shadow_color=config.PASTEL_BLACK)
         
         wind_text_x_pos = config.SCREEN_WIDTH - config.MINIMAP_WIDTH - config.MINIMAP_MARGIN - 125
         if config.current_game_mode != config.MODE_DOGFIGHT: 
-            draw_text(screen, f"Wind:", config.HUD_FONT_SIZE_SMALL, wind_text_x_pos - 50, hm + config.HUD_HEIGHT // 2 - 10, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-            draw_weather_vane(screen, config.current_wind_speed_x, config.current_wind_speed_y, wind_text_x_pos, hm + config.HUD_HEIGHT // 2 - 10 , 22)
+            hud_compositor.text("wind_label", f"Wind:", config.HUD_FONT_SIZE_SMALL, wind_text_x_pos - 50, hm + config.HUD_HEIGHT // 2 - 10, config.PASTEL_TEXT_COLOR_HUD)
+            hud_compositor.weather_vane("wind_vane", config.current_wind_speed_x, config.current_wind_speed_y, wind_text_x_pos, hm + config.HUD_HEIGHT // 2 - 10 , 22)
         
+        hud_compositor.composite(screen)
+
         et = "ESC for Menu"
         if gsm.game_state == config.STATE_TARGET_REACHED_CONTINUE_PLAYING: et = "ESC for Options"
         elif gsm.game_state in active_play_states: et = "ESC to Pause"
         if gsm.game_state in active_play_states or gsm.game_state == config.STATE_TARGET_REACHED_CONTINUE_PLAYING :
-            draw_text(screen, et, config.HUD_FONT_SIZE_SMALL, config.SCREEN_WIDTH - 150, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
+            hud_compositor.overlay_text(screen, "esc_hint", et, config.HUD_FONT_SIZE_SMALL, config.SCREEN_WIDTH - 150, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, center=True)
+        if config.SHOW_UPDATE_TIMINGS:
+            phase_timings = "  ".join(f"{phase} {average_ms:.1f} ms ({count})" for phase, (_, average_ms, count) in gsm.tick_pipeline.timings().items())
+            draw_counts = f"drawn {gsm.all_world_sprites.drawn_count}, culled {gsm.all_world_sprites.culled_count}"
+            if gsm.dogfight_swarm_enabled and config.current_game_mode == config.MODE_DOGFIGHT:
+                draw_counts += f", radar {gsm.threat_radar.shown_count}"
+            text_cache_hit_rate = text_surface_cache.stats()["hit_rate"]
+            hud_compositor.overlay_text(screen, "update_timings", f"Update: {phase_timings}  |  World sprites: {draw_counts}  |  Text cache: {text_cache_hit_rate:.0%} hits",
+                                        config.HUD_FONT_SIZE_SMALL, 10, config.SCREEN_HEIGHT - 40, config.PASTEL_LIGHT_GRAY)
         
+        if course_area_prebake.is_active():
+            draw_terrain_prebake_progress(screen, course_area_prebake.progress())
+
         draw_height_indicator_hud(screen, gsm.player.height, config.TARGET_HEIGHT_PER_LEVEL * gsm.current_level if config.current_game_mode == config.MODE_FREE_FLY else gsm.player.height + 100, gsm.player.vertical_speed, clock, config.current_game_mode)
 
         # Minimap
@@ -297,6 +334,8 @@ while running:
             if gsm.delivery_destination_runway: delivery_map_objects_to_draw.append(gsm.delivery_destination_runway)
             
             gsm.minimap.draw(screen, gsm.player, [], delivery_map_objects_to_draw, is_delivery_mode=True, delivery_active_target=gsm.delivery_active_target_object)
+        elif config.current_game_mode == config.MODE_DOGFIGHT and gsm.dogfight_swarm_enabled:
+            gsm.threat_radar.draw(screen, gsm.player, gsm.dogfight_enemies_group)
 
         if gsm.game_state == config.STATE_PAUSED:
             draw_pause_menu_screen(screen)
@@ -306,7 +345,7 @@ while running:
     elif gsm.game_state == config.STATE_DIFFICULTY_SELECT:
         draw_difficulty_select_screen(screen, gsm.selected_difficulty_option); draw_text(screen, "ESC for Mode Select", 18, 100, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True); gsm.foreground_clouds_group.draw(screen) 
     elif gsm.game_state == config.STATE_MODE_SELECT:
-        draw_mode_select_screen(screen, gsm.selected_mode_option); draw_text(screen, "ESC for Start Screen", 18, 100, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True); gsm.foreground_clouds_group.draw(screen) 
+        draw_mode_select_screen(screen, gsm.selected_mode_option, gsm.dogfight_swarm_enabled); draw_text(screen, "ESC for Start Screen", 18, 100, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True); gsm.foreground_clouds_group.draw(screen) 
     elif gsm.game_state == config.STATE_RACE_LAPS_SELECT:
         draw_laps_select_screen(screen, gsm.selected_laps_option, gsm.lap_options); draw_text(screen, "ESC for Difficulty Select", 18, 120, config.SCREEN_HEIGHT - 30, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True); gsm.foreground_clouds_group.draw(screen) 
     elif gsm.game_state == config.STATE_TARGET_REACHED_OPTIONS: 
@@ -316,7 +355,7 @@ while running:
     elif gsm.game_state == config.STATE_RACE_POST_OPTIONS: 
         draw_race_post_options_screen(screen, gsm.time_taken_for_level, gsm.player_race_lap_times); gsm.foreground_clouds_group.draw(screen)
     elif gsm.game_state == config.STATE_DOGFIGHT_ROUND_COMPLETE:
-        draw_dogfight_round_complete_screen(screen, gsm.dogfight_current_round, gsm.time_taken_for_level); gsm.foreground_clouds_group.draw(screen)
+        draw_dogfight_round_complete_screen(screen, gsm.dogfight_current_round, gsm.time_taken_for_level, gsm.swarm_frame_meter if gsm.dogfight_swarm_enabled else None); gsm.foreground_clouds_group.draw(screen)
     elif gsm.game_state == config.STATE_DOGFIGHT_GAME_OVER_CONTINUE:
         draw_dogfight_game_over_continue_screen(screen, gsm.dogfight_current_round); gsm.foreground_clouds_group.draw(screen)
     elif gsm.game_state == config.STATE_DELIVERY_COMPLETE:
@@ -330,5 +369,8 @@ while running:
     elif gsm.game_state == config.STATE_GAME_OVER:
         draw_game_over_screen_content(screen, gsm.final_score, gsm.current_level, gsm.high_scores, config.current_game_mode, gsm.total_race_laps, gsm.dogfight_current_round, gsm.successful_deliveries_count); gsm.foreground_clouds_group.draw(screen)
 
+    if gsm.game_state == config.STATE_DOGFIGHT_PLAYING and gsm.dogfight_swarm_enabled:
+        gsm.swarm_frame_meter.add_frame((time.perf_counter() - frame_work_start) * 1000.0, len(gsm.dogfight_enemies_group),
+                                        gsm.tick_pipeline.tick_total_ms() + gsm.dogfight_hit_test_ms, glider_draw_ms)
     pygame.display.flip()
 pygame.quit()
\ No newline at end of file
@@ -4,25 +4,27 @@
 import pygame
 import math
 import random
+import threading
+from collections import OrderedDict, deque
+import numpy as np
 import config # Import constants
 
-map_tile_random_generator = random.Random() # For general tile noise
+_noise_thread_state = threading.local() # Per-thread random.Random for the compat noise backend
 _river_param_random = random.Random() # Specific generator for river parameters
 MAJOR_RIVERS_PARAMS = [] 
 
-def regenerate_river_parameters(seed_value=None): # Accept an optional seed
-    global MAJOR_RIVERS_PARAMS # _river_param_random is already in module scope
-    
+def build_river_parameters(seed_value=None, precompute_center_tile=None):
+    # Rivers and their span tables for a seed, without touching the live map (also used by the pre-bake processes)
     if seed_value is not None:
         _river_param_random.seed(seed_value) # Seed the internal generator
     
-    MAJOR_RIVERS_PARAMS = [] # Clear previous params
+    new_rivers_params = []
     for _ in range(config.NUM_MAJOR_RIVERS):
         start_tile_x = _river_param_random.uniform(-config.RACE_COURSE_AREA_HALFWIDTH / config.TILE_SIZE / 3, 
                                                  config.RACE_COURSE_AREA_HALFWIDTH / config.TILE_SIZE / 3)
         start_tile_y = _river_param_random.uniform(-config.RACE_COURSE_AREA_HALFWIDTH / config.TILE_SIZE / 3, 
                                                  config.RACE_COURSE_AREA_HALFWIDTH / config.TILE_SIZE / 3)
-        MAJOR_RIVERS_PARAMS.append({
+        new_rivers_params.append({
             "amplitude": _river_param_random.uniform(10, 30), 
             "wavelength": _river_param_random.uniform(200, 450), 
             "phase_offset": _river_param_random.uniform(0, 2 * math.pi), 
@@ -31,21 +33,141 @@ def regenerate_river_parameters(seed_value=None): # Accept an optional seed
             "orientation": _river_param_random.choice(['horizontal', 'vertical']),
             "width": _river_param_random.randint(1, 2) 
         })
+    # Span tables for the course area (around the given unique tile), extended lazily beyond it
+    center_tile_x, center_tile_y = precompute_center_tile if precompute_center_tile is not None else (0, 0)
+    horizontal_spans = RiverSpanTable(new_rivers_params, 'horizontal')
+    vertical_spans = RiverSpanTable(new_rivers_params, 'vertical')
+    horizontal_spans.precompute(center_tile_x - config.RIVER_SPAN_PRECOMPUTE_HALFWIDTH_TILES, center_tile_x + config.RIVER_SPAN_PRECOMPUTE_HALFWIDTH_TILES)
+    vertical_spans.precompute(center_tile_y - config.RIVER_SPAN_PRECOMPUTE_HALFWIDTH_TILES, center_tile_y + config.RIVER_SPAN_PRECOMPUTE_HALFWIDTH_TILES)
+    return new_rivers_params, (horizontal_spans, vertical_spans)
+
+def regenerate_river_parameters(seed_value=None, precompute_center_tile=None): # Accept an optional seed
+    global MAJOR_RIVERS_PARAMS, river_span_tables # _river_param_random is already in module scope
+    # Built aside and swapped in as a whole, so the prefetch worker never sees a half-filled list
+    MAJOR_RIVERS_PARAMS, river_span_tables = build_river_parameters(seed_value, precompute_center_tile)
+    invalidate_terrain() # Pre-rendered chunks belong to the previous rivers
+
+# Rows covered by the horizontal rivers for each column of tiles (or columns covered by the vertical
+# rivers for each row), one inclusive (first, last) span per river, so the river test is a lookup
+class RiverSpanTable:
+    def __init__(self, rivers_params, orientation):
+        self.rivers = [params for params in rivers_params if params["orientation"] == orientation]
+        self.lines = {} # line index -> int64 array [river, first/last]; empty spans have first > last
+
+    def precompute(self, first_line, last_line):
+        for line in range(first_line, last_line + 1):
+            self.spans(line)
+
+    def spans(self, line):
+        line_spans = self.lines.get(line)
+        if line_spans is None:
+            if len(self.lines) >= config.RIVER_SPAN_TABLE_MAX_LINES:
+                self.lines.clear() # Long flights only; the lines around the glider are rebuilt on demand
+            line_spans = np.array([self._river_span(params, line) for params in self.rivers], dtype=np.int64).reshape(-1, 2)
+            self.lines[line] = line_spans
+        return line_spans
+
+    def _river_span(self, params, line):
+        # Same centre expression as the original per-tile test, and the span ends are checked with the
+        # same abs(tile - centre) < width comparison, so the spans reproduce it exactly
+        river_center_tile = params["amplitude"] * math.sin((line / params["wavelength"]) * 2 * math.pi + params["phase_offset"]) + (
+            params["base_y_offset"] if params["orientation"] == 'horizontal' else params["base_x_offset"])
+        width = params["width"]
+        first = math.floor(river_center_tile - width)
+        last = math.ceil(river_center_tile + width)
+        while first <= last and not abs(first - river_center_tile) < width: first += 1
+        while last >= first and not abs(last - river_center_tile) < width: last -= 1
+        return (first, last) if first <= last else (1, 0)
+
+    def contains(self, line, tile):
+        line_spans = self.spans(line)
+        return bool(((line_spans[:, 0] <= tile) & (tile <= line_spans[:, 1])).any())
+
+    def mask(self, line_tiles, across_tiles):
+        # Boolean [across, line] grid of the tiles inside any river
+        if not self.rivers:
+            return np.zeros((len(across_tiles), len(line_tiles)), dtype=bool)
+        line_spans = np.stack([self.spans(line) for line in line_tiles.tolist()]) # [line, river, first/last]
+        across = across_tiles[:, None, None]
+        return ((across >= line_spans[None, :, :, 0]) & (across <= line_spans[None, :, :, 1])).any(axis=2)
+
+river_span_tables = (RiverSpanTable([], 'horizontal'), RiverSpanTable([], 'vertical'))
+
+# Bumped whenever the terrain rules change; chunks generated under an older epoch are discarded, not cached
+terrain_generation_epoch = 0
+_terrain_cache_lock = threading.RLock() # Guards the chunk caches and the epoch against the prefetch worker
+
+def invalidate_terrain():
+    global terrain_generation_epoch
+    with _terrain_cache_lock:
+        terrain_generation_epoch += 1
+        terrain_chunk_cache.clear()
+    terrain_prefetcher.cancel_pending()
 
 def get_seeded_random_value_direct(unique_tile_x, unique_tile_y, scale, p_pair):
-    global map_tile_random_generator 
     scaled_x = math.floor(unique_tile_x / scale)
     scaled_y = math.floor(unique_tile_y / scale)
+    return get_seeded_random_value_for_cell(scaled_x, scaled_y, p_pair)
+
+def get_seeded_random_value_for_cell(scaled_x, scaled_y, p_pair):
+    return _NOISE_BACKENDS[active_noise_backend](scaled_x, scaled_y, p_pair)
+
+def _mersenne_compat_noise(scaled_x, scaled_y, p_pair):
+    map_tile_random_generator = getattr(_noise_thread_state, "map_tile_random_generator", None)
+    if map_tile_random_generator is None:
+        map_tile_random_generator = _noise_thread_state.map_tile_random_generator = random.Random()
     map_tile_random_generator.seed((scaled_x * p_pair[0]) ^ (scaled_y * p_pair[1]))
-    return map_tile_random_generator.random() 
+    return map_tile_random_generator.random()
+
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_INV_2_POW_53 = 1.0 / 9007199254740992.0
+
+def _splitmix64(value):
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+def _splitmix64_noise(scaled_x, scaled_y, p_pair):
+    mixed = _splitmix64((scaled_x * p_pair[0]) & _MASK_64)
+    mixed = _splitmix64(mixed ^ ((scaled_y * p_pair[1]) & _MASK_64))
+    return (mixed >> 11) * _INV_2_POW_53 # Top 53 bits -> [0, 1), like Random.random()
+
+def _splitmix64_array(values):
+    # uint64 arithmetic wraps modulo 2**64, matching the masked scalar version
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
 
-def get_land_type_at_world_pos(world_x, world_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_cache_param):
+def _splitmix64_noise_array(scaled_xs, scaled_ys, p_pair):
+    # Vectorized _splitmix64_noise over a column vector of scaled_ys and a row vector of scaled_xs
+    mixed_x = _splitmix64_array(scaled_xs.astype(np.uint64) * np.uint64(p_pair[0]))
+    mixed = _splitmix64_array(mixed_x[None, :] ^ (scaled_ys.astype(np.uint64) * np.uint64(p_pair[1]))[:, None])
+    return (mixed >> np.uint64(11)).astype(np.float64) * _INV_2_POW_53
+
+_NOISE_BACKENDS = {
+    config.MAP_NOISE_BACKEND_COMPAT: _mersenne_compat_noise,
+    config.MAP_NOISE_BACKEND_HASH: _splitmix64_noise,
+}
+active_noise_backend = config.MAP_NOISE_BACKEND_COMPAT
+
+def set_noise_backend(backend_name):
+    global active_noise_backend
+    if backend_name not in _NOISE_BACKENDS:
+        raise ValueError(f"Unknown map noise backend: {backend_name}")
+    if backend_name != active_noise_backend:
+        active_noise_backend = backend_name
+        invalidate_terrain() # Chunks were generated with the other backend
+
+def get_land_type_at_world_pos(world_x, world_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param=None):
     unique_tile_x = math.floor((world_x + current_map_offset_x_param) / config.TILE_SIZE)
     unique_tile_y = math.floor((world_y + current_map_offset_y_param) / config.TILE_SIZE)
-    cache_key = (unique_tile_x, unique_tile_y)
-    if cache_key in tile_type_cache_param:
-        return tile_type_cache_param[cache_key]
-    
+    if tile_type_store_param is not None:
+        return tile_type_store_param.get_tile(unique_tile_x, unique_tile_y)
+    return get_land_type_at_unique_tile(unique_tile_x, unique_tile_y)
+
+def get_land_type_at_unique_tile(unique_tile_x, unique_tile_y):
     e_continent = get_seeded_random_value_direct(unique_tile_x, unique_tile_y, config.ELEVATION_CONTINENT_SCALE, config.P_CONT)
     e_mountain  = get_seeded_random_value_direct(unique_tile_x, unique_tile_y, config.ELEVATION_MOUNTAIN_SCALE, config.P_MNT)
     e_hill      = get_seeded_random_value_direct(unique_tile_x, unique_tile_y, config.ELEVATION_HILL_SCALE, config.P_HILL)
@@ -83,35 +205,599 @@ def get_land_type_at_world_pos(world_x, world_y, current_map_offset_x_param, cur
     can_have_river = final_type not in (config.LAND_TYPE_MOUNTAIN_PEAK, config.LAND_TYPE_WATER_DEEP) and \
                      not (final_type == config.LAND_TYPE_SAND_DESERT and moisture < DESERT_THRESH * 0.75)
     if can_have_river:
-        for params in MAJOR_RIVERS_PARAMS: 
-            if params["orientation"] == 'horizontal':
-                river_center_y_tile = params["amplitude"] * math.sin((unique_tile_x / params["wavelength"]) * 2 * math.pi + params["phase_offset"]) + params["base_y_offset"]
-                if abs(unique_tile_y - river_center_y_tile) < params["width"]:
-                    final_type = config.LAND_TYPE_RIVER
-                    break
-            else: 
-                river_center_x_tile = params["amplitude"] * math.sin((unique_tile_y / params["wavelength"]) * 2 * math.pi + params["phase_offset"]) + params["base_x_offset"]
-                if abs(unique_tile_x - river_center_x_tile) < params["width"]:
-                    final_type = config.LAND_TYPE_RIVER
-                    break
+        horizontal_spans, vertical_spans = river_span_tables
+        if horizontal_spans.contains(unique_tile_x, unique_tile_y) or vertical_spans.contains(unique_tile_y, unique_tile_x):
+            final_type = config.LAND_TYPE_RIVER
     
-    tile_type_cache_param[cache_key] = final_type
     return final_type
 
-def draw_endless_map(surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_cache_param):
-    start_world_tile_x_coord = math.floor(cam_x / config.TILE_SIZE) * config.TILE_SIZE
-    start_world_tile_y_coord = math.floor(cam_y / config.TILE_SIZE) * config.TILE_SIZE
-    num_tiles_x = config.SCREEN_WIDTH // config.TILE_SIZE + 2
-    num_tiles_y = config.SCREEN_HEIGHT // config.TILE_SIZE + 2
-
-    for i in range(num_tiles_y): 
-        for j in range(num_tiles_x): 
-            current_tile_world_x = start_world_tile_x_coord + j * config.TILE_SIZE
-            current_tile_world_y = start_world_tile_y_coord + i * config.TILE_SIZE
-            tile_screen_x = current_tile_world_x - cam_x
-            tile_screen_y = current_tile_world_y - cam_y
-            tile_type = get_land_type_at_world_pos(current_tile_world_x, current_tile_world_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_cache_param)
-            color = config.LAND_TYPE_COLORS.get(tile_type, config.PASTEL_BLACK) 
-            pygame.draw.rect(surface, color, (tile_screen_x, tile_screen_y, config.TILE_SIZE, config.TILE_SIZE))
-            if config.MAP_TILE_OUTLINE_WIDTH > 0:
-                pygame.draw.rect(surface, config.MAP_TILE_OUTLINE_COLOR, (tile_screen_x, tile_screen_y, config.TILE_SIZE, config.TILE_SIZE), config.MAP_TILE_OUTLINE_WIDTH)
+def _noise_grid_for_tile_rect(tile_xs, tile_ys, scale, p_pair):
+    # Noise is constant over each scale x scale cell, so only the few distinct cells
+    # in the rectangle are evaluated (with the scalar generator, keeping results identical)
+    scaled_xs = np.floor(tile_xs / scale).astype(np.int64)
+    scaled_ys = np.floor(tile_ys / scale).astype(np.int64)
+    unique_xs, x_index = np.unique(scaled_xs, return_inverse=True)
+    unique_ys, y_index = np.unique(scaled_ys, return_inverse=True)
+    if active_noise_backend == config.MAP_NOISE_BACKEND_HASH:
+        cell_values = _splitmix64_noise_array(unique_xs, unique_ys, p_pair)
+    else:
+        cell_values = np.array([[get_seeded_random_value_for_cell(int(sx), int(sy), p_pair) for sx in unique_xs] for sy in unique_ys], dtype=np.float64)
+    return cell_values[y_index[:, None], x_index[None, :]]
+
+def _pow_per_unique_value(values, exponent):
+    # math.pow on the distinct values only, so results match the scalar path bit for bit
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    powered = np.array([math.pow(v, exponent) for v in unique_values.tolist()], dtype=np.float64)
+    return powered[inverse].reshape(values.shape)
+
+def get_land_types_for_tile_rect(first_tile_x, first_tile_y, width, height):
+    # Bulk version of get_land_type_at_unique_tile for a rectangle of unique tile coordinates.
+    # Returns a (height, width) uint8 array indexed [row, column], identical to the per-tile results.
+    tile_xs = np.arange(first_tile_x, first_tile_x + width, dtype=np.int64)
+    tile_ys = np.arange(first_tile_y, first_tile_y + height, dtype=np.int64)
+
+    e_continent = _noise_grid_for_tile_rect(tile_xs, tile_ys, config.ELEVATION_CONTINENT_SCALE, config.P_CONT)
+    e_mountain  = _noise_grid_for_tile_rect(tile_xs, tile_ys, config.ELEVATION_MOUNTAIN_SCALE, config.P_MNT)
+    e_hill      = _noise_grid_for_tile_rect(tile_xs, tile_ys, config.ELEVATION_HILL_SCALE, config.P_HILL)
+    elevation = _pow_per_unique_value(0.50 * e_continent + 0.35 * e_mountain + 0.15 * e_hill, 1.8)
+    elevation = np.clip(elevation, 0.0, 1.0)
+
+    m_primary   = _noise_grid_for_tile_rect(tile_xs, tile_ys, config.MOISTURE_PRIMARY_SCALE, config.P_MOIST_P)
+    m_secondary = _noise_grid_for_tile_rect(tile_xs, tile_ys, config.MOISTURE_SECONDARY_SCALE, config.P_MOIST_S)
+    moisture = _pow_per_unique_value(0.7 * m_primary + 0.3 * m_secondary, 1.2)
+    moisture = np.clip(moisture, 0.0, 1.0)
+
+    # Same precedence as the if/elif chain in get_land_type_at_world_pos
+    final_types = np.select(
+        [elevation < config.DEEP_WATER_THRESH,
+         elevation < config.SHALLOW_WATER_THRESH,
+         (elevation < config.BEACH_THRESH) & (moisture < config.DESERT_THRESH * 1.2),
+         elevation < config.BEACH_THRESH,
+         elevation > config.MOUNTAIN_PEAK_THRESH,
+         elevation > config.MOUNTAIN_BASE_THRESH,
+         moisture < config.DESERT_THRESH,
+         moisture < config.GRASSLAND_THRESH,
+         moisture < config.TEMPERATE_FOREST_THRESH,
+         (moisture > 0.8) & (elevation < config.MOUNTAIN_BASE_THRESH * 0.9)],
+        [config.LAND_TYPE_WATER_DEEP,
+         config.LAND_TYPE_WATER_SHALLOW,
+         config.LAND_TYPE_SAND_DESERT,
+         config.LAND_TYPE_SAND_BEACH,
+         config.LAND_TYPE_MOUNTAIN_PEAK,
+         config.LAND_TYPE_MOUNTAIN_BASE,
+         config.LAND_TYPE_SAND_DESERT,
+         config.LAND_TYPE_GRASSLAND,
+         config.LAND_TYPE_PLAINS,
+         config.LAND_TYPE_FOREST_DENSE],
+        default=config.LAND_TYPE_FOREST_TEMPERATE).astype(np.uint8)
+
+    can_have_river = (final_types != config.LAND_TYPE_MOUNTAIN_PEAK) & (final_types != config.LAND_TYPE_WATER_DEEP) & \
+                     ~((final_types == config.LAND_TYPE_SAND_DESERT) & (moisture < config.DESERT_THRESH * 0.75))
+    horizontal_spans, vertical_spans = river_span_tables
+    if (horizontal_spans.rivers or vertical_spans.rivers) and can_have_river.any():
+        river_mask = horizontal_spans.mask(tile_xs, tile_ys) | vertical_spans.mask(tile_ys, tile_xs).T
+        final_types[river_mask & can_have_river] = config.LAND_TYPE_RIVER
+
+    return final_types
+
+_runway_suitable_lookup = np.zeros(256, dtype=bool)
+_runway_suitable_lookup[config.RUNWAY_SUITABLE_LAND_TYPES] = True
+
+# Land types for whole MAP_CHUNK_TILES x MAP_CHUNK_TILES chunks of unique tile coordinates, one uint8 array
+# per chunk, bounded to max_chunks with the least recently used chunks evicted first
+class TileTypeStore:
+    def __init__(self, max_chunks=config.TILE_TYPE_STORE_MAX_CHUNKS):
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict() # (chunk_x, chunk_y) -> uint8 array [row, column], oldest first
+        self.suitable_tiles = {} # (chunk_x, chunk_y) -> flat row * MAP_CHUNK_TILES + column indices of runway-suitable tiles
+        self.disk_cache = None # Optional TerrainDiskCache for the current map seed
+        self.prebake = None # Optional CourseAreaPrebake filling this store in the background
+        self.epoch = terrain_generation_epoch
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def clear(self):
+        with _terrain_cache_lock:
+            self.chunks.clear()
+            self.suitable_tiles.clear()
+
+    def attach_disk_cache(self, disk_cache):
+        # Attach after the map's rivers are set: chunks are only written under the epoch they were made in
+        with _terrain_cache_lock:
+            if self.disk_cache is not None and self.disk_cache is not disk_cache:
+                self.disk_cache.close()
+            self.disk_cache = disk_cache
+
+    def __contains__(self, chunk_key):
+        return self.epoch == terrain_generation_epoch and chunk_key in self.chunks
+
+    def peek_chunk(self, chunk_x, chunk_y):
+        key = (chunk_x, chunk_y)
+        with _terrain_cache_lock:
+            if self.epoch != terrain_generation_epoch:
+                return None
+            tile_types = self.chunks.get(key)
+            if tile_types is not None:
+                self.chunks.move_to_end(key)
+            return tile_types
+
+    def _lookup_chunk(self, key):
+        # Caller holds _terrain_cache_lock; memory first, then the disk cache, never generated
+        if self.epoch != terrain_generation_epoch: # Terrain rules changed since these chunks were made
+            self.chunks.clear()
+            self.suitable_tiles.clear()
+            self.epoch = terrain_generation_epoch
+        tile_types = self.chunks.get(key)
+        if tile_types is not None:
+            self.hits += 1
+            self.chunks.move_to_end(key)
+            return tile_types
+        if self.disk_cache is not None:
+            tile_types = self.disk_cache.load_chunk(*key)
+            if tile_types is not None:
+                self.disk_loads += 1
+                self._insert_chunk(key, tile_types)
+        return tile_types
+
+    def get_cached_chunk(self, chunk_x, chunk_y):
+        with _terrain_cache_lock:
+            return self._lookup_chunk((chunk_x, chunk_y))
+
+    def get_chunk(self, chunk_x, chunk_y):
+        key = (chunk_x, chunk_y)
+        with _terrain_cache_lock:
+            tile_types = self._lookup_chunk(key)
+            if tile_types is not None:
+                return tile_types
+            self.misses += 1
+            generation_epoch = terrain_generation_epoch
+            prebake = self.prebake
+
+        # A chunk the pre-bake pool is already working on is waited for rather than generated twice
+        if prebake is not None:
+            tile_types = prebake.wait_for_chunk(key)
+            if tile_types is not None:
+                return tile_types
+
+        # Generated outside the lock so the prefetch worker never stalls the frame on a lookup
+        tile_types = get_land_types_for_tile_rect(chunk_x * config.MAP_CHUNK_TILES, chunk_y * config.MAP_CHUNK_TILES, config.MAP_CHUNK_TILES, config.MAP_CHUNK_TILES)
+        self.insert_generated_chunk(key, tile_types, generation_epoch)
+        return tile_types
+
+    def insert_generated_chunk(self, key, tile_types, generation_epoch):
+        # Dropped when the terrain rules changed while it was being generated
+        with _terrain_cache_lock:
+            if generation_epoch == terrain_generation_epoch and key not in self.chunks:
+                self._insert_chunk(key, tile_types)
+                if self.disk_cache is not None:
+                    self.disk_cache.save_chunk(key[0], key[1], tile_types)
+
+    def _insert_chunk(self, key, tile_types):
+        # Caller holds _terrain_cache_lock
+        self.chunks[key] = tile_types
+        self.suitable_tiles[key] = np.flatnonzero(_runway_suitable_lookup[tile_types])
+        while len(self.chunks) > self.max_chunks:
+            evicted_key, _ = self.chunks.popitem(last=False)
+            self.suitable_tiles.pop(evicted_key, None)
+            self.evictions += 1
+
+    def get_suitable_tiles(self, chunk_x, chunk_y):
+        tile_types = self.get_chunk(chunk_x, chunk_y)
+        suitable = self.suitable_tiles.get((chunk_x, chunk_y))
+        if suitable is None: # Generated under a stale epoch, so it was never indexed
+            suitable = np.flatnonzero(_runway_suitable_lookup[tile_types])
+        return suitable
+
+    def get_tile(self, unique_tile_x, unique_tile_y):
+        chunk_x, local_x = divmod(unique_tile_x, config.MAP_CHUNK_TILES)
+        chunk_y, local_y = divmod(unique_tile_y, config.MAP_CHUNK_TILES)
+        return int(self.get_chunk(chunk_x, chunk_y)[local_y, local_x])
+
+    def stats(self):
+        return {"chunks": len(self.chunks), "hits": self.hits, "misses": self.misses, "disk_loads": self.disk_loads, "evictions": self.evictions}
+
+def find_suitable_world_pos(existing_locations, required_min_distance_apart, area_halfwidth, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+    # Random point within +-area_halfwidth of the world origin on runway-suitable land, at least
+    # required_min_distance_apart from every existing location. Reads the per-chunk suitability index of
+    # every chunk in the area, so it costs the same every time and only returns None when no such land exists.
+    first_tile_x = math.floor((-area_halfwidth + current_map_offset_x_param) / config.TILE_SIZE)
+    last_tile_x = math.floor((area_halfwidth + current_map_offset_x_param) / config.TILE_SIZE)
+    first_tile_y = math.floor((-area_halfwidth + current_map_offset_y_param) / config.TILE_SIZE)
+    last_tile_y = math.floor((area_halfwidth + current_map_offset_y_param) / config.TILE_SIZE)
+    candidate_xs = []
+    candidate_ys = []
+    for chunk_y in range(first_tile_y // config.MAP_CHUNK_TILES, last_tile_y // config.MAP_CHUNK_TILES + 1):
+        for chunk_x in range(first_tile_x // config.MAP_CHUNK_TILES, last_tile_x // config.MAP_CHUNK_TILES + 1):
+            local_ys, local_xs = np.divmod(tile_type_store_param.get_suitable_tiles(chunk_x, chunk_y), config.MAP_CHUNK_TILES)
+            candidate_xs.append(local_xs + chunk_x * config.MAP_CHUNK_TILES)
+            candidate_ys.append(local_ys + chunk_y * config.MAP_CHUNK_TILES)
+    unique_tile_xs = np.concatenate(candidate_xs)
+    unique_tile_ys = np.concatenate(candidate_ys)
+
+    # One random point inside each suitable tile, kept only if it is in the area and really lands on that tile
+    point_rng = np.random.default_rng(random.getrandbits(64)) # Follows the random module's seed
+    world_xs = (unique_tile_xs + point_rng.random(len(unique_tile_xs))) * config.TILE_SIZE - current_map_offset_x_param
+    world_ys = (unique_tile_ys + point_rng.random(len(unique_tile_ys))) * config.TILE_SIZE - current_map_offset_y_param
+    usable = (np.abs(world_xs) <= area_halfwidth) & (np.abs(world_ys) <= area_halfwidth) & \
+             (np.floor((world_xs + current_map_offset_x_param) / config.TILE_SIZE) == unique_tile_xs) & \
+             (np.floor((world_ys + current_map_offset_y_param) / config.TILE_SIZE) == unique_tile_ys)
+    for loc_x, loc_y in existing_locations:
+        usable &= np.hypot(world_xs - loc_x, world_ys - loc_y) >= required_min_distance_apart
+    usable_indices = np.flatnonzero(usable)
+    if len(usable_indices) == 0:
+        return None
+    chosen = usable_indices[random.randrange(len(usable_indices))]
+    return float(world_xs[chosen]), float(world_ys[chosen])
+
+# Pre-rendered terrain for the TileTypeStore chunks, evicted least recently used first
+class TerrainChunkCache:
+    def __init__(self, max_bytes=config.MAP_CHUNK_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.chunks = OrderedDict() # (chunk_x, chunk_y) -> Surface, oldest first
+        self.current_bytes = 0
+        self.evictions = 0
+
+    def clear(self):
+        with _terrain_cache_lock:
+            self.chunks.clear()
+            self.current_bytes = 0
+
+    def __contains__(self, chunk_key):
+        return chunk_key in self.chunks
+
+    def peek_chunk_surface(self, chunk_x, chunk_y):
+        key = (chunk_x, chunk_y)
+        with _terrain_cache_lock:
+            chunk_surface = self.chunks.get(key)
+            if chunk_surface is not None:
+                self.chunks.move_to_end(key)
+            return chunk_surface
+
+    def get_chunk_surface(self, chunk_x, chunk_y, target_surface, tile_type_store_param):
+        key = (chunk_x, chunk_y)
+        with _terrain_cache_lock:
+            chunk_surface = self.chunks.get(key)
+            if chunk_surface is not None:
+                self.chunks.move_to_end(key)
+                return chunk_surface
+            generation_epoch = terrain_generation_epoch
+
+        chunk_surface = render_terrain_chunk(tile_type_store_param.get_chunk(chunk_x, chunk_y), target_surface)
+        with _terrain_cache_lock:
+            if generation_epoch == terrain_generation_epoch:
+                self.chunks[key] = chunk_surface
+                self.current_bytes += chunk_surface.get_bytesize() * chunk_surface.get_width() * chunk_surface.get_height()
+                while self.current_bytes > self.max_bytes and len(self.chunks) > 1:
+                    _, evicted_surface = self.chunks.popitem(last=False)
+                    self.current_bytes -= evicted_surface.get_bytesize() * evicted_surface.get_width() * evicted_surface.get_height()
+                    self.evictions += 1
+        return chunk_surface
+
+terrain_chunk_cache = TerrainChunkCache()
+
+# Land type -> mapped pixel value tables, one per surface pixel format
+_land_type_pixel_tables = {}
+
+def _land_type_pixel_table(chunk_surface):
+    format_key = (chunk_surface.get_bitsize(), chunk_surface.get_masks())
+    pixel_table = _land_type_pixel_tables.get(format_key)
+    if pixel_table is None:
+        pixel_table = np.array([chunk_surface.map_rgb(config.LAND_TYPE_COLORS.get(land_type, config.PASTEL_BLACK)) for land_type in range(256)], dtype=np.uint32)
+        _land_type_pixel_tables[format_key] = pixel_table
+    return pixel_table
+
+def render_terrain_chunk(tile_types, target_surface):
+    chunk_pixel_size = config.MAP_CHUNK_TILES * config.TILE_SIZE
+    # Matching the target's pixel format keeps the per-frame blit a plain copy
+    chunk_surface = pygame.Surface((chunk_pixel_size, chunk_pixel_size), 0, target_surface)
+    # Same pixels as a filled rect plus outline per tile, written straight into the surface as
+    # [tile row, pixel row, tile column, pixel column], which keeps the work off the interpreter (and the GIL)
+    tile_pixels = pygame.surfarray.pixels2d(chunk_surface).T.reshape(config.MAP_CHUNK_TILES, config.TILE_SIZE, config.MAP_CHUNK_TILES, config.TILE_SIZE)
+    tile_pixels[...] = _land_type_pixel_table(chunk_surface)[tile_types][:, None, :, None]
+    outline_width = config.MAP_TILE_OUTLINE_WIDTH
+    if outline_width > 0:
+        outline_pixel = chunk_surface.map_rgb(config.MAP_TILE_OUTLINE_COLOR)
+        tile_pixels[:, :outline_width] = outline_pixel
+        tile_pixels[:, -outline_width:] = outline_pixel
+        tile_pixels[:, :, :, :outline_width] = outline_pixel
+        tile_pixels[:, :, :, -outline_width:] = outline_pixel
+    del tile_pixels # Unlocks the surface
+    return chunk_surface
+
+def _chunk_range_for_view(view_x, view_y, view_width, view_height, offset_tile_x, offset_tile_y):
+    # World tile k has unique tile index k + offset_tile, so chunks stay aligned to the world tile grid
+    first_chunk_x = (math.floor(view_x / config.TILE_SIZE) + offset_tile_x) // config.MAP_CHUNK_TILES
+    first_chunk_y = (math.floor(view_y / config.TILE_SIZE) + offset_tile_y) // config.MAP_CHUNK_TILES
+    last_chunk_x = (math.floor((view_x + view_width) / config.TILE_SIZE) + offset_tile_x) // config.MAP_CHUNK_TILES
+    last_chunk_y = (math.floor((view_y + view_height) / config.TILE_SIZE) + offset_tile_y) // config.MAP_CHUNK_TILES
+    return first_chunk_x, first_chunk_y, last_chunk_x, last_chunk_y
+
+# Predicts which chunks the viewport will cross from the player's heading, speed and the wind, and
+# generates and pre-renders them on a daemon thread so draw_endless_map only has to blit
+class TerrainPrefetcher:
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.urgent = deque() # Chunks already on screen without a surface, served first
+        self.predicted = deque() # Chunks along the predicted track, nearest first
+        self.tile_type_store = None
+        self.target_surface = None
+        self.thread = None
+        self.chunks_prefetched = 0
+        self.placeholders_drawn = 0
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if not self.is_running():
+            self.thread = threading.Thread(target=self._run, name="TerrainPrefetcher", daemon=True)
+            self.thread.start()
+
+    def cancel_pending(self):
+        with self.condition:
+            self.urgent.clear()
+            self.predicted.clear()
+
+    def request_chunk(self, chunk_x, chunk_y, tile_type_store_param, target_surface):
+        with self.condition:
+            self.tile_type_store = tile_type_store_param
+            if target_surface is not None: # None when only the land types are wanted
+                self.target_surface = target_surface
+            if (chunk_x, chunk_y) not in self.urgent:
+                self.urgent.append((chunk_x, chunk_y))
+                self.condition.notify()
+
+    def update(self, world_x, world_y, heading, speed, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param, target_surface):
+        if not config.TERRAIN_PREFETCH_ENABLED:
+            return
+        self.start()
+        offset_tile_x = math.floor(current_map_offset_x_param / config.TILE_SIZE)
+        offset_tile_y = math.floor(current_map_offset_y_param / config.TILE_SIZE)
+        heading_rad = math.radians(heading)
+        velocity_x = speed * math.cos(heading_rad) + config.current_wind_speed_x
+        velocity_y = speed * math.sin(heading_rad) + config.current_wind_speed_y
+        margin = config.TERRAIN_PREFETCH_MARGIN_TILES * config.TILE_SIZE
+
+        wanted_chunks = []
+        seen_chunks = set()
+        for sample in range(1, config.TERRAIN_PREFETCH_SAMPLES + 1):
+            frames_ahead = config.TERRAIN_PREFETCH_LOOKAHEAD_FRAMES * sample / config.TERRAIN_PREFETCH_SAMPLES
+            # The camera stays centred on the player, so the predicted viewport follows the predicted position
+            view_x = world_x + velocity_x * frames_ahead - config.SCREEN_WIDTH // 2 - margin
+            view_y = world_y + velocity_y * frames_ahead - config.SCREEN_HEIGHT // 2 - margin
+            first_chunk_x, first_chunk_y, last_chunk_x, last_chunk_y = _chunk_range_for_view(
+                view_x, view_y, config.SCREEN_WIDTH + 2 * margin, config.SCREEN_HEIGHT + 2 * margin, offset_tile_x, offset_tile_y)
+            for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+                for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+                    chunk_key = (chunk_x, chunk_y)
+                    if chunk_key not in seen_chunks and not self._chunk_ready(chunk_key, tile_type_store_param):
+                        seen_chunks.add(chunk_key)
+                        wanted_chunks.append(chunk_key)
+
+        with self.condition:
+            self.tile_type_store = tile_type_store_param
+            self.target_surface = target_surface
+            self.predicted = deque(wanted_chunks) # The newest prediction replaces the old one
+            if wanted_chunks:
+                self.condition.notify()
+
+    def _chunk_ready(self, chunk_key, tile_type_store_param):
+        # The palette renderer only needs land types; the chunk renderers need the rendered surface
+        if config.MAP_RENDER_MODE == config.MAP_RENDER_MODE_PALETTE:
+            return chunk_key in tile_type_store_param
+        return chunk_key in terrain_chunk_cache
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.urgent and not self.predicted:
+                    self.condition.wait()
+                chunk_x, chunk_y = (self.urgent or self.predicted).popleft()
+                tile_type_store_param = self.tile_type_store
+                target_surface = self.target_surface
+            try:
+                if config.MAP_RENDER_MODE == config.MAP_RENDER_MODE_PALETTE:
+                    tile_type_store_param.get_chunk(chunk_x, chunk_y)
+                else:
+                    terrain_chunk_cache.get_chunk_surface(chunk_x, chunk_y, target_surface, tile_type_store_param)
+            except Exception as e: # The renderer falls back to drawing synchronously once this thread is gone
+                print(f"Terrain prefetch stopped: {e}")
+                return
+            self.chunks_prefetched += 1
+
+terrain_prefetcher = TerrainPrefetcher()
+
+def warm_terrain_chunks(cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+    # Renders the given view synchronously, so a new level opens without placeholder chunks
+    target_surface = pygame.display.get_surface()
+    if target_surface is None:
+        return
+    offset_tile_x = math.floor(current_map_offset_x_param / config.TILE_SIZE)
+    offset_tile_y = math.floor(current_map_offset_y_param / config.TILE_SIZE)
+    first_chunk_x, first_chunk_y, last_chunk_x, last_chunk_y = _chunk_range_for_view(
+        cam_x, cam_y, config.SCREEN_WIDTH, config.SCREEN_HEIGHT, offset_tile_x, offset_tile_y)
+    for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+        for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+            terrain_chunk_cache.get_chunk_surface(chunk_x, chunk_y, target_surface, tile_type_store_param)
+
+def _draw_terrain_chunks(surface, view_rect, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+    # Blits every chunk overlapping view_rect (in surface coordinates); returns how many were placeholders
+    view_x, view_y, view_width, view_height = view_rect
+    offset_tile_x = math.floor(current_map_offset_x_param / config.TILE_SIZE)
+    offset_tile_y = math.floor(current_map_offset_y_param / config.TILE_SIZE)
+    first_chunk_x, first_chunk_y, last_chunk_x, last_chunk_y = _chunk_range_for_view(
+        cam_x + view_x, cam_y + view_y, view_width, view_height, offset_tile_x, offset_tile_y)
+    chunk_pixel_size = config.MAP_CHUNK_TILES * config.TILE_SIZE
+    prefetching = config.TERRAIN_PREFETCH_ENABLED and terrain_prefetcher.is_running()
+    placeholders_drawn = 0
+
+    for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+        for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+            chunk_screen_x = math.floor((chunk_x * config.MAP_CHUNK_TILES - offset_tile_x) * config.TILE_SIZE - cam_x)
+            chunk_screen_y = math.floor((chunk_y * config.MAP_CHUNK_TILES - offset_tile_y) * config.TILE_SIZE - cam_y)
+            chunk_surface = terrain_chunk_cache.peek_chunk_surface(chunk_x, chunk_y)
+            if chunk_surface is None:
+                if prefetching:
+                    # Not ready yet: move it to the front of the worker's queue and show plain ground meanwhile
+                    terrain_prefetcher.request_chunk(chunk_x, chunk_y, tile_type_store_param, surface)
+                    surface.fill(config.PASTEL_PLAINS, (chunk_screen_x, chunk_screen_y, chunk_pixel_size, chunk_pixel_size))
+                    placeholders_drawn += 1
+                    continue
+                chunk_surface = terrain_chunk_cache.get_chunk_surface(chunk_x, chunk_y, surface, tile_type_store_param)
+            surface.blit(chunk_surface, (chunk_screen_x, chunk_screen_y))
+    terrain_prefetcher.placeholders_drawn += placeholders_drawn
+    return placeholders_drawn
+
+# Keeps last frame's terrain and scrolls it by the whole-pixel camera delta, so only the newly
+# exposed edge strips are drawn; anything that invalidates the old pixels forces a full redraw
+class ScrollingTerrainRenderer:
+    def __init__(self):
+        self.terrain_surface = None
+        self.last_cam = None # Whole-pixel camera of the last frame drawn
+        self.last_map_key = None # (map offsets, store, terrain epoch) the pixels were drawn for
+        self.needs_full_redraw = True
+        self.full_redraws = 0
+        self.strip_redraws = 0
+
+    def invalidate(self):
+        self.needs_full_redraw = True
+
+    def draw(self, surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+        # Chunks sit at floor(world - cam) = world - ceil(cam), so the ceiled camera gives the same pixels as chunk mode
+        cam_px = math.ceil(cam_x)
+        cam_py = math.ceil(cam_y)
+        width, height = surface.get_size()
+        map_key = (current_map_offset_x_param, current_map_offset_y_param, id(tile_type_store_param), terrain_generation_epoch)
+        if self.terrain_surface is None or self.terrain_surface.get_size() != (width, height):
+            self.terrain_surface = pygame.Surface((width, height), 0, surface)
+            self.needs_full_redraw = True
+
+        if not self.needs_full_redraw and map_key == self.last_map_key:
+            delta_x = cam_px - self.last_cam[0]
+            delta_y = cam_py - self.last_cam[1]
+            if abs(delta_x) > config.MAP_SCROLL_FULL_REDRAW_DELTA or abs(delta_y) > config.MAP_SCROLL_FULL_REDRAW_DELTA:
+                self.needs_full_redraw = True # Level start, teleport or respawn: the old pixels are no use
+
+        placeholders_drawn = 0
+        if self.needs_full_redraw or map_key != self.last_map_key:
+            placeholders_drawn = _draw_terrain_chunks(self.terrain_surface, (0, 0, width, height), cam_px, cam_py,
+                                                      current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param)
+            self.full_redraws += 1
+        elif delta_x or delta_y:
+            self.terrain_surface.scroll(-delta_x, -delta_y)
+            exposed_strips = []
+            if delta_x > 0: exposed_strips.append((width - delta_x, 0, delta_x, height))
+            elif delta_x < 0: exposed_strips.append((0, 0, -delta_x, height))
+            if delta_y > 0: exposed_strips.append((0, height - delta_y, width, delta_y))
+            elif delta_y < 0: exposed_strips.append((0, 0, width, -delta_y))
+            for strip_rect in exposed_strips:
+                self.terrain_surface.set_clip(strip_rect)
+                placeholders_drawn += _draw_terrain_chunks(self.terrain_surface, strip_rect, cam_px, cam_py,
+                                                           current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param)
+            self.terrain_surface.set_clip(None)
+            self.strip_redraws += 1
+
+        # Placeholder ground would otherwise scroll along with the real terrain
+        self.needs_full_redraw = placeholders_drawn > 0
+        self.last_cam = (cam_px, cam_py)
+        self.last_map_key = map_key
+        surface.blit(self.terrain_surface, (0, 0))
+
+scrolling_terrain_renderer = ScrollingTerrainRenderer()
+
+# Palette for the 8-bit terrain surfaces: index = land type, plus two reserved entries for the outline grid
+_PALETTE_GRID_TRANSPARENT_INDEX = 254
+_PALETTE_OUTLINE_INDEX = 255
+_land_type_palette = [config.LAND_TYPE_COLORS.get(land_type, config.PASTEL_BLACK) for land_type in range(256)]
+_land_type_palette[_PALETTE_GRID_TRANSPARENT_INDEX] = (255, 0, 255) # Unique colour, used only as the grid's colorkey
+_land_type_palette[_PALETTE_OUTLINE_INDEX] = config.MAP_TILE_OUTLINE_COLOR
+
+# Writes one pixel per visible tile into an 8-bit surface whose palette maps land types to their colours,
+# scales it up by TILE_SIZE in one transform.scale call and stamps a cached outline grid on top
+class PaletteTerrainRenderer:
+    def __init__(self):
+        self.tile_types = None # uint8 [row, column] of the visible tiles
+        self.index_surface = None # One pixel per tile
+        self.scaled_surface = None # One TILE_SIZE block per tile
+        self.outline_grid = None
+
+    def _ensure_surfaces(self, tiles_wide, tiles_high):
+        if self.index_surface is not None and self.index_surface.get_size() == (tiles_wide, tiles_high):
+            return
+        self.tile_types = np.empty((tiles_high, tiles_wide), dtype=np.uint8)
+        self.index_surface = pygame.Surface((tiles_wide, tiles_high), 0, 8)
+        self.index_surface.set_palette(_land_type_palette)
+        scaled_size = (tiles_wide * config.TILE_SIZE, tiles_high * config.TILE_SIZE)
+        self.scaled_surface = pygame.Surface(scaled_size, 0, 8)
+        self.scaled_surface.set_palette(_land_type_palette)
+        self.outline_grid = None
+        if config.MAP_TILE_OUTLINE_WIDTH > 0:
+            self.outline_grid = pygame.Surface(scaled_size, 0, 8)
+            self.outline_grid.set_palette(_land_type_palette)
+            self.outline_grid.fill(_PALETTE_GRID_TRANSPARENT_INDEX)
+            self.outline_grid.set_colorkey(_PALETTE_GRID_TRANSPARENT_INDEX, pygame.RLEACCEL) # Mostly transparent, so RLE blits fast
+            for i in range(tiles_high):
+                for j in range(tiles_wide):
+                    tile_rect = (j * config.TILE_SIZE, i * config.TILE_SIZE, config.TILE_SIZE, config.TILE_SIZE)
+                    pygame.draw.rect(self.outline_grid, _PALETTE_OUTLINE_INDEX, tile_rect, config.MAP_TILE_OUTLINE_WIDTH)
+
+    def _gather_tile_types(self, first_tile_x, first_tile_y, tile_type_store_param):
+        # Copies the visible window out of the store's chunks; returns how many chunks were placeholders
+        tiles_high, tiles_wide = self.tile_types.shape
+        chunk_tiles = config.MAP_CHUNK_TILES
+        prefetching = config.TERRAIN_PREFETCH_ENABLED and terrain_prefetcher.is_running()
+        placeholders_drawn = 0
+        for chunk_y in range(first_tile_y // chunk_tiles, (first_tile_y + tiles_high - 1) // chunk_tiles + 1):
+            for chunk_x in range(first_tile_x // chunk_tiles, (first_tile_x + tiles_wide - 1) // chunk_tiles + 1):
+                chunk_types = tile_type_store_param.peek_chunk(chunk_x, chunk_y)
+                if chunk_types is None and prefetching:
+                    terrain_prefetcher.request_chunk(chunk_x, chunk_y, tile_type_store_param, None)
+                    placeholders_drawn += 1
+                elif chunk_types is None:
+                    chunk_types = tile_type_store_param.get_chunk(chunk_x, chunk_y)
+                start_x = max(first_tile_x, chunk_x * chunk_tiles)
+                end_x = min(first_tile_x + tiles_wide, (chunk_x + 1) * chunk_tiles)
+                start_y = max(first_tile_y, chunk_y * chunk_tiles)
+                end_y = min(first_tile_y + tiles_high, (chunk_y + 1) * chunk_tiles)
+                window = self.tile_types[start_y - first_tile_y:end_y - first_tile_y, start_x - first_tile_x:end_x - first_tile_x]
+                if chunk_types is None:
+                    window[...] = config.LAND_TYPE_PLAINS
+                else:
+                    window[...] = chunk_types[start_y - chunk_y * chunk_tiles:end_y - chunk_y * chunk_tiles,
+                                              start_x - chunk_x * chunk_tiles:end_x - chunk_x * chunk_tiles]
+        terrain_prefetcher.placeholders_drawn += placeholders_drawn
+        return placeholders_drawn
+
+    def draw(self, surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+        # Fixed size (one spare tile each way) so the surfaces are never reallocated while scrolling
+        self._ensure_surfaces(config.SCREEN_WIDTH // config.TILE_SIZE + 2, config.SCREEN_HEIGHT // config.TILE_SIZE + 2)
+        first_world_tile_x = math.floor(cam_x / config.TILE_SIZE)
+        first_world_tile_y = math.floor(cam_y / config.TILE_SIZE)
+        first_tile_x = first_world_tile_x + math.floor(current_map_offset_x_param / config.TILE_SIZE)
+        first_tile_y = first_world_tile_y + math.floor(current_map_offset_y_param / config.TILE_SIZE)
+        self._gather_tile_types(first_tile_x, first_tile_y, tile_type_store_param)
+
+        tile_indices = pygame.surfarray.pixels2d(self.index_surface)
+        tile_indices[...] = self.tile_types.T # surfarray indexes [x, y]
+        del tile_indices # Unlocks the surface
+        pygame.transform.scale(self.index_surface, self.scaled_surface.get_size(), self.scaled_surface)
+        if self.outline_grid is not None:
+            self.scaled_surface.blit(self.outline_grid, (0, 0))
+        surface.blit(self.scaled_surface, (math.floor(first_world_tile_x * config.TILE_SIZE - cam_x),
+                                           math.floor(first_world_tile_y * config.TILE_SIZE - cam_y)))
+
+palette_terrain_renderer = PaletteTerrainRenderer()
+
+def draw_endless_map(surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param):
+    if config.MAP_RENDER_MODE == config.MAP_RENDER_MODE_SCROLL:
+        scrolling_terrain_renderer.draw(surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param)
+    elif config.MAP_RENDER_MODE == config.MAP_RENDER_MODE_PALETTE:
+        palette_terrain_renderer.draw(surface, cam_x, cam_y, current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param)
+    else:
+        _draw_terrain_chunks(surface, (0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT), cam_x, cam_y,
+                             current_map_offset_x_param, current_map_offset_y_param, tile_type_store_param)
@@ -0,0 +1,196 @@
+# spatial_grid.py
+# Uniform grid over world positions, so code that only cares about one area of the world (the camera view,
+# a collision radius) can skip everything far away instead of looping over every entity.
+
+import math
+import pygame
+import config
+
+def sprite_world_position(sprite):
+    # Gliders keep world_x/world_y current every frame; everything else placed in the world has world_pos
+    if hasattr(sprite, "world_x"):
+        return sprite.world_x, sprite.world_y
+    return sprite.world_pos.x, sprite.world_pos.y
+
+class SpatialGrid:
+    def __init__(self, cell_size=config.SPATIAL_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # (cell_x, cell_y) -> set of items
+        self.item_cells = {} # item -> its cell
+        self.positions = {} # item -> (x, y) it was last inserted or moved to
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+    def _cell_of(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, item, x, y):
+        cell = self._cell_of(x, y)
+        self.item_cells[item] = cell
+        self.positions[item] = (x, y)
+        self.cells.setdefault(cell, set()).add(item)
+
+    def move(self, item, x, y):
+        # Cheap when the item stays in its cell, which is nearly every frame for anything that moves; called for
+        # every moving sprite every frame, so the cell lookup is inlined
+        self.positions[item] = (x, y)
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        old_cell = self.item_cells.get(item)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            self._discard_from_cell(item, old_cell)
+        self.item_cells[item] = cell
+        self.cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        self.positions.pop(item, None)
+        cell = self.item_cells.pop(item, None)
+        if cell is not None:
+            self._discard_from_cell(item, cell)
+
+    def _discard_from_cell(self, item, cell):
+        cell_items = self.cells[cell]
+        cell_items.discard(item)
+        if not cell_items:
+            del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+        self.positions.clear()
+
+    def query_rect(self, left, top, right, bottom):
+        # Items in every cell touching the rect; callers do their own exact test
+        first_cell_x, first_cell_y = self._cell_of(left, top)
+        last_cell_x, last_cell_y = self._cell_of(right, bottom)
+        found = []
+        if (last_cell_x - first_cell_x + 1) * (last_cell_y - first_cell_y + 1) > len(self.cells):
+            # A rect wider than the occupied world: walking the occupied cells is cheaper
+            for (cell_x, cell_y), cell_items in self.cells.items():
+                if first_cell_x <= cell_x <= last_cell_x and first_cell_y <= cell_y <= last_cell_y:
+                    found.extend(cell_items)
+            return found
+        for cell_y in range(first_cell_y, last_cell_y + 1):
+            for cell_x in range(first_cell_x, last_cell_x + 1):
+                cell_items = self.cells.get((cell_x, cell_y))
+                if cell_items:
+                    found.extend(cell_items)
+        return found
+
+    def query_radius(self, x, y, radius):
+        # Items whose position is closer than radius to (x, y)
+        radius_sq = radius * radius
+        positions = self.positions
+        found = []
+        for item in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            item_x, item_y = positions[item]
+            if (item_x - x) ** 2 + (item_y - y) ** 2 < radius_sq:
+                found.append(item)
+        return found
+
+    def query_near_points(self, points, reach):
+        # Items in any cell within reach of one of the (x, y) points, e.g. a volley of bullets; a candidate
+        # list for the caller's own exact test, each item once
+        span = math.ceil(reach / self.cell_size)
+        point_cells = {self._cell_of(x, y) for x, y in points}
+        near_cells = {(cell_x + dx, cell_y + dy) for cell_x, cell_y in point_cells
+                      for dx in range(-span, span + 1) for dy in range(-span, span + 1)}
+        found = []
+        for cell in near_cells:
+            cell_items = self.cells.get(cell)
+            if cell_items:
+                found.extend(cell_items)
+        return found
+
+    def query_pairs(self, distance):
+        # Every pair of items closer than distance, each pair once. A cell is only compared with itself and
+        # the neighbours after it, so no pair of cells is walked twice.
+        span = math.ceil(distance / self.cell_size)
+        distance_sq = distance * distance
+        positions = self.positions
+        forward_offsets = [(dx, dy) for dy in range(0, span + 1) for dx in range(-span, span + 1) if dy > 0 or dx > 0]
+        pairs = []
+        for (cell_x, cell_y), cell_items in self.cells.items():
+            cell_list = list(cell_items)
+            for i, item in enumerate(cell_list):
+                item_x, item_y = positions[item]
+                for other in cell_list[i + 1:]:
+                    other_x, other_y = positions[other]
+                    if (item_x - other_x) ** 2 + (item_y - other_y) ** 2 < distance_sq:
+                        pairs.append((item, other))
+            for dx, dy in forward_offsets:
+                other_items = self.cells.get((cell_x + dx, cell_y + dy))
+                if not other_items:
+                    continue
+                for item in cell_list:
+                    item_x, item_y = positions[item]
+                    for other in other_items:
+                        other_x, other_y = positions[other]
+                        if (item_x - other_x) ** 2 + (item_y - other_y) ** 2 < distance_sq:
+                            pairs.append((item, other))
+        return pairs
+
+# A sprite group indexed by world position, for proximity queries through its grid. Members are binned as
+# they join; gliders, the only members that move, are re-binned by refresh_positions() once they have moved.
+class IndexedGroup(pygame.sprite.Group):
+    def __init__(self, *sprites, cell_size=config.SPATIAL_GRID_CELL_SIZE):
+        self.grid = SpatialGrid(cell_size)
+        self.moving_sprites = set()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite, *sprite_world_position(sprite))
+        if hasattr(sprite, "world_x"):
+            self.moving_sprites.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+        self.moving_sprites.discard(sprite)
+
+    def refresh_positions(self, skip=()):
+        move = self.grid.move
+        for sprite in self.moving_sprites.difference(skip) if skip else self.moving_sprites: # All gliders, so world_x/world_y are current
+            move(sprite, sprite.world_x, sprite.world_y)
+
+# An indexed group whose draw() only positions and blits the sprites near the camera
+class CulledGroup(IndexedGroup):
+    def __init__(self, *sprites, cell_size=config.SPATIAL_GRID_CELL_SIZE):
+        self.draw_order = {} # sprite -> insertion number, so culled drawing keeps Group's order
+        self.next_draw_order = 0
+        self.drawn_count = 0
+        self.culled_count = 0
+        super().__init__(*sprites, cell_size=cell_size)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.draw_order[sprite] = self.next_draw_order
+        self.next_draw_order += 1
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.draw_order.pop(sprite, None)
+
+    def draw(self, surface, cam_x, cam_y, margin=config.CULL_MARGIN, far_sprites=()):
+        # far_sprites: moving sprites known to be well past the margin this frame (the LOD scheduler's far tiers).
+        # They keep their old cells, which at worst makes them candidates the exact test below culls.
+        self.refresh_positions(skip=far_sprites)
+        view_rect = surface.get_rect()
+        nearby = self.grid.query_rect(cam_x - margin, cam_y - margin, cam_x + view_rect.width + margin, cam_y + view_rect.height + margin)
+        nearby.sort(key=self.draw_order.__getitem__)
+        visible = []
+        for sprite in nearby:
+            world_x, world_y = sprite_world_position(sprite)
+            sprite.rect.center = (world_x - cam_x, world_y - cam_y)
+            if sprite.rect.colliderect(view_rect):
+                visible.append(sprite)
+        surface.blits([(sprite.image, sprite.rect) for sprite in visible], doreturn=False)
+        self.drawn_count = len(visible)
+        self.culled_count = len(self.spritedict) - len(visible)
+        return []
@@ -1,47 +1,205 @@
 import pygame
 import math
 import random
+import numpy as np
 import config # Import constants
 
-# --- Bullet Class ---
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, heading, owner_glider):
-        super().__init__()
-        self.owner = owner_glider # The glider that fired this bullet
-        self.image = pygame.Surface([6, 3], pygame.SRCALPHA) # Small rectangular bullet
-        self.image.fill(config.BULLET_COLOR)
-        self.original_image = self.image
-        self.rect = self.image.get_rect(center=(x, y))
-
-        self.world_x = float(x)
-        self.world_y = float(y)
-        self.heading = heading # Degrees
-        self.speed = config.BULLET_SPEED
-        self.range_traveled = 0
-        self.max_range = config.BULLET_RANGE
-
-        # Rotate bullet to match heading
-        self.image = pygame.transform.rotate(self.original_image, -self.heading)
-        self.rect = self.image.get_rect(center=(self.world_x, self.world_y))
-
+# --- Bullet Pool ---
+# Every live bullet is a row in parallel arrays, stepped in one vectorized pass per frame and drawn
+# from a shared table of pre-rotated images
+_BULLET_ARRAY_NAMES = ("world_x", "world_y", "previous_x", "previous_y", "step_x", "step_y", "range_traveled", "owner_id", "image_index")
+
+class BulletPool:
+    def __init__(self, capacity=config.BULLET_POOL_INITIAL_CAPACITY):
+        self.count = 0
+        self.world_x = np.zeros(capacity)
+        self.world_y = np.zeros(capacity)
+        self.previous_x = np.zeros(capacity) # Position before the last step, the start of each bullet's swept segment
+        self.previous_y = np.zeros(capacity)
+        self.step_x = np.zeros(capacity)
+        self.step_y = np.zeros(capacity)
+        self.range_traveled = np.zeros(capacity)
+        self.owner_id = np.zeros(capacity, dtype=np.int64) # id() of the glider that fired it
+        self.image_index = np.zeros(capacity, dtype=np.int16)
+        self.images = None
+        self.image_half_sizes = None
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def _build_images(self):
+        bullet_image = pygame.Surface([6, 3], pygame.SRCALPHA) # Small rectangular bullet
+        bullet_image.fill(config.BULLET_COLOR)
+        self.images = [pygame.transform.rotate(bullet_image, -i * config.BULLET_ROTATION_STEP_DEGREES)
+                       for i in range(360 // config.BULLET_ROTATION_STEP_DEGREES)]
+        self.image_half_sizes = np.array([image.get_size() for image in self.images]) // 2
+
+    def _grow(self):
+        for name in _BULLET_ARRAY_NAMES:
+            old_array = getattr(self, name)
+            new_array = np.zeros(len(old_array) * 2, dtype=old_array.dtype)
+            new_array[:self.count] = old_array[:self.count]
+            setattr(self, name, new_array)
+
+    def fire(self, x, y, heading, owner_glider):
+        if self.count == len(self.world_x):
+            self._grow()
+        i = self.count
+        heading_rad = math.radians(heading)
+        self.world_x[i] = self.previous_x[i] = x
+        self.world_y[i] = self.previous_y[i] = y
+        self.step_x[i] = config.BULLET_SPEED * math.cos(heading_rad)
+        self.step_y[i] = config.BULLET_SPEED * math.sin(heading_rad)
+        self.range_traveled[i] = 0
+        self.owner_id[i] = id(owner_glider)
+        self.image_index[i] = int(round(heading / config.BULLET_ROTATION_STEP_DEGREES)) % (360 // config.BULLET_ROTATION_STEP_DEGREES)
+        self.count += 1
+
+    def _keep(self, keep_mask):
+        kept = int(np.count_nonzero(keep_mask))
+        if kept != self.count:
+            for name in _BULLET_ARRAY_NAMES:
+                array = getattr(self, name)
+                array[:kept] = array[:self.count][keep_mask]
+            self.count = kept
 
     def update(self, cam_x, cam_y):
-        heading_rad = math.radians(self.heading)
-        self.world_x += self.speed * math.cos(heading_rad)
-        self.world_y += self.speed * math.sin(heading_rad)
-        self.range_traveled += self.speed
-
-        if self.range_traveled > self.max_range:
-            self.kill() # Remove bullet if out of range
-
-        self.rect.centerx = self.world_x - cam_x
-        self.rect.centery = self.world_y - cam_y
-
-        # Kill if off-screen (basic culling)
-        if not config.SCREEN_WIDTH * -0.1 < self.rect.centerx < config.SCREEN_WIDTH * 1.1 or \
-           not config.SCREEN_HEIGHT * -0.1 < self.rect.centery < config.SCREEN_HEIGHT * 1.1:
-            self.kill()
-
+        n = self.count
+        if n == 0:
+            return
+        self.previous_x[:n] = self.world_x[:n]
+        self.previous_y[:n] = self.world_y[:n]
+        self.world_x[:n] += self.step_x[:n]
+        self.world_y[:n] += self.step_y[:n]
+        self.range_traveled[:n] += config.BULLET_SPEED
+
+        # Out of range, or off-screen (basic culling)
+        screen_x = self.world_x[:n] - cam_x
+        screen_y = self.world_y[:n] - cam_y
+        self._keep((self.range_traveled[:n] <= config.BULLET_RANGE) &
+                   (screen_x > config.SCREEN_WIDTH * -0.1) & (screen_x < config.SCREEN_WIDTH * 1.1) &
+                   (screen_y > config.SCREEN_HEIGHT * -0.1) & (screen_y < config.SCREEN_HEIGHT * 1.1))
+
+    def positions(self, owner_glider=None):
+        # (x, y) of each live bullet, or only those fired by owner_glider
+        n = self.count
+        if owner_glider is None:
+            return zip(self.world_x[:n].tolist(), self.world_y[:n].tolist())
+        owned = self.owner_id[:n] == id(owner_glider)
+        return zip(self.world_x[:n][owned].tolist(), self.world_y[:n][owned].tolist())
+
+    def collide_gliders(self, gliders, owner_glider=None, exclude_owner=None):
+        # Tests each bullet's last step as a segment against the gliders' circles, so fast bullets can't pass
+        # through. Bullets that hit are removed; returns the glider hit by each one (a glider once per bullet).
+        n = self.count
+        if n == 0 or not gliders:
+            return []
+        candidates = np.ones(n, dtype=bool)
+        if owner_glider is not None:
+            candidates &= self.owner_id[:n] == id(owner_glider)
+        if exclude_owner is not None:
+            candidates &= self.owner_id[:n] != id(exclude_owner)
+        bullet_indices = np.flatnonzero(candidates)
+        if len(bullet_indices) == 0:
+            return []
+
+        start_x = self.previous_x[bullet_indices][:, None]
+        start_y = self.previous_y[bullet_indices][:, None]
+        segment_x = self.world_x[bullet_indices][:, None] - start_x
+        segment_y = self.world_y[bullet_indices][:, None] - start_y
+        glider_x = np.array([glider.world_x for glider in gliders])[None, :]
+        glider_y = np.array([glider.world_y for glider in gliders])[None, :]
+        hit_radius = np.array([glider.collision_radius + config.BULLET_HIT_RADIUS for glider in gliders])[None, :]
+
+        # Closest point of each segment to each glider centre
+        segment_length_sq = np.maximum(segment_x * segment_x + segment_y * segment_y, 1e-9)
+        t = np.clip(((glider_x - start_x) * segment_x + (glider_y - start_y) * segment_y) / segment_length_sq, 0.0, 1.0)
+        closest_dx = start_x + t * segment_x - glider_x
+        closest_dy = start_y + t * segment_y - glider_y
+        hits = closest_dx * closest_dx + closest_dy * closest_dy < hit_radius * hit_radius
+        if not hits.any():
+            return []
+
+        # A bullet stops at the first glider along its path
+        hit_rows = np.flatnonzero(hits.any(axis=1))
+        first_hit = np.where(hits[hit_rows], t[hit_rows], np.inf).argmin(axis=1)
+        keep_mask = np.ones(n, dtype=bool)
+        keep_mask[bullet_indices[hit_rows]] = False
+        self._keep(keep_mask)
+        return [gliders[glider_index] for glider_index in first_hit.tolist()]
+
+    def draw(self, surface, cam_x, cam_y):
+        n = self.count
+        if n == 0:
+            return
+        if self.images is None:
+            self._build_images()
+        image_index = self.image_index[:n]
+        top_left = np.stack((self.world_x[:n] - cam_x, self.world_y[:n] - cam_y), axis=1).astype(np.int32) - self.image_half_sizes[image_index]
+        images = self.images
+        surface.blits([(images[i], position) for i, position in zip(image_index.tolist(), top_left.tolist())], doreturn=False)
+
+
+# --- Contrails ---
+# Every glider's trail is stamped in one blits call from pre-rendered dots at CONTRAIL_ALPHA_LEVELS
+# alphas, so the trail actually fades towards its oldest points. Each trail is a ring of CONTRAIL_LENGTH
+# points in a NumPy array, so drawing joins whole arrays instead of walking the points one by one.
+_contrail_stamps = []
+
+def draw_contrails(surface, gliders, cam_x, cam_y):
+    if not _contrail_stamps:
+        for level in range(config.CONTRAIL_ALPHA_LEVELS):
+            # Colorkey plus surface alpha blits about three times faster than a per-pixel alpha dot
+            stamp = pygame.Surface((5, 5))
+            stamp.fill((0, 0, 0))
+            pygame.draw.circle(stamp, config.PASTEL_CONTRAIL_COLOR, (2, 2), 2)
+            stamp.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            stamp.set_alpha(int(200 * level / config.CONTRAIL_ALPHA_LEVELS), pygame.RLEACCEL)
+            _contrail_stamps.append(stamp)
+    # A trail can't stretch further behind its glider than the glider flies while laying it
+    stretch = config.CONTRAIL_LENGTH * config.CONTRAIL_POINT_DELAY * (config.MAX_SPEED + config.MAX_WIND_STRENGTH)
+    left, right = cam_x - stretch, cam_x + config.SCREEN_WIDTH + stretch
+    top, bottom = cam_y - stretch, cam_y + config.SCREEN_HEIGHT + stretch
+    trailing = [glider for glider in gliders
+                if glider.trail_count > 1 and left < glider.world_x < right and top < glider.world_y < bottom]
+    if not trailing:
+        return
+    points = np.concatenate([glider.trail_points for glider in trailing])
+    trailing_count = len(trailing)
+    # Rings differ in length (swarm enemies keep short trails), so each per-trail value is repeated per slot
+    lengths = np.fromiter((glider.trail_length for glider in trailing), dtype=np.intp, count=trailing_count)
+    heads = np.repeat(np.fromiter((glider.trail_head for glider in trailing), dtype=np.intp, count=trailing_count), lengths)
+    counts = np.repeat(np.fromiter((glider.trail_count for glider in trailing), dtype=np.intp, count=trailing_count), lengths)
+    ring_starts = np.cumsum(lengths) - lengths
+    slots = np.arange(len(points)) - np.repeat(ring_starts, lengths)
+    lengths = np.repeat(lengths, lengths)
+    # Age of every ring slot, 0 for the newest point; slots at or past a trail's count are still unused
+    ages = (heads - 1 - slots) % lengths
+    alpha_levels = (counts - 1 - ages) * config.CONTRAIL_ALPHA_LEVELS // lengths
+    screen_x = points[:, 0] - cam_x
+    screen_y = points[:, 1] - cam_y
+    on_screen = (ages < counts) & (screen_x >= 0) & (screen_x <= config.SCREEN_WIDTH) & (screen_y >= 0) & (screen_y <= config.SCREEN_HEIGHT)
+    stamp_x = (screen_x[on_screen] - 2).astype(np.int32).tolist()
+    stamp_y = (screen_y[on_screen] - 2).astype(np.int32).tolist()
+    surface.blits([(_contrail_stamps[level], (x, y)) for level, x, y in zip(alpha_levels[on_screen].tolist(), stamp_x, stamp_y)], doreturn=False)
+
+
+# --- Shared Glider Images ---
+# One unrotated image per (body_color, wing_color) livery, and its rotations in GLIDER_ROTATION_STEP_DEGREES
+# buckets, filled lazily and shared by every glider wearing that livery
+_glider_base_images = {}
+_glider_rotation_cache = {}
+
+def get_rotated_glider_image(livery, heading):
+    bucket = int(round(heading / config.GLIDER_ROTATION_STEP_DEGREES)) % (360 // config.GLIDER_ROTATION_STEP_DEGREES)
+    rotated_image = _glider_rotation_cache.get((livery, bucket))
+    if rotated_image is None:
+        rotated_image = pygame.transform.rotate(_glider_base_images[livery], -bucket * config.GLIDER_ROTATION_STEP_DEGREES)
+        _glider_rotation_cache[(livery, bucket)] = rotated_image
+    return rotated_image
 
 # --- Glider Base Class ---
 class GliderBase(pygame.sprite.Sprite):
@@ -66,28 +224,34 @@ class GliderBase(pygame.sprite.Sprite):
         self.tail_plane_chord = max(1, self.tail_plane_chord)
         self.tail_fin_height = max(1, self.tail_fin_height)
 
-        canvas_width = self.fuselage_length
-        canvas_height = self.wing_span
-        self.original_image = pygame.Surface([int(canvas_width), int(canvas_height)], pygame.SRCALPHA)
-
-        fuselage_y_top = (canvas_height - self.fuselage_thickness) / 2
-        pygame.draw.rect(self.original_image, self.body_color, (0, fuselage_y_top, self.fuselage_length, self.fuselage_thickness))
-        wing_x_pos = (self.fuselage_length - self.wing_chord) * 0.65
-        wing_y_pos = (canvas_height - self.wing_span) / 2
-        pygame.draw.rect(self.original_image, self.wing_color, (wing_x_pos, wing_y_pos, self.wing_chord, self.wing_span))
-        tail_plane_x_pos = 0
-        tail_plane_y_top = (canvas_height - self.tail_plane_span) / 2
-        pygame.draw.rect(self.original_image, self.wing_color, (tail_plane_x_pos, tail_plane_y_top, self.tail_plane_chord, self.tail_plane_span))
-        fin_base_y_center = fuselage_y_top + self.fuselage_thickness / 2
-        fin_bottom_y = fin_base_y_center - self.fuselage_thickness / 2
-        fin_tip_y = fin_bottom_y - self.tail_fin_height
-        fin_leading_edge_x = tail_plane_x_pos + self.tail_plane_chord * 0.2
-        fin_trailing_edge_x = tail_plane_x_pos + self.tail_plane_chord * 0.8
-        fin_tip_x = tail_plane_x_pos + self.tail_plane_chord * 0.5
-        pygame.draw.polygon(self.original_image, self.body_color, [
-            (fin_leading_edge_x, fin_bottom_y), (fin_trailing_edge_x, fin_bottom_y), (fin_tip_x, fin_tip_y)
-        ])
-
+        self.livery = (tuple(body_color), tuple(wing_color))
+        self.base_image = _glider_base_images.get(self.livery)
+        if self.base_image is None:
+            canvas_width = self.fuselage_length
+            canvas_height = self.wing_span
+            self.original_image = pygame.Surface([int(canvas_width), int(canvas_height)], pygame.SRCALPHA)
+
+            fuselage_y_top = (canvas_height - self.fuselage_thickness) / 2
+            pygame.draw.rect(self.original_image, self.body_color, (0, fuselage_y_top, self.fuselage_length, self.fuselage_thickness))
+            wing_x_pos = (self.fuselage_length - self.wing_chord) * 0.65
+            wing_y_pos = (canvas_height - self.wing_span) / 2
+            pygame.draw.rect(self.original_image, self.wing_color, (wing_x_pos, wing_y_pos, self.wing_chord, self.wing_span))
+            tail_plane_x_pos = 0
+            tail_plane_y_top = (canvas_height - self.tail_plane_span) / 2
+            pygame.draw.rect(self.original_image, self.wing_color, (tail_plane_x_pos, tail_plane_y_top, self.tail_plane_chord, self.tail_plane_span))
+            fin_base_y_center = fuselage_y_top + self.fuselage_thickness / 2
+            fin_bottom_y = fin_base_y_center - self.fuselage_thickness / 2
+            fin_tip_y = fin_bottom_y - self.tail_fin_height
+            fin_leading_edge_x = tail_plane_x_pos + self.tail_plane_chord * 0.2
+            fin_trailing_edge_x = tail_plane_x_pos + self.tail_plane_chord * 0.8
+            fin_tip_x = tail_plane_x_pos + self.tail_plane_chord * 0.5
+            pygame.draw.polygon(self.original_image, self.body_color, [
+                (fin_leading_edge_x, fin_bottom_y), (fin_trailing_edge_x, fin_bottom_y), (fin_tip_x, fin_tip_y)
+            ])
+
+            _glider_base_images[self.livery] = self.original_image
+            self.base_image = self.original_image
+        self.original_image = self.base_image # Shared between gliders: never draw onto it
         self.image = self.original_image
         self.rect = self.image.get_rect()
         self.collision_radius = config.GLIDER_COLLISION_RADIUS
@@ -98,8 +262,8 @@ class GliderBase(pygame.sprite.Sprite):
         self.bank_angle = 0
         self.height = config.INITIAL_HEIGHT
         self.speed = config.INITIAL_SPEED
-        self.trail_points = []
-        self.contrail_frame_counter = 0
+        self.trail_length = config.CONTRAIL_LENGTH # Points a contrail keeps; see set_trail_length
+        self.clear_contrail()
         self.current_target_marker_index = 0 
         self.laps_completed = 0
 
@@ -109,7 +273,10 @@ class GliderBase(pygame.sprite.Sprite):
         self.shoot_cooldown_duration = config.PLAYER_SHOOT_COOLDOWN
 
     def update_sprite_rotation_and_position(self, cam_x=None, cam_y=None):
-        self.image = pygame.transform.rotate(self.original_image, -self.heading)
+        if self.original_image is self.base_image:
+            self.image = get_rotated_glider_image(self.livery, self.heading)
+        else: # Temporarily swapped image (e.g. while exploding), not worth caching
+            self.image = pygame.transform.rotate(self.original_image, -self.heading)
         self.world_pos.x = self.world_x
         self.world_pos.y = self.world_y
 
@@ -121,6 +288,16 @@ class GliderBase(pygame.sprite.Sprite):
              self.rect = self.image.get_rect(center=(self.world_x, self.world_y))
 
 
+    def set_trail_length(self, trail_length):
+        self.trail_length = trail_length
+        self.clear_contrail()
+
+    def clear_contrail(self):
+        self.trail_points = np.empty((self.trail_length, 2)) # Ring of points, overwritten oldest first
+        self.trail_head = 0 # Slot the next point goes in
+        self.trail_count = 0
+        self.contrail_frame_counter = 0
+
     def update_contrail(self):
         heading_rad = math.radians(self.heading)
         self.contrail_frame_counter +=1
@@ -129,21 +306,10 @@ class GliderBase(pygame.sprite.Sprite):
             effective_tail_offset = (self.fuselage_length / 2) - 2
             tail_offset_x_world = -effective_tail_offset * math.cos(heading_rad)
             tail_offset_y_world = -effective_tail_offset * math.sin(heading_rad)
-            self.trail_points.append((self.world_x + tail_offset_x_world, self.world_y + tail_offset_y_world))
-            if len(self.trail_points) > config.CONTRAIL_LENGTH:
-                self.trail_points.pop(0)
-
-    def draw_contrail(self, surface, cam_x, cam_y):
-        if len(self.trail_points) > 1:
-            for i, world_point in enumerate(self.trail_points):
-                alpha = int(200 * (i / config.CONTRAIL_LENGTH))
-                screen_px = world_point[0] - cam_x
-                screen_py = world_point[1] - cam_y
-                if 0 <= screen_px <= config.SCREEN_WIDTH and 0 <= screen_py <= config.SCREEN_HEIGHT:
-                    try:
-                        pygame.draw.circle(surface, (*config.PASTEL_CONTRAIL_COLOR, alpha), (screen_px, screen_py), 2)
-                    except pygame.error: 
-                        pass
+            self.trail_points[self.trail_head] = (self.world_x + tail_offset_x_world, self.world_y + tail_offset_y_world)
+            self.trail_head = (self.trail_head + 1) % self.trail_length
+            if self.trail_count < self.trail_length:
+                self.trail_count += 1
 
     def apply_collision_effect(self):
         self.speed *= 0.5
@@ -163,15 +329,13 @@ class GliderBase(pygame.sprite.Sprite):
             return True 
         return False
 
-    def shoot(self, bullets_group, all_sprites_group):
+    def shoot(self, bullet_pool):
         if self.shoot_cooldown_timer <= 0:
             heading_rad = math.radians(self.heading)
             bullet_start_x = self.world_x + (self.fuselage_length / 1.8) * math.cos(heading_rad) 
             bullet_start_y = self.world_y + (self.fuselage_length / 1.8) * math.sin(heading_rad)
 
-            new_bullet = Bullet(bullet_start_x, bullet_start_y, self.heading, self)
-            bullets_group.add(new_bullet)
-            all_sprites_group.add(new_bullet)
+            bullet_pool.fire(bullet_start_x, bullet_start_y, self.heading, self)
             self.shoot_cooldown_timer = self.shoot_cooldown_duration
             return True 
         return False 
@@ -221,8 +385,7 @@ class PlayerGlider(GliderBase):
         self.speed = start_speed
         self.previous_height = start_height
         self.vertical_speed = 0.0
-        self.trail_points = []
-        self.contrail_frame_counter = 0
+        self.clear_contrail()
         self.current_target_marker_index = 0
         self.laps_completed = 0
         self.health = self.max_health 
@@ -241,7 +404,7 @@ class PlayerGlider(GliderBase):
         self.update_sprite_rotation_and_position()
 
 
-    def update(self, keys, game_data, bullets_group_ref, all_sprites_group_ref):
+    def update(self, keys, game_data, bullet_pool_ref):
         if self.is_exploding:
             if not hasattr(self, '_original_image_backup_explosion'): 
                 self._original_image_backup_explosion = self.original_image
@@ -273,7 +436,7 @@ class PlayerGlider(GliderBase):
             high_scores["max_altitude_free_fly"] = self.height
 
         if game_data["current_game_mode"] == config.MODE_DOGFIGHT and keys[pygame.K_SPACE]:
-            self.shoot(bullets_group_ref, all_sprites_group_ref)
+            self.shoot(bullet_pool_ref)
 
         if keys[pygame.K_UP]:
             self.speed += config.ACCELERATION
@@ -394,6 +557,13 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
         self.wingman_follow_dist_x = config.WINGMAN_FOLLOW_DISTANCE_X + random.uniform(-15,15)
         self.wingman_follow_dist_y = config.WINGMAN_FOLLOW_DISTANCE_Y_BASE * (1 if random.random() < 0.5 else -1) + random.uniform(-20,20)
 
+        # Level of detail (ai_lod.py): a full tick every frame until a scheduler marks the glider otherwise
+        self.lod_tier = 0
+        self.lod_outside = 0.0 # How far past the full-rate box, as of the last schedule()
+        self.lod_elapsed = 1
+        self.lod_frames_pending = 0
+        self.lod_slot = random.randrange(config.AI_LOD_TIER_INTERVALS[-1]) # Spreads far gliders' ticks over the frames
+
 
     def update_race_behavior(self, race_markers_list, dist_to_marker, angle_diff):
         if dist_to_marker < config.AI_MARKER_APPROACH_SLOWDOWN_DISTANCE:
@@ -406,7 +576,7 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
             self.target_speed = self.base_max_speed
             self.speed_update_timer = 0
         else:
-            self.speed_update_timer += 1
+            self.speed_update_timer += self.lod_elapsed
             if self.speed_update_timer >= config.AI_TARGET_SPEED_UPDATE_INTERVAL:
                 speed_range = self.base_max_speed - self.base_min_speed
                 random_variation = random.uniform(-speed_range * config.AI_SPEED_VARIATION_FACTOR,
@@ -416,7 +586,13 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
                 self.speed_update_timer = 0
 
         alt_diff = self.target_altitude - self.height
-        self.height += alt_diff * config.AI_ALTITUDE_CORRECTION_RATE
+        self.height += alt_diff * min(1.0, config.AI_ALTITUDE_CORRECTION_RATE * self.lod_elapsed)
+
+    def follow_course(self, dist_to_marker):
+        # Cheap stand-in for update_race_behavior while far from the view: head straight for the marker at its
+        # race height, boosting on the long legs just as the race AI does when lined up
+        self.target_speed = self.base_max_speed if dist_to_marker > config.AI_STRAIGHT_BOOST_MIN_DISTANCE else self.base_target_speed
+        self.height = self.target_altitude
 
     def update_wingman_behavior(self):
         if not self.player_ref: return 0,0 
@@ -437,10 +613,10 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
 
         self.target_altitude = self.player_ref.height + self.altitude_preference_offset
         alt_diff = self.target_altitude - self.height
-        self.height += alt_diff * config.WINGMAN_ALTITUDE_CORRECTION_RATE
+        self.height += alt_diff * min(1.0, config.WINGMAN_ALTITUDE_CORRECTION_RATE * self.lod_elapsed)
         return dx, dy
 
-    def update_dogfight_enemy_behavior(self, bullets_group_ref, all_sprites_group_ref):
+    def update_dogfight_enemy_behavior(self, bullet_pool_ref):
         if not self.player_ref: return 0,0
 
         dx = self.player_ref.world_x - self.world_x
@@ -452,17 +628,49 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
 
         self.target_altitude = self.player_ref.height + self.altitude_preference_offset
         alt_diff = self.target_altitude - self.height
-        self.height += alt_diff * config.AI_ALTITUDE_CORRECTION_RATE * 1.5
+        self.height += alt_diff * min(1.0, config.AI_ALTITUDE_CORRECTION_RATE * 1.5 * self.lod_elapsed)
 
         if dist_to_player < config.DOGFIGHT_AI_SHOOTING_RANGE:
             angle_to_player_rad = math.atan2(dy, dx)
             angle_to_player_deg = math.degrees(angle_to_player_rad)
             heading_diff = (angle_to_player_deg - self.heading + 540) % 360 - 180
             if abs(heading_diff) < config.DOGFIGHT_AI_SHOOTING_CONE_ANGLE:
-                self.shoot(bullets_group_ref, all_sprites_group_ref) 
+                self.shoot(bullet_pool_ref) 
         return dx, dy
 
-    def update(self, cam_x, cam_y, target_or_player_ref=None, total_laps_in_race=None, current_game_state=None, bullets_group_ref=None, all_sprites_group_ref=None):
+    def update(self, cam_x, cam_y, target_or_player_ref=None, total_laps_in_race=None, current_game_state=None, bullet_pool_ref=None):
+        # Whole tick for one glider; the game loop runs these steps phase by phase through update_pipeline instead
+        self.simulate(target_or_player_ref, total_laps_in_race, current_game_state, bullet_pool_ref)
+        self.update_placement(cam_x, cam_y)
+        self.update_contrail()
+
+    def update_contrail(self):
+        # Past the LOD scheduler's full-rate box by more than its trail can stretch, none of a glider's trail can
+        # reach the screen: drop it rather than lay points nobody sees. It grows back as the glider comes in.
+        if self.lod_tier and self.lod_outside > self.trail_length * config.CONTRAIL_POINT_DELAY * (config.MAX_SPEED + config.MAX_WIND_STRENGTH):
+            self.trail_count = 0
+            return
+        super().update_contrail()
+
+    def update_placement(self, cam_x, cam_y):
+        # Gliders the LOD scheduler has put in a far tier are well off screen, so they skip picking a rotated image
+        if self.lod_tier:
+            self.world_pos.update(self.world_x, self.world_y)
+            self.rect.center = (self.world_x - cam_x, self.world_y - cam_y)
+            return
+        self.update_sprite_rotation_and_position(cam_x, cam_y)
+
+    def coast(self):
+        # Between LOD ticks: hold heading and speed for the frame
+        heading_rad = math.radians(self.heading)
+        self.world_x += self.speed * math.cos(heading_rad)
+        self.world_y += self.speed * math.sin(heading_rad)
+        self.world_pos.x = self.world_x
+        self.world_pos.y = self.world_y
+
+    def simulate(self, target_or_player_ref=None, total_laps_in_race=None, current_game_state=None, bullet_pool_ref=None):
+        # Steering and movement only: rotating the sprite and laying contrail are separate steps.
+        # lod_elapsed is the number of frames this tick stands for; 0 means coast through this one.
         current_args_are_sufficient_for_logic = False
         if self.ai_mode == "race":
             if target_or_player_ref is not None and total_laps_in_race is not None and current_game_state is not None:
@@ -471,23 +679,27 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
             if self.player_ref is not None and current_game_state is not None: # target_or_player_ref is player object, used via self.player_ref
                  current_args_are_sufficient_for_logic = True
         elif self.ai_mode == "dogfight_enemy":
-            if self.player_ref is not None and current_game_state is not None and bullets_group_ref is not None and all_sprites_group_ref is not None:
+            if self.player_ref is not None and current_game_state is not None and bullet_pool_ref is not None:
                 current_args_are_sufficient_for_logic = True
         
         if not current_args_are_sufficient_for_logic:
-            self.update_sprite_rotation_and_position(cam_x, cam_y)
-            self.update_contrail()
+            return
+
+        elapsed = self.lod_elapsed
+        if elapsed == 0:
+            self.coast()
             return
 
         if self.shoot_cooldown_timer > 0:
-            self.shoot_cooldown_timer -=1
+            self.shoot_cooldown_timer = max(0, self.shoot_cooldown_timer - elapsed)
 
         dx, dy = 0, 0 
         angle_diff = 0 
+        path_following = False
 
         if self.ai_mode == "race":
             if not target_or_player_ref or current_game_state != config.STATE_RACE_PLAYING:
-                self.update_sprite_rotation_and_position(cam_x, cam_y); self.update_contrail(); return
+                return
             race_markers_list = target_or_player_ref 
             target_marker = race_markers_list[self.current_target_marker_index]
             dx_marker = target_marker.world_pos.x - self.world_x
@@ -496,37 +708,41 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
             target_angle_rad = math.atan2(dy_marker, dx_marker)
             target_angle_deg = math.degrees(target_angle_rad)
             angle_diff = (target_angle_deg - self.heading + 540) % 360 - 180
-            self.update_race_behavior(race_markers_list, dist_to_marker, angle_diff)
+            path_following = self.lod_tier >= config.AI_LOD_PATH_FOLLOW_TIER
+            if path_following:
+                self.follow_course(dist_to_marker)
+            else:
+                self.update_race_behavior(race_markers_list, dist_to_marker, angle_diff)
             if dist_to_marker < target_marker.world_radius:
                 self.current_target_marker_index += 1
                 if self.current_target_marker_index >= len(race_markers_list):
                     self.laps_completed += 1; self.current_target_marker_index = 0
         elif self.ai_mode == "wingman":
             if not self.player_ref or current_game_state not in [config.STATE_PLAYING_FREE_FLY, config.STATE_DELIVERY_PLAYING]: 
-                self.update_sprite_rotation_and_position(cam_x, cam_y); self.update_contrail(); return
+                return
             dx, dy = self.update_wingman_behavior()
             target_angle_rad = math.atan2(dy, dx) 
             target_angle_deg = math.degrees(target_angle_rad)
             angle_diff = (target_angle_deg - self.heading + 540) % 360 - 180
         elif self.ai_mode == "dogfight_enemy":
             if not self.player_ref or current_game_state != config.STATE_DOGFIGHT_PLAYING:
-                self.update_sprite_rotation_and_position(cam_x, cam_y); self.update_contrail(); return
-            dx, dy = self.update_dogfight_enemy_behavior(bullets_group_ref, all_sprites_group_ref)
+                return
+            dx, dy = self.update_dogfight_enemy_behavior(bullet_pool_ref)
             target_angle_rad = math.atan2(dy, dx)
             target_angle_deg = math.degrees(target_angle_rad)
             angle_diff = (target_angle_deg - self.heading + 540) % 360 - 180
         else:
-            self.update_sprite_rotation_and_position(cam_x, cam_y); self.update_contrail(); return
+            return
 
         turn_rate = self.base_turn_rate_scalar
         if self.ai_mode == "wingman":
             turn_rate *= config.WINGMAN_CASUALNESS_FACTOR 
 
-        turn_this_frame = angle_diff * turn_rate
+        turn_this_frame = angle_diff * (1.0 if path_following else min(1.0, turn_rate * elapsed))
         self.heading = (self.heading + turn_this_frame) % 360
 
-        if self.speed < self.target_speed: self.speed += config.ACCELERATION * 0.5
-        elif self.speed > self.target_speed: self.speed -= config.ACCELERATION * 0.5
+        if self.speed < self.target_speed: self.speed += config.ACCELERATION * 0.5 * elapsed
+        elif self.speed > self.target_speed: self.speed -= config.ACCELERATION * 0.5 * elapsed
         self.speed = max(self.base_min_speed * 0.7, min(self.speed, self.base_max_speed * 1.1))
 
         if self.height < 0: self.height = 0
@@ -537,9 +753,31 @@ class AIGlider(GliderBase): # THIS IS THE CLASS DEFINITION
         self.world_pos.x = self.world_x 
         self.world_pos.y = self.world_y
 
-        self.update_sprite_rotation_and_position(cam_x, cam_y)
-        self.update_contrail()
 
+# --- Shared Thermal Frames ---
+# One atlas of pulse frames per radius bucket. The disk and the accent ring are separate colorkeyed
+# surfaces, so a thermal's fade is just their surface alpha, set right before it blits them.
+_thermal_frame_atlases = {}
+
+def get_thermal_frames(radius_bucket):
+    frames = _thermal_frame_atlases.get(radius_bucket)
+    if frames is None:
+        frames = []
+        for i in range(config.THERMAL_PULSE_FRAMES):
+            visual_radius_factor = math.sin(2 * math.pi * i / config.THERMAL_PULSE_FRAMES) * 0.1 + 0.95
+            current_visual_radius = int(radius_bucket * visual_radius_factor)
+            disk_frame = pygame.Surface([radius_bucket * 2, radius_bucket * 2])
+            disk_frame.fill(config.THERMAL_FRAME_COLORKEY)
+            pygame.draw.circle(disk_frame, config.PASTEL_THERMAL_PRIMARY, (radius_bucket, radius_bucket), current_visual_radius)
+            pygame.draw.circle(disk_frame, config.THERMAL_FRAME_COLORKEY, (radius_bucket, radius_bucket), int(current_visual_radius * 0.7), 2) # The ring replaces the disk
+            ring_frame = pygame.Surface([radius_bucket * 2, radius_bucket * 2])
+            ring_frame.fill(config.THERMAL_FRAME_COLORKEY)
+            pygame.draw.circle(ring_frame, config.PASTEL_THERMAL_ACCENT, (radius_bucket, radius_bucket), int(current_visual_radius * 0.7), 2)
+            for frame in (disk_frame, ring_frame):
+                frame.set_colorkey(config.THERMAL_FRAME_COLORKEY, pygame.RLEACCEL)
+            frames.append((disk_frame, ring_frame))
+        _thermal_frame_atlases[radius_bucket] = frames
+    return frames
 
 # --- Thermal Class ---
 class Thermal(pygame.sprite.Sprite):
@@ -558,7 +796,12 @@ class Thermal(pygame.sprite.Sprite):
         self.lifespan = min_l + (max_l - min_l) * normalized_radius
         self.initial_lifespan = self.lifespan
         self.lift_power = config.MAX_THERMAL_LIFT_POWER - (config.MAX_THERMAL_LIFT_POWER - config.MIN_THERMAL_LIFT_POWER) * (1 - normalized_radius)
-        self.image = pygame.Surface([self.radius * 2, self.radius * 2], pygame.SRCALPHA)
+        radius_bucket = max(config.THERMAL_ATLAS_RADIUS_STEP, int(round(self.radius / config.THERMAL_ATLAS_RADIUS_STEP)) * config.THERMAL_ATLAS_RADIUS_STEP)
+        self.frames = get_thermal_frames(radius_bucket) # Shared between thermals: never draw onto them
+        self.frame_index = 0
+        self.disk_alpha = 0
+        self.ring_alpha = 0
+        self.image = self.frames[0][0]
         self.rect = self.image.get_rect()
         self.creation_time = pygame.time.get_ticks()
         self.update_visuals()
@@ -566,13 +809,11 @@ class Thermal(pygame.sprite.Sprite):
     def update_visuals(self):
         pulse_alpha_factor = (math.sin(pygame.time.get_ticks() * 0.005 + self.creation_time * 0.01) * 0.3 + 0.7)
         age_factor = max(0, self.lifespan / self.initial_lifespan if self.initial_lifespan > 0 else 0)
-        alpha = int(config.THERMAL_BASE_ALPHA * pulse_alpha_factor * age_factor)
-        accent_alpha = int(config.THERMAL_ACCENT_ALPHA * pulse_alpha_factor * age_factor)
-        visual_radius_factor = math.sin(pygame.time.get_ticks() * 0.002 + self.creation_time * 0.005) * 0.1 + 0.95
-        current_visual_radius = int(self.radius * visual_radius_factor)
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.circle(self.image, (*config.PASTEL_THERMAL_PRIMARY, alpha), (self.radius, self.radius), current_visual_radius)
-        pygame.draw.circle(self.image, (*config.PASTEL_THERMAL_ACCENT, accent_alpha), (self.radius, self.radius), int(current_visual_radius * 0.7), 2)
+        self.disk_alpha = int(config.THERMAL_BASE_ALPHA * pulse_alpha_factor * age_factor)
+        self.ring_alpha = int(config.THERMAL_ACCENT_ALPHA * pulse_alpha_factor * age_factor)
+        size_phase = pygame.time.get_ticks() * 0.002 + self.creation_time * 0.005
+        self.frame_index = int(size_phase / (2 * math.pi) * config.THERMAL_PULSE_FRAMES) % config.THERMAL_PULSE_FRAMES
+        self.image = self.frames[self.frame_index][0]
 
     def update(self, cam_x, cam_y):
         self.lifespan -= 1
@@ -583,36 +824,90 @@ class Thermal(pygame.sprite.Sprite):
         self.rect.centerx = self.world_pos.x - cam_x
         self.rect.centery = self.world_pos.y - cam_y
 
+    def draw(self, surface):
+        disk_frame, ring_frame = self.frames[self.frame_index]
+        disk_frame.set_alpha(self.disk_alpha, pygame.RLEACCEL)
+        surface.blit(disk_frame, self.rect)
+        ring_frame.set_alpha(self.ring_alpha, pygame.RLEACCEL)
+        surface.blit(ring_frame, self.rect)
+
+# --- Shared Marker Images ---
+# Race markers, runways and checkpoints look the same for the same number and state, so each look is drawn
+# once and shared; sprites.py can't use ui's font cache (ui imports sprites), hence its own
+_marker_font_cache = {}
+
+def get_marker_font(size):
+    font_obj = _marker_font_cache.get(size)
+    if font_obj is None:
+        font_obj = pygame.font.Font(None, size)
+        _marker_font_cache[size] = font_obj
+    return font_obj
+
 # --- RaceMarker Class ---
 class RaceMarker(pygame.sprite.Sprite):
+    images = {} # (number, is_active) -> image shared by every marker with that number
+
+    @classmethod
+    def get_image(cls, number, is_active):
+        image = cls.images.get((number, is_active))
+        if image is None:
+            visual_radius = config.RACE_MARKER_VISUAL_RADIUS_WORLD
+            color_to_use = config.PASTEL_ACTIVE_MARKER_COLOR if is_active else config.PASTEL_MARKER_COLOR
+            image = pygame.Surface((visual_radius * 2, visual_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color_to_use, (visual_radius, visual_radius), visual_radius)
+            pygame.draw.circle(image, config.PASTEL_WHITE, (visual_radius, visual_radius), int(visual_radius * 0.7))
+            text_surf = get_marker_font(int(visual_radius * 1.1)).render(str(number), True, config.PASTEL_BLACK)
+            text_rect = text_surf.get_rect(center=(visual_radius, visual_radius))
+            image.blit(text_surf, text_rect)
+            cls.images[(number, is_active)] = image
+        return image
+
     def __init__(self, world_x, world_y, number):
         super().__init__()
         self.world_pos = pygame.math.Vector2(world_x, world_y)
         self.number = number
         self.world_radius = config.RACE_MARKER_RADIUS_WORLD
         self.visual_radius = config.RACE_MARKER_VISUAL_RADIUS_WORLD
-        self.image = pygame.Surface((self.visual_radius * 2, self.visual_radius * 2), pygame.SRCALPHA)
+        self.is_active = False
+        # Both looks are built with the course, so becoming active mid-race is just an image swap
+        self.inactive_image = self.get_image(number, False)
+        self.active_image = self.get_image(number, True)
+        self.image = self.inactive_image
         self.rect = self.image.get_rect()
-        self._draw_marker_image(False) 
-
-    def _draw_marker_image(self, is_active):
-        color_to_use = config.PASTEL_ACTIVE_MARKER_COLOR if is_active else config.PASTEL_MARKER_COLOR
-        self.image.fill((0,0,0,0)) 
-        pygame.draw.circle(self.image, color_to_use, (self.visual_radius, self.visual_radius), self.visual_radius)
-        pygame.draw.circle(self.image, config.PASTEL_WHITE, (self.visual_radius, self.visual_radius), int(self.visual_radius * 0.7))
-        font_obj = pygame.font.Font(None, int(self.visual_radius * 1.1))
-        text_surf = font_obj.render(str(self.number), True, config.PASTEL_BLACK)
-        text_rect = text_surf.get_rect(center=(self.visual_radius, self.visual_radius))
-        self.image.blit(text_surf, text_rect)
 
     def update(self, cam_x, cam_y, is_active=None): 
         self.rect.centerx = self.world_pos.x - cam_x
         self.rect.centery = self.world_pos.y - cam_y
-        if is_active is not None: 
-            self._draw_marker_image(is_active)
+        if is_active is not None and is_active != self.is_active: 
+            self.is_active = is_active
+            self.image = self.active_image if is_active else self.inactive_image
 
 # --- Runway Class ---
 class Runway(pygame.sprite.Sprite):
+    images = {} # (is_destination, is_start) -> image shared by every runway of that kind
+
+    @classmethod
+    def get_image(cls, is_destination, is_start):
+        image = cls.images.get((is_destination, is_start))
+        if image is None:
+            visual_radius = config.DELIVERY_RUNWAY_VISUAL_RADIUS_WORLD
+            image = pygame.Surface((visual_radius * 2, visual_radius * 2), pygame.SRCALPHA)
+            runway_color = config.PASTEL_RUNWAY_COLOR
+            if is_destination:
+                runway_color = config.PASTEL_RUNWAY_DESTINATION_COLOR
+            elif is_start:
+                runway_color = config.PASTEL_RUNWAY_START_COLOR
+            pygame.draw.circle(image, runway_color, (visual_radius, visual_radius), visual_radius)
+            letter = ""
+            if is_start: letter = "S"
+            elif is_destination: letter = "D"
+            if letter:
+                text_surf = get_marker_font(int(visual_radius * 1.2)).render(letter, True, config.PASTEL_WHITE)
+                text_rect = text_surf.get_rect(center=(visual_radius, visual_radius))
+                image.blit(text_surf, text_rect)
+            cls.images[(is_destination, is_start)] = image
+        return image
+
     def __init__(self, world_x, world_y, is_destination_runway=False, is_start_runway=False):
         super().__init__()
         self.world_pos = pygame.math.Vector2(world_x, world_y)
@@ -621,26 +916,8 @@ class Runway(pygame.sprite.Sprite):
         self.visual_radius = config.DELIVERY_RUNWAY_VISUAL_RADIUS_WORLD
         self.interaction_radius = config.DELIVERY_RUNWAY_INTERACTION_RADIUS
 
-        self.image = pygame.Surface((self.visual_radius * 2, self.visual_radius * 2), pygame.SRCALPHA)
+        self.image = self.get_image(self.is_destination, self.is_start)
         self.rect = self.image.get_rect()
-        self._draw_runway_image()
-
-    def _draw_runway_image(self):
-        self.image.fill((0,0,0,0)) 
-        runway_color = config.PASTEL_RUNWAY_COLOR
-        if self.is_destination:
-            runway_color = config.PASTEL_RUNWAY_DESTINATION_COLOR
-        elif self.is_start:
-            runway_color = config.PASTEL_RUNWAY_START_COLOR
-        pygame.draw.circle(self.image, runway_color, (self.visual_radius, self.visual_radius), self.visual_radius)
-        letter = ""
-        if self.is_start: letter = "S"
-        elif self.is_destination: letter = "D"
-        if letter:
-            font_obj = pygame.font.Font(None, int(self.visual_radius * 1.2)) 
-            text_surf = font_obj.render(letter, True, config.PASTEL_WHITE)
-            text_rect = text_surf.get_rect(center=(self.visual_radius, self.visual_radius))
-            self.image.blit(text_surf, text_rect)
 
     def update(self, cam_x, cam_y): 
         self.rect.centerx = self.world_pos.x - cam_x
@@ -648,6 +925,30 @@ class Runway(pygame.sprite.Sprite):
 
 # --- Delivery Checkpoint Class ---
 class DeliveryCheckpoint(pygame.sprite.Sprite):
+    images = {} # (number, is_active_target) -> image shared by every checkpoint with that number
+
+    @classmethod
+    def get_image(cls, number, is_active_target):
+        image = cls.images.get((number, is_active_target))
+        if image is None:
+            visual_radius = config.DELIVERY_CHECKPOINT_VISUAL_RADIUS_WORLD
+            image = pygame.Surface((visual_radius * 2 + 4, visual_radius * 2 + 4), pygame.SRCALPHA)
+            draw_pos = (image.get_width() // 2, image.get_height() // 2)
+            color_to_use = config.DELIVERY_CHECKPOINT_COLOR_ACTIVE if is_active_target else config.DELIVERY_CHECKPOINT_COLOR_INACTIVE
+            points = [
+                (draw_pos[0], draw_pos[1] - visual_radius),  
+                (draw_pos[0] + visual_radius, draw_pos[1]),  
+                (draw_pos[0], draw_pos[1] + visual_radius),  
+                (draw_pos[0] - visual_radius, draw_pos[1]),  
+            ]
+            pygame.draw.polygon(image, color_to_use, points)
+            if number > 0: 
+                text_surf = get_marker_font(int(visual_radius * 1.2)).render(str(number), True, config.PASTEL_BLACK)
+                text_rect = text_surf.get_rect(center=draw_pos)
+                image.blit(text_surf, text_rect)
+            cls.images[(number, is_active_target)] = image
+        return image
+
     def __init__(self, world_x, world_y, number):
         super().__init__()
         self.world_pos = pygame.math.Vector2(world_x, world_y)
@@ -655,72 +956,55 @@ class DeliveryCheckpoint(pygame.sprite.Sprite):
         self.interaction_radius = config.DELIVERY_CHECKPOINT_INTERACTION_RADIUS
         self.visual_radius = config.DELIVERY_CHECKPOINT_VISUAL_RADIUS_WORLD
         self.is_active_target = False 
-        self.image = pygame.Surface((self.visual_radius * 2 + 4, self.visual_radius * 2 + 4), pygame.SRCALPHA)
+        # Both looks are built with the route, so becoming the target is just an image swap
+        self.inactive_image = self.get_image(number, False)
+        self.active_image = self.get_image(number, True)
+        self.image = self.inactive_image
         self.rect = self.image.get_rect(center=(self.world_pos.x, self.world_pos.y))
-        self._draw_image()
-
-    def _draw_image(self):
-        self.image.fill((0, 0, 0, 0)) 
-        draw_pos = (self.image.get_width() // 2, self.image.get_height() // 2)
-        color_to_use = config.DELIVERY_CHECKPOINT_COLOR_ACTIVE if self.is_active_target else config.DELIVERY_CHECKPOINT_COLOR_INACTIVE
-        points = [
-            (draw_pos[0], draw_pos[1] - self.visual_radius),  
-            (draw_pos[0] + self.visual_radius, draw_pos[1]),  
-            (draw_pos[0], draw_pos[1] + self.visual_radius),  
-            (draw_pos[0] - self.visual_radius, draw_pos[1]),  
-        ]
-        pygame.draw.polygon(self.image, color_to_use, points)
-        if self.number > 0: 
-            font_obj = pygame.font.Font(None, int(self.visual_radius * 1.2))
-            text_surf = font_obj.render(str(self.number), True, config.PASTEL_BLACK)
-            text_rect = text_surf.get_rect(center=draw_pos)
-            self.image.blit(text_surf, text_rect)
             
     def update(self, cam_x, cam_y, is_currently_active_target=None): 
         if is_currently_active_target is not None and self.is_active_target != is_currently_active_target:
             self.is_active_target = is_currently_active_target
-            self._draw_image() 
+            self.image = self.active_image if is_currently_active_target else self.inactive_image
 
         self.rect.centerx = self.world_pos.x - cam_x
         self.rect.centery = self.world_pos.y - cam_y
 
 # --- Explosion Class ---
 class Explosion(pygame.sprite.Sprite):
+    animation_sequence = [
+        (5, (255, 255, 100), 255),   
+        (15, (255, 200, 50), 255),   
+        (25, (255, 150, 0), 255),    
+        (35, (255, 100, 0), 240),    
+        (45, (200, 50, 0), 220),     
+        (40, (150, 50, 50), 200),    
+        (35, (100, 100, 100), 180),  
+        (30, (80, 80, 80), 150),     
+        (25, (60, 60, 60), 100),     
+        (20, (50, 50, 50), 50),      
+    ]
+    max_radius = max(frame_data[0] for frame_data in animation_sequence)
+    frames = None # One pre-rendered surface per animation_sequence entry, shared by every explosion
+
+    @classmethod
+    def get_frames(cls):
+        if cls.frames is None:
+            cls.frames = []
+            for radius, color, alpha in cls.animation_sequence:
+                frame = pygame.Surface((cls.max_radius * 2, cls.max_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(frame, (*color, alpha), (cls.max_radius, cls.max_radius), radius)
+                cls.frames.append(frame)
+        return cls.frames
+
     def __init__(self, center_world_pos):
         super().__init__()
         self.world_pos = pygame.math.Vector2(center_world_pos)
         self.current_anim_frame_index = 0
         self.ticks_per_anim_frame = 4  
         self.anim_frame_tick_counter = 0
-        self.animation_sequence = [
-            (5, (255, 255, 100), 255),   
-            (15, (255, 200, 50), 255),   
-            (25, (255, 150, 0), 255),    
-            (35, (255, 100, 0), 240),    
-            (45, (200, 50, 0), 220),     
-            (40, (150, 50, 50), 200),    
-            (35, (100, 100, 100), 180),  
-            (30, (80, 80, 80), 150),     
-            (25, (60, 60, 60), 100),     
-            (20, (50, 50, 50), 50),      
-        ]
-        self.max_radius = 0
-        for frame_data in self.animation_sequence:
-            if frame_data[0] > self.max_radius:
-                self.max_radius = frame_data[0]
-        self.image = pygame.Surface((self.max_radius * 2, self.max_radius * 2), pygame.SRCALPHA)
+        self.image = self.get_frames()[0] # Shared between explosions: never draw onto it
         self.rect = self.image.get_rect(center=(self.world_pos.x, self.world_pos.y)) 
-        self._update_image()
-
-    def _update_image(self):
-        if self.current_anim_frame_index >= len(self.animation_sequence):
-            self.kill() 
-            return
-        radius, color, alpha = self.animation_sequence[self.current_anim_frame_index]
-        self.image.fill((0, 0, 0, 0)) 
-        center_of_surface = (self.image.get_width() // 2, self.image.get_height() // 2)
-        final_color = (*color, alpha)
-        pygame.draw.circle(self.image, final_color, center_of_surface, radius)
 
     def update(self, cam_x, cam_y): 
         self.anim_frame_tick_counter += 1
@@ -728,7 +1012,7 @@ class Explosion(pygame.sprite.Sprite):
             self.anim_frame_tick_counter = 0
             self.current_anim_frame_index += 1
             if self.current_anim_frame_index < len(self.animation_sequence):
-                self._update_image()
+                self.image = self.frames[self.current_anim_frame_index]
             else:
                 self.kill() 
                 return 
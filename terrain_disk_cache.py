@@ -0,0 +1,91 @@
+# terrain_disk_cache.py
+# Persists generated land type chunks per map seed in memory-mapped files, so a map seen in an
+# earlier session loads its terrain from disk instead of generating it again.
+
+import os
+import zlib
+import numpy as np
+import config
+
+_FILE_FORMAT_VERSION = 1
+_CHUNK_BYTES = config.MAP_CHUNK_TILES * config.MAP_CHUNK_TILES
+
+def _generation_fingerprint():
+    # Anything that changes the generated land types has to change the file name too
+    generation_settings = (config.MAP_CHUNK_TILES, config.ELEVATION_CONTINENT_SCALE, config.ELEVATION_MOUNTAIN_SCALE, config.ELEVATION_HILL_SCALE,
+                           config.MOISTURE_PRIMARY_SCALE, config.MOISTURE_SECONDARY_SCALE, config.P_CONT, config.P_MNT, config.P_HILL,
+                           config.P_MOIST_P, config.P_MOIST_S, config.DEEP_WATER_THRESH, config.SHALLOW_WATER_THRESH, config.BEACH_THRESH,
+                           config.MOUNTAIN_BASE_THRESH, config.MOUNTAIN_PEAK_THRESH, config.DESERT_THRESH, config.GRASSLAND_THRESH,
+                           config.TEMPERATE_FOREST_THRESH, config.NUM_MAJOR_RIVERS, config.RACE_COURSE_AREA_HALFWIDTH, config.TILE_SIZE)
+    return zlib.crc32(repr(generation_settings).encode("ascii"))
+
+def map_cache_file_name(map_seed):
+    map_offset_x, map_offset_y, river_seed, noise_backend = map_seed
+    return f"terrain_v{_FILE_FORMAT_VERSION}_{_generation_fingerprint():08x}_{noise_backend}_{map_offset_x}_{map_offset_y}_{river_seed}.bin"
+
+# One file per map seed, covering the (2 * radius + 1)^2 chunks around the map's origin. Each record is
+# a present flag byte followed by the chunk's land types; chunks outside the region are never stored.
+class TerrainDiskCache:
+    def __init__(self, map_seed, center_chunk_x, center_chunk_y, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = config.TERRAIN_DISK_CACHE_DIR
+        self.map_seed = map_seed
+        self.first_chunk_x = center_chunk_x - config.TERRAIN_DISK_CACHE_RADIUS_CHUNKS
+        self.first_chunk_y = center_chunk_y - config.TERRAIN_DISK_CACHE_RADIUS_CHUNKS
+        self.side_chunks = 2 * config.TERRAIN_DISK_CACHE_RADIUS_CHUNKS + 1
+        self.loads = 0
+        self.saves = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, map_cache_file_name(map_seed))
+        expected_size = self.side_chunks * self.side_chunks * (1 + _CHUNK_BYTES)
+        reuse_file = os.path.exists(self.path) and os.path.getsize(self.path) == expected_size
+        self.records = np.memmap(self.path, dtype=np.uint8, mode="r+" if reuse_file else "w+",
+                                 shape=(self.side_chunks, self.side_chunks, 1 + _CHUNK_BYTES))
+        os.utime(self.path) # Most recently used maps survive pruning
+        _prune_cached_maps(cache_dir, keep_path=self.path)
+
+    def _record_index(self, chunk_x, chunk_y):
+        row = chunk_y - self.first_chunk_y
+        column = chunk_x - self.first_chunk_x
+        if 0 <= row < self.side_chunks and 0 <= column < self.side_chunks:
+            return row, column
+        return None
+
+    def load_chunk(self, chunk_x, chunk_y):
+        record_index = self._record_index(chunk_x, chunk_y)
+        if record_index is None or self.records is None or not self.records[record_index][0]:
+            return None
+        self.loads += 1
+        return np.array(self.records[record_index][1:]).reshape(config.MAP_CHUNK_TILES, config.MAP_CHUNK_TILES)
+
+    def save_chunk(self, chunk_x, chunk_y, tile_types):
+        record_index = self._record_index(chunk_x, chunk_y)
+        if record_index is None or self.records is None:
+            return
+        record = self.records[record_index]
+        record[1:] = tile_types.ravel()
+        record[0] = 1 # Flag written last, so a half-written record is never read back
+        self.saves += 1
+
+    def close(self):
+        if self.records is not None:
+            self.records.flush()
+            self.records = None
+
+def _prune_cached_maps(cache_dir, keep_path):
+    map_files = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.startswith("terrain_v") and name.endswith(".bin")]
+    map_files.sort(key=os.path.getmtime, reverse=True)
+    for stale_path in map_files[config.TERRAIN_DISK_CACHE_MAX_MAPS:]:
+        if stale_path != keep_path:
+            os.remove(stale_path)
+
+def open_terrain_disk_cache(map_seed, center_chunk_x, center_chunk_y):
+    # None when disabled or the cache directory is unusable; the game then just generates as before
+    if not config.TERRAIN_DISK_CACHE_ENABLED:
+        return None
+    try:
+        return TerrainDiskCache(map_seed, center_chunk_x, center_chunk_y)
+    except (OSError, ValueError) as e:
+        print(f"Warning: terrain disk cache unavailable: {e}")
+        return None
@@ -0,0 +1,138 @@
+# terrain_prebake.py
+# Pre-bakes the land types of the whole course area across CPU cores when a course-based level starts,
+# merging finished chunks into the tile store so gameplay frames never have to generate terrain there.
+
+import math
+import os
+import time
+import threading
+import multiprocessing
+import concurrent.futures
+import config
+import map_generation
+
+def _init_prebake_process(river_seed, noise_backend, precompute_center_tile):
+    # Forked workers inherit the parent's terrain state, but set it from the seed anyway without going
+    # through invalidate_terrain: its locks may have been held by another thread at fork time
+    map_generation.active_noise_backend = noise_backend
+    map_generation.MAJOR_RIVERS_PARAMS, map_generation.river_span_tables = map_generation.build_river_parameters(river_seed, precompute_center_tile)
+
+def _bake_chunks(chunk_keys):
+    chunk_tiles = config.MAP_CHUNK_TILES
+    return [(chunk_key, map_generation.get_land_types_for_tile_rect(chunk_key[0] * chunk_tiles, chunk_key[1] * chunk_tiles, chunk_tiles, chunk_tiles))
+            for chunk_key in chunk_keys]
+
+def _new_executor(map_seed, precompute_center_tile):
+    max_workers = config.TERRAIN_PREBAKE_MAX_WORKERS or max(1, (os.cpu_count() or 2) - 1)
+    # main.py runs the game at import time, so fork is the only start method that doesn't re-run it in
+    # the workers; without fork a thread pool still keeps the work off the render loop
+    if "fork" in multiprocessing.get_all_start_methods():
+        _, _, river_seed, noise_backend = map_seed
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"),
+                                                      initializer=_init_prebake_process, initargs=(river_seed, noise_backend, precompute_center_tile))
+    return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+class CourseAreaPrebake:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+        self.pending = {} # future -> chunk keys it is baking
+        self.pending_chunks = set()
+        self.tile_type_store = None
+        self.generation_epoch = None
+        self.total_chunks = 0
+        self.baked_chunks = 0
+
+    def is_active(self):
+        return self.executor is not None
+
+    def progress(self):
+        return self.baked_chunks / self.total_chunks if self.total_chunks else 1.0
+
+    def start(self, map_seed, tile_type_store_param):
+        self.cancel()
+        map_offset_x, map_offset_y, _, _ = map_seed
+        offset_tile_x = math.floor(map_offset_x / config.TILE_SIZE)
+        offset_tile_y = math.floor(map_offset_y / config.TILE_SIZE)
+        # The course area plus half a screen, so the view is covered even at the edge of the course
+        halfwidth = config.RACE_COURSE_AREA_HALFWIDTH + max(config.SCREEN_WIDTH, config.SCREEN_HEIGHT) // 2
+        first_chunk_x = (math.floor(-halfwidth / config.TILE_SIZE) + offset_tile_x) // config.MAP_CHUNK_TILES
+        last_chunk_x = (math.floor(halfwidth / config.TILE_SIZE) + offset_tile_x) // config.MAP_CHUNK_TILES
+        first_chunk_y = (math.floor(-halfwidth / config.TILE_SIZE) + offset_tile_y) // config.MAP_CHUNK_TILES
+        last_chunk_y = (math.floor(halfwidth / config.TILE_SIZE) + offset_tile_y) // config.MAP_CHUNK_TILES
+        origin_chunk_x = offset_tile_x // config.MAP_CHUNK_TILES
+        origin_chunk_y = offset_tile_y // config.MAP_CHUNK_TILES
+
+        # Chunks already in memory or on disk are skipped; the rest go out nearest the origin (the spawn) first
+        chunk_keys = [(chunk_x, chunk_y) for chunk_y in range(first_chunk_y, last_chunk_y + 1) for chunk_x in range(first_chunk_x, last_chunk_x + 1)
+                      if tile_type_store_param.get_cached_chunk(chunk_x, chunk_y) is None]
+        if not chunk_keys:
+            return
+        chunk_keys.sort(key=lambda chunk_key: (chunk_key[0] - origin_chunk_x) ** 2 + (chunk_key[1] - origin_chunk_y) ** 2)
+
+        with self.lock:
+            try:
+                self.executor = _new_executor(map_seed, (offset_tile_x, offset_tile_y))
+                for i in range(0, len(chunk_keys), config.TERRAIN_PREBAKE_BATCH_CHUNKS):
+                    batch = chunk_keys[i:i + config.TERRAIN_PREBAKE_BATCH_CHUNKS]
+                    self.pending[self.executor.submit(_bake_chunks, batch)] = batch
+            except (OSError, RuntimeError, ValueError) as e:
+                print(f"Warning: terrain pre-bake unavailable: {e}")
+                self._stop()
+                return
+            self.pending_chunks = set(chunk_keys)
+            self.tile_type_store = tile_type_store_param
+            self.generation_epoch = map_generation.terrain_generation_epoch
+            self.total_chunks = len(chunk_keys)
+            self.baked_chunks = 0
+            tile_type_store_param.prebake = self
+
+    def poll(self):
+        # Merges whatever the workers have finished; cheap enough to call every frame
+        with self.lock:
+            if self.executor is None:
+                return
+            for future in [future for future in self.pending if future.done()]:
+                chunk_keys = self.pending.pop(future)
+                try:
+                    baked = future.result()
+                except Exception as e: # A dead worker process; whatever is left is generated on demand
+                    print(f"Warning: terrain pre-bake stopped: {e}")
+                    self._stop()
+                    return
+                for chunk_key, tile_types in baked:
+                    self.tile_type_store.insert_generated_chunk(chunk_key, tile_types, self.generation_epoch)
+                    self.pending_chunks.discard(chunk_key)
+                self.baked_chunks += len(chunk_keys)
+            if not self.pending:
+                self._stop()
+
+    def wait_for_chunk(self, chunk_key):
+        # Blocks until a chunk this bake owns has been merged; None if it isn't ours or the bake gave up
+        deadline = time.perf_counter() + config.TERRAIN_PREBAKE_WAIT_TIMEOUT
+        while True:
+            with self.lock:
+                if chunk_key not in self.pending_chunks:
+                    break
+            self.poll()
+            if time.perf_counter() > deadline:
+                return None
+            time.sleep(0.001)
+        tile_type_store_param = self.tile_type_store
+        return tile_type_store_param.get_cached_chunk(*chunk_key) if tile_type_store_param is not None else None
+
+    def cancel(self):
+        with self.lock:
+            self._stop()
+
+    def _stop(self):
+        # Caller holds self.lock
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self.tile_type_store is not None and self.tile_type_store.prebake is self:
+            self.tile_type_store.prebake = None
+        self.pending.clear()
+        self.pending_chunks.clear()
+
+course_area_prebake = CourseAreaPrebake()
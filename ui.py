@@ -3,6 +3,8 @@
 
 import pygame
 import math
+import numpy as np
+from collections import OrderedDict
 import config # Import constants
 from sprites import Runway, DeliveryCheckpoint, RaceMarker # ADD THIS LINE
 
@@ -19,18 +21,157 @@ def get_cached_font(font_name, size):
             font_cache[key] = pygame.font.Font(None, size)
     return font_cache[key]
 
-def draw_text(surface, text, size, x, y, color=config.PASTEL_WHITE, font_name=None, center=False, antialias=True, shadow=False, shadow_color=config.PASTEL_DARK_GRAY, shadow_offset=(1,1)):
+# Segmented LRU of rendered text. New strings enter the probation segment and are promoted to the protected
+# segment when drawn again, so a stream of one-off numbers (timers, distances) only churns probation and
+# can't flush the static labels and menu text out of the cache.
+class TextSurfaceCache:
+    def __init__(self, probation_size, protected_size):
+        self.probation_size = probation_size
+        self.protected_size = protected_size
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, render):
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            self.hits += 1
+            return self.protected[key]
+        if key in self.probation:
+            entry = self.probation.pop(key)
+            self.hits += 1
+            self.protected[key] = entry
+            if len(self.protected) > self.protected_size:
+                demoted_key, demoted_entry = self.protected.popitem(last=False) # Gets another chance in probation
+                self._add_to_probation(demoted_key, demoted_entry)
+            return entry
+        self.misses += 1
+        entry = render()
+        self._add_to_probation(key, entry)
+        return entry
+
+    def _add_to_probation(self, key, entry):
+        self.probation[key] = entry
+        if len(self.probation) > self.probation_size:
+            self.probation.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.probation.clear()
+        self.protected.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "hit_rate": self.hits / lookups if lookups else 0.0,
+                "probation": len(self.probation), "protected": len(self.protected)}
+
+text_surface_cache = TextSurfaceCache(config.TEXT_CACHE_PROBATION_SIZE, config.TEXT_CACHE_PROTECTED_SIZE)
+
+def render_text(text, size, color, font_name=None, antialias=True, shadow=False, shadow_color=config.PASTEL_DARK_GRAY, shadow_offset=(1,1)):
+    # Returns the rendered text (with its shadow baked in) and the rect of the text itself inside it
     font = get_cached_font(font_name, size)
     text_surface = font.render(text, antialias, color)
-    text_rect = text_surface.get_rect()
+    if not shadow:
+        return text_surface, text_surface.get_rect()
+    text_rect = text_surface.get_rect(topleft=(max(0, -shadow_offset[0]), max(0, -shadow_offset[1])))
+    combined_surface = pygame.Surface((text_rect.width + abs(shadow_offset[0]), text_rect.height + abs(shadow_offset[1])), pygame.SRCALPHA)
+    combined_surface.blit(font.render(text, antialias, shadow_color), (text_rect.x + shadow_offset[0], text_rect.y + shadow_offset[1]))
+    combined_surface.blit(text_surface, text_rect)
+    return combined_surface, text_rect
+
+def get_text_surface(text, size, color, font_name=None, antialias=True, shadow=False, shadow_color=config.PASTEL_DARK_GRAY, shadow_offset=(1,1)):
+    # render_text through text_surface_cache; the returned surface is shared, so never draw onto it
+    key = (text, size, font_name, tuple(color), antialias, tuple(shadow_color) if shadow else None, tuple(shadow_offset) if shadow else None)
+    return text_surface_cache.get(key, lambda: render_text(text, size, color, font_name, antialias, shadow, shadow_color, shadow_offset))
+
+def draw_text(surface, text, size, x, y, color=config.PASTEL_WHITE, font_name=None, center=False, antialias=True, shadow=False, shadow_color=config.PASTEL_DARK_GRAY, shadow_offset=(1,1)):
+    text_surface, text_origin_rect = get_text_surface(text, size, color, font_name, antialias, shadow, shadow_color, shadow_offset)
+    text_rect = text_origin_rect.copy()
     if center:
         text_rect.center = (x,y)
     else:
         text_rect.topleft = (x,y)
-    if shadow:
-        shadow_surface = font.render(text, antialias, shadow_color)
-        surface.blit(shadow_surface, (text_rect.x + shadow_offset[0], text_rect.y + shadow_offset[1]))
-    surface.blit(text_surface, text_rect)
+    surface.blit(text_surface, (text_rect.x - text_origin_rect.x, text_rect.y - text_origin_rect.y))
+
+
+# Retained-mode HUD: each frame declares its fields, which are only re-rendered when their displayed value
+# changes, and the top panel is only recomposited when some field in it changed. The panel reaches the
+# screen in one blit; fields outside it (overlays) are blitted from the same cache.
+class HudCompositor:
+    def __init__(self, width, height, background_color):
+        self.background_color = background_color
+        self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.fields = {} # field name -> (display key, surface, offset of the field's anchor inside the surface, ...)
+        self.layout = []
+        self.composited_layout = None
+        self.field_renders = 0
+        self.panel_rebuilds = 0
+
+    def begin_frame(self):
+        self.layout = []
+
+    def _field(self, name, key, render):
+        cached_field = self.fields.get(name)
+        if cached_field is None or cached_field[0] != key:
+            cached_field = (key, *render())
+            self.fields[name] = cached_field
+            self.field_renders += 1
+        return cached_field
+
+    def _text_field(self, name, text, size, x, y, color, center, shadow, shadow_color):
+        _, text_surface, text_origin_rect = self._field(name, (text, size, color, shadow, shadow_color),
+                                                        lambda: get_text_surface(text, size, color, font_name=config.HUD_FONT_NAME, shadow=shadow, shadow_color=shadow_color))
+        text_rect = text_origin_rect.copy()
+        if center:
+            text_rect.center = (x, y)
+        else:
+            text_rect.topleft = (x, y)
+        return text_surface, (text_rect.x - text_origin_rect.x, text_rect.y - text_origin_rect.y)
+
+    def text(self, name, text, size, x, y, color, center=False, shadow=False, shadow_color=config.PASTEL_DARK_GRAY):
+        _, position = self._text_field(name, text, size, x, y, color, center, shadow, shadow_color)
+        self.layout.append((name, self.fields[name][0], position))
+
+    def dial(self, name, center_x, center_y, radius, hand_angle_degrees, hand_color, label="N"):
+        hand_angle_degrees = round(hand_angle_degrees) % 360 # Whole degrees, so a steady heading doesn't re-render it
+        def render():
+            dial_surface = pygame.Surface((radius * 2 + 3, radius * 2 + 3), pygame.SRCALPHA)
+            draw_dial(dial_surface, radius + 1, radius + 1, radius, hand_angle_degrees, hand_color, label=label)
+            return dial_surface, (radius + 1, radius + 1)
+        self._place(name, (radius, hand_angle_degrees, hand_color, label), render, center_x, center_y)
+
+    def weather_vane(self, name, wind_x, wind_y, center_x, center_y, radius=22):
+        def render():
+            vane_surface = pygame.Surface((radius * 2 + 3, radius * 2 + 3), pygame.SRCALPHA)
+            draw_weather_vane(vane_surface, wind_x, wind_y, radius + 1, radius + 1, radius)
+            return vane_surface, (radius + 1, radius + 1)
+        self._place(name, (radius, wind_x, wind_y), render, center_x, center_y)
+
+    def _place(self, name, key, render, x, y):
+        anchor = self._field(name, key, render)[2]
+        self.layout.append((name, key, (x - anchor[0], y - anchor[1])))
+
+    def composite(self, surface):
+        if self.layout != self.composited_layout:
+            self.panel.fill(self.background_color)
+            for name, _, position in self.layout:
+                self.panel.blit(self.fields[name][1], position)
+            self.composited_layout = self.layout
+            self.panel_rebuilds += 1
+        surface.blit(self.panel, (0, 0))
+
+    def overlay_text(self, surface, name, text, size, x, y, color, center=False):
+        text_surface, position = self._text_field(name, text, size, x, y, color, center, False, None)
+        surface.blit(text_surface, position)
+
+    def overlay_layer(self, surface, name, key, render, x, y):
+        # A cached picture outside the panel, redrawn by render() only when key changes
+        _, layer_surface, anchor = self._field(name, key, render)[:3]
+        surface.blit(layer_surface, (x - anchor[0], y - anchor[1]))
+
+hud_compositor = HudCompositor(config.SCREEN_WIDTH, config.HUD_HEIGHT, config.PASTEL_HUD_PANEL)
 
 
 class Minimap:
@@ -90,20 +231,76 @@ class Minimap:
                 
                 pygame.draw.circle(self.surface, color_to_use, (mini_x, mini_y), radius)
                 if label:
-                    font_obj = get_cached_font(None, 12) # Smaller font for minimap labels
-                    text_surf = font_obj.render(label, True, config.PASTEL_BLACK)
-                    text_rect = text_surf.get_rect(center=(mini_x, mini_y))
-                    self.surface.blit(text_surf, text_rect)
+                    draw_text(self.surface, label, 12, mini_x, mini_y, config.PASTEL_BLACK, center=True) # Smaller font for minimap labels
 
         pygame.draw.rect(self.surface, config.PASTEL_MINIMAP_BORDER, self.surface.get_rect(), 2)
         surface.blit(self.surface, self.rect)
 
 
+# North-up radar of the threats around the player that are off screen; those beyond its range sit on the rim
+class ThreatRadar:
+    def __init__(self, radius, world_range, margin):
+        self.radius = radius
+        self.world_range = world_range
+        self.scale = radius / world_range
+        self.surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.rect = self.surface.get_rect(topright=(config.SCREEN_WIDTH - margin, margin + config.HUD_HEIGHT))
+        self.background = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.background, config.PASTEL_RADAR_BACKGROUND, (radius, radius), radius)
+        pygame.draw.circle(self.background, config.PASTEL_RADAR_RING, (radius, radius), radius // 2, 1)
+        pygame.draw.circle(self.background, config.PASTEL_RADAR_RING, (radius, radius), radius, 2)
+        view_rect = pygame.Rect(0, 0, max(2, int(config.SCREEN_WIDTH * self.scale)), max(2, int(config.SCREEN_HEIGHT * self.scale)))
+        view_rect.center = (radius, radius)
+        pygame.draw.rect(self.background, config.PASTEL_RADAR_RING, view_rect, 1)
+        pygame.draw.circle(self.background, config.PASTEL_GOLD, (radius, radius), 3)
+        blip_radius = config.RADAR_BLIP_RADIUS
+        self.blip = pygame.Surface((blip_radius * 2, blip_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.blip, config.PASTEL_RADAR_THREAT, (blip_radius, blip_radius), blip_radius)
+        self.shown_count = 0
+
+    def draw(self, surface, player_glider, threats):
+        threats = list(threats)
+        count = len(threats)
+        rel_x = np.fromiter((threat.world_x for threat in threats), dtype=np.float64, count=count) - player_glider.world_x
+        rel_y = np.fromiter((threat.world_y for threat in threats), dtype=np.float64, count=count) - player_glider.world_y
+        off_screen = (np.abs(rel_x) > config.SCREEN_WIDTH / 2) | (np.abs(rel_y) > config.SCREEN_HEIGHT / 2)
+        rel_x, rel_y = rel_x[off_screen], rel_y[off_screen]
+        rim_pull = np.minimum(1.0, self.world_range / np.maximum(np.hypot(rel_x, rel_y), 1e-9))
+        blip_radius = config.RADAR_BLIP_RADIUS
+        blip_x = (self.radius + rel_x * rim_pull * self.scale).astype(np.intp) - blip_radius
+        blip_y = (self.radius + rel_y * rim_pull * self.scale).astype(np.intp) - blip_radius
+        np.clip(blip_x, 0, (self.radius - blip_radius) * 2, out=blip_x)
+        np.clip(blip_y, 0, (self.radius - blip_radius) * 2, out=blip_y)
+        self.surface.blit(self.background, (0, 0))
+        blip = self.blip
+        self.surface.blits([(blip, position) for position in zip(blip_x.tolist(), blip_y.tolist())], doreturn=False)
+        self.shown_count = len(blip_x)
+        surface.blit(self.surface, self.rect)
+
+
+def _render_height_indicator_scale(shown_target_h):
+    # The bar, the ground line and the free flight target line, drawn into a strip starting 5px left of the bar
+    indicator_bar_height = config.SCREEN_HEIGHT - config.HUD_HEIGHT - (2 * config.INDICATOR_Y_MARGIN_FROM_HUD)
+    indicator_y_pos = config.HUD_HEIGHT + config.INDICATOR_Y_MARGIN_FROM_HUD
+    bar_x = 5
+    scale_surface = pygame.Surface((config.INDICATOR_WIDTH + config.INDICATOR_X_MARGIN + 5, config.SCREEN_HEIGHT), pygame.SRCALPHA)
+    pygame.draw.rect(scale_surface, config.PASTEL_INDICATOR_COLOR, (bar_x, indicator_y_pos, config.INDICATOR_WIDTH, indicator_bar_height))
+
+    ground_line_y = indicator_y_pos + indicator_bar_height
+    pygame.draw.line(scale_surface, config.PASTEL_INDICATOR_GROUND, (bar_x - 5, ground_line_y), (bar_x + config.INDICATOR_WIDTH + 5, ground_line_y), 3)
+    draw_text(scale_surface, "0m", 14, bar_x + config.INDICATOR_WIDTH + 8, ground_line_y - 7, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
+
+    if shown_target_h is not None:
+        target_ratio = min(shown_target_h / max(1, shown_target_h * 1.15), 1.0)
+        target_marker_y_on_bar = indicator_y_pos + indicator_bar_height * (1 - target_ratio)
+        pygame.draw.line(scale_surface, config.PASTEL_GREEN_TARGET, (bar_x - 5, target_marker_y_on_bar), (bar_x + config.INDICATOR_WIDTH + 5, target_marker_y_on_bar), 3)
+        draw_text(scale_surface, f"{shown_target_h}m", 14, bar_x + config.INDICATOR_WIDTH + 8, target_marker_y_on_bar - 7, config.PASTEL_GREEN_TARGET, font_name=config.HUD_FONT_NAME)
+    return scale_surface, (bar_x, 0)
+
 def draw_height_indicator_hud(surface, current_player_height, target_h_for_level, vertical_speed_val, clock_ref, current_game_mode_param):
     indicator_bar_height = config.SCREEN_HEIGHT - config.HUD_HEIGHT - (2 * config.INDICATOR_Y_MARGIN_FROM_HUD)
     indicator_x_pos = config.SCREEN_WIDTH - config.INDICATOR_WIDTH - config.INDICATOR_X_MARGIN
     indicator_y_pos = config.HUD_HEIGHT + config.INDICATOR_Y_MARGIN_FROM_HUD
-    pygame.draw.rect(surface, config.PASTEL_INDICATOR_COLOR, (indicator_x_pos, indicator_y_pos, config.INDICATOR_WIDTH, indicator_bar_height))
 
     max_indicator_height_value = target_h_for_level * 1.15 if current_game_mode_param == config.MODE_FREE_FLY else current_player_height + 500
     if current_game_mode_param == config.MODE_DELIVERY: 
@@ -112,14 +309,8 @@ def draw_height_indicator_hud(surface, current_player_height, target_h_for_level
     max_indicator_height_value = max(1, max_indicator_height_value)
 
     ground_line_y = indicator_y_pos + indicator_bar_height
-    pygame.draw.line(surface, config.PASTEL_INDICATOR_GROUND, (indicator_x_pos - 5, ground_line_y), (indicator_x_pos + config.INDICATOR_WIDTH + 5, ground_line_y), 3)
-    draw_text(surface, "0m", 14, indicator_x_pos + config.INDICATOR_WIDTH + 8, ground_line_y - 7, config.PASTEL_TEXT_COLOR_HUD, font_name=config.HUD_FONT_NAME)
-
-    if current_game_mode_param == config.MODE_FREE_FLY and target_h_for_level > 0:
-        target_ratio = min(target_h_for_level / max_indicator_height_value, 1.0)
-        target_marker_y_on_bar = indicator_y_pos + indicator_bar_height * (1 - target_ratio)
-        pygame.draw.line(surface, config.PASTEL_GREEN_TARGET, (indicator_x_pos - 5, target_marker_y_on_bar), (indicator_x_pos + config.INDICATOR_WIDTH + 5, target_marker_y_on_bar), 3)
-        draw_text(surface, f"{target_h_for_level}m", 14, indicator_x_pos + config.INDICATOR_WIDTH + 8, target_marker_y_on_bar - 7, config.PASTEL_GREEN_TARGET, font_name=config.HUD_FONT_NAME)
+    shown_target_h = target_h_for_level if current_game_mode_param == config.MODE_FREE_FLY and target_h_for_level > 0 else None
+    hud_compositor.overlay_layer(surface, "height_scale", shown_target_h, lambda: _render_height_indicator_scale(shown_target_h), indicator_x_pos, 0)
 
     player_marker_y_on_bar = ground_line_y
     if current_player_height > 0:
@@ -131,7 +322,7 @@ def draw_height_indicator_hud(surface, current_player_height, target_h_for_level
     vsi_arrow_x_center = indicator_x_pos - 10
     vsi_mps = vertical_speed_val * clock_ref.get_fps() if clock_ref.get_fps() > 0 else vertical_speed_val * 60
     vsi_color = config.PASTEL_VSI_CLIMB if vsi_mps > 0.5 else (config.PASTEL_VSI_SINK if vsi_mps < -0.5 else config.PASTEL_TEXT_COLOR_HUD)
-    draw_text(surface, f"{vsi_mps:+.1f}m/s", 14, vsi_text_x , player_marker_y_on_bar - 7, vsi_color, font_name=config.HUD_FONT_NAME)
+    hud_compositor.overlay_text(surface, "vertical_speed", f"{vsi_mps:+.1f}m/s", 14, vsi_text_x , player_marker_y_on_bar - 7, vsi_color)
 
     if abs(vsi_mps) > 0.5:
         arrow_points = []
@@ -148,7 +339,14 @@ def draw_height_indicator_hud(surface, current_player_height, target_h_for_level
     player_height_text_y = player_marker_y_on_bar - 20
     if player_height_text_y < indicator_y_pos + 5:
         player_height_text_y = player_marker_y_on_bar + 15
-    draw_text(surface, f"{int(current_player_height)}m", 14, vsi_text_x, player_height_text_y, config.PASTEL_GOLD, font_name=config.HUD_FONT_NAME)
+    hud_compositor.overlay_text(surface, "indicator_height", f"{int(current_player_height)}m", 14, vsi_text_x, player_height_text_y, config.PASTEL_GOLD)
+
+def draw_terrain_prebake_progress(surface, progress_fraction):
+    bar_x, bar_y, bar_width, bar_height = 10, config.SCREEN_HEIGHT - 24, 160, 10
+    draw_text(surface, f"Terrain {int(progress_fraction * 100)}%", config.HUD_FONT_SIZE_SMALL, bar_x, bar_y - 22, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME)
+    pygame.draw.rect(surface, config.PASTEL_DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+    pygame.draw.rect(surface, config.PASTEL_PLAINS, (bar_x, bar_y, int(bar_width * progress_fraction), bar_height))
+    pygame.draw.rect(surface, config.PASTEL_LIGHT_GRAY, (bar_x, bar_y, bar_width, bar_height), 1)
 
 def draw_dial(surface, center_x, center_y, radius, hand_angle_degrees, hand_color, dial_color=config.PASTEL_GRAY, border_color=config.PASTEL_TEXT_COLOR_HUD, label="N"):
     pygame.draw.circle(surface, dial_color, (center_x, center_y), radius)
@@ -240,13 +438,13 @@ def draw_difficulty_select_screen(surface, selected_option_idx):
         draw_text(surface, desc, 22, config.SCREEN_WIDTH // 2, start_y + i * option_spacing + 35, color, font_name=config.HUD_FONT_NAME, center=True)
     draw_text(surface, "Use UP/DOWN keys, ENTER to confirm", 22, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT * 0.85, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
 
-def draw_mode_select_screen(surface, selected_option_idx):
+def draw_mode_select_screen(surface, selected_option_idx, dogfight_swarm=False):
     surface.fill(config.PASTEL_DARK_GRAY)
     draw_text(surface, "Select Mode", 56, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 4 - 40, config.PASTEL_GOLD, font_name=config.HUD_FONT_NAME, center=True, shadow=True, shadow_color=config.PASTEL_BLACK)
     modes_display = [
         ("Free Fly", "(Explore & Reach Altitude Goals)", config.MODE_FREE_FLY),
         ("Race", "(Fly Through Markers Against AI)", config.MODE_RACE),
-        ("Dogfight", "(Survive Enemy Waves!)", config.MODE_DOGFIGHT),
+        ("Dogfight: Swarm" if dogfight_swarm else "Dogfight", f"(Up to {config.DOGFIGHT_SWARM_MAX_ENEMIES} Enemies in Squadrons!)" if dogfight_swarm else "(Survive Enemy Waves!)", config.MODE_DOGFIGHT),
         ("Delivery", "(Transport Goods Between Runways)", config.MODE_DELIVERY) 
     ]
 
@@ -258,6 +456,8 @@ def draw_mode_select_screen(surface, selected_option_idx):
         y_pos = option_base_y + i * 70
         draw_text(surface, name, 44, config.SCREEN_WIDTH // 2, y_pos, color, font_name=config.HUD_FONT_NAME, center=True, shadow=True, shadow_color=config.PASTEL_BLACK)
         draw_text(surface, desc, 20, config.SCREEN_WIDTH // 2, y_pos + 30, color, font_name=config.HUD_FONT_NAME, center=True)
+    if selected_option_idx == config.MODE_DOGFIGHT:
+        draw_text(surface, "LEFT/RIGHT: Classic or Swarm", 20, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT * 3 // 4 + 50, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
     draw_text(surface, "Use UP/DOWN keys, ENTER to confirm", 22, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT * 3 // 4 + 80, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
 
 def draw_laps_select_screen(surface, selected_lap_idx, lap_choices_list):
@@ -310,10 +510,17 @@ def draw_race_post_options_screen(surface, total_time_seconds, lap_times_list):
     y_offset += 40
     draw_text(surface, "Q: Main Menu", 30, config.SCREEN_WIDTH // 2, y_offset, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
 
-def draw_dogfight_round_complete_screen(surface, round_num, time_taken):
+def format_entity_cost(per_entity_ms):
+    # FrameCostMeter.per_entity_ms() as text; it has nothing to report before a frame with entities
+    return "n/a" if per_entity_ms is None else f"{per_entity_ms * 1000:.0f} us"
+
+def draw_dogfight_round_complete_screen(surface, round_num, time_taken, swarm_frame_meter=None):
     surface.fill(config.PASTEL_DARK_GRAY)
     draw_text(surface, f"Round {round_num} Complete!", 60, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 3, config.PASTEL_GOLD, font_name=config.HUD_FONT_NAME, center=True, shadow=True)
     draw_text(surface, f"Time: {time_taken:.1f}s", 36, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 - 20, config.PASTEL_WHITE, font_name=config.HUD_FONT_NAME, center=True)
+    if swarm_frame_meter is not None and swarm_frame_meter.frames:
+        draw_text(surface, f"Swarm: {swarm_frame_meter.average_ms:.1f} ms/frame with ~{swarm_frame_meter.mean_count():.0f} enemies; per enemy: update {format_entity_cost(swarm_frame_meter.per_entity_ms())}, draw {format_entity_cost(swarm_frame_meter.per_entity_draw_ms())}",
+                  22, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 10, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
     draw_text(surface, "Press N for Next Round", 30, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 40, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
     draw_text(surface, "Press Q for Main Menu", 30, config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 80, config.PASTEL_LIGHT_GRAY, font_name=config.HUD_FONT_NAME, center=True)
 
@@ -0,0 +1,102 @@
+# update_pipeline.py
+# Runs a game tick as a fixed sequence of phases (simulate, then position and rotate, then contrail), each
+# over the entities it applies to. An entity handed to a phase more than once in a tick - say a glider that
+# sits in both its mode group and all_world_sprites - is only processed the first time.
+
+import time
+import config
+
+PHASE_SIMULATE = "simulate" # Steering, physics, animation: everything that changes an entity's state
+PHASE_POSITION = "position" # Screen placement and sprite rotation from the simulated state
+PHASE_CONTRAIL = "contrail" # Trail points laid behind gliders at their final position
+PHASES = (PHASE_SIMULATE, PHASE_POSITION, PHASE_CONTRAIL)
+
+class UpdatePipeline:
+    def __init__(self, phases=PHASES, smoothing=config.UPDATE_TIMING_SMOOTHING):
+        self.phases = phases
+        self.smoothing = smoothing
+        self.processed = {phase: set() for phase in phases} # Entities each phase has already handled this tick
+        self.tick_ms = dict.fromkeys(phases, 0.0)
+        self.average_ms = dict.fromkeys(phases, 0.0) # Exponential moving average over ticks
+        self.processed_counts = dict.fromkeys(phases, 0)
+        self.ticks = 0
+
+    def begin_tick(self):
+        for phase in self.phases:
+            self.processed[phase].clear()
+            self.tick_ms[phase] = 0.0
+
+    def run(self, phase, entities, step):
+        # May be called several times per phase in a tick, once per entity type; the time adds up
+        done = self.processed[phase]
+        start = time.perf_counter()
+        for entity in entities:
+            if entity in done:
+                continue
+            done.add(entity)
+            step(entity)
+        self.tick_ms[phase] += (time.perf_counter() - start) * 1000.0
+
+    def run_batch(self, phase, entities, batch_step):
+        # Like run(), for steps that process all their entities in one call
+        done = self.processed[phase]
+        start = time.perf_counter()
+        batch = [entity for entity in entities if entity not in done]
+        done.update(batch)
+        batch_step(batch)
+        self.tick_ms[phase] += (time.perf_counter() - start) * 1000.0
+
+    def end_tick(self):
+        self.ticks += 1
+        for phase in self.phases:
+            self.processed_counts[phase] = len(self.processed[phase])
+            if self.ticks == 1:
+                self.average_ms[phase] = self.tick_ms[phase]
+            else:
+                self.average_ms[phase] += (self.tick_ms[phase] - self.average_ms[phase]) * self.smoothing
+
+    def tick_total_ms(self):
+        return sum(self.tick_ms.values())
+
+    def timings(self):
+        # phase -> (last tick ms, smoothed ms, entities processed last tick), in phase order
+        return {phase: (self.tick_ms[phase], self.average_ms[phase], self.processed_counts[phase]) for phase in self.phases}
+
+# Steady-state frame time of a stretch of play, and what each entity costs in it: the update work (the pipeline's
+# phases plus hit tests) and the drawing (contrails, sprites, health bars) that grow with the entity count, each
+# divided by that count. Terrain, HUD and the frame's fixed overhead are in the frame time only.
+class FrameCostMeter:
+    def __init__(self, warmup_frames=config.FRAME_COST_WARMUP_FRAMES, smoothing=config.UPDATE_TIMING_SMOOTHING):
+        self.warmup_frames = warmup_frames
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        self.frames_seen = 0
+        self.frames = 0 # Frames counted after the warm-up
+        self.average_ms = 0.0 # Exponential moving average
+        self.sum_count = 0
+        self.sum_update_ms = 0.0
+        self.sum_draw_ms = 0.0
+
+    def add_frame(self, frame_ms, entity_count, update_ms, draw_ms):
+        # update_ms/draw_ms: this frame's time in the updating and drawing that scale with entity_count
+        self.frames_seen += 1
+        if self.frames_seen <= self.warmup_frames:
+            return
+        self.average_ms = frame_ms if self.frames == 0 else self.average_ms + (frame_ms - self.average_ms) * self.smoothing
+        self.frames += 1
+        if entity_count:
+            self.sum_count += entity_count
+            self.sum_update_ms += update_ms
+            self.sum_draw_ms += draw_ms
+
+    def mean_count(self):
+        return self.sum_count / self.frames if self.frames else 0.0
+
+    # Both None until a frame with entities has been counted
+    def per_entity_ms(self):
+        return self.sum_update_ms / self.sum_count if self.sum_count else None
+
+    def per_entity_draw_ms(self):
+        return self.sum_draw_ms / self.sum_count if self.sum_count else None